@@ -1,10 +1,23 @@
-from .dynamic_element import DynamicElement
+from .artifact import ArtifactSink
+from .batch import ActionBatch, BatchResult
+from .deadline import Deadline
+from .dynamic_element import DynamicElement, ElementList
 from .element import Element
 from .enumeration import WebDriverContext, WebDriverPlatform
 from .exceptions import EasyiumException, TimeoutException, ElementTimeoutException, WebDriverTimeoutException, \
     NoSuchElementException, NotPersistException, LatePersistException, InvalidLocatorException, \
-    UnsupportedOperationException
+    UnsupportedOperationException, ExecutionException
+from .executor import WebDriverExecutor
+from .failure import FailureCapture
 from .identifier import Identifier
+from .locator import Locator
+from .polling import PollingStrategy, FixedInterval, ExponentialBackoff
+from .pool import WebDriverPool
+from .retry import RetryPolicy
+from .snapshot import ElementSnapshot
 from .static_element import StaticElement
+from .store import ArtifactStore
+from .tracing import Tracer, TraceEvent, TraceExporter, HistogramExporter, JsonLinesExporter, ChromeTraceExporter
+from .transport import HttpTransport, get_default_http_transport, set_default_http_transport
 from .waiter import Waiter
 from .web_driver import WebDriver, Ie, Firefox, Chrome, Opera, Safari, Edge, Appium
@@ -0,0 +1,5 @@
+from .context import AsyncContext
+from .element import AsyncElement, AsyncStaticElement, AsyncDynamicElement
+from .transport import AsyncTransport
+from .waiter import AsyncWaiter, AsyncElementWaitFor, AsyncWebDriverWaitFor
+from .web_driver import AsyncWebDriver
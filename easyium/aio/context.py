@@ -0,0 +1,264 @@
+import inspect
+from typing import Awaitable, Callable, List, Union, TYPE_CHECKING
+
+from selenium.common.exceptions import StaleElementReferenceException as SeleniumStaleElementReferenceException, \
+    NoSuchElementException as SeleniumNoSuchElementException, InvalidSelectorException as SeleniumInvalidSelectorException, \
+    WebDriverException as SeleniumWebDriverException
+
+from ..enumeration import WebDriverContext
+from ..exceptions import EasyiumException, InvalidLocatorException, NoSuchElementException, TimeoutException, ElementTimeoutException
+from ..locator import Locator
+from ..polling import PollingStrategy
+from ..retry import RetryPolicy
+from .transport import W3C_ELEMENT_KEY
+from .waiter import AsyncWaiter
+
+if TYPE_CHECKING:
+    from .element import AsyncDynamicElement
+    from .web_driver import AsyncWebDriver
+    from ..web_driver import WebDriverInfo
+
+
+def to_w3c_locator(locator: Locator, context: WebDriverContext) -> dict:
+    """
+        Convert the locator to the W3C locator strategy, "id", "name" and "class" are converted to css selector in web context like selenium.
+    """
+    by, value = locator.by, locator.value
+    if context in WebDriverContext._WEB:
+        if by == "id":
+            by, value = "css selector", '[id="%s"]' % value
+        elif by == "name":
+            by, value = "css selector", '[name="%s"]' % value
+        elif by == "class name":
+            by, value = "css selector", ".%s" % value
+    return {"using": by, "value": value}
+
+
+class AsyncContext:
+    def __init__(self):
+        self.__wait_interval = None
+        self.__wait_timeout = None
+        self.__wait_polling = None
+        self.__retry_policy = None
+
+    def get_web_driver(self) -> "AsyncWebDriver":
+        pass
+
+    def get_web_driver_info(self) -> "WebDriverInfo":
+        pass
+
+    async def _element_id(self) -> str:
+        # the element id of this context, None for web driver
+        pass
+
+    async def _refresh(self):
+        pass
+
+    async def persist(self):
+        pass
+
+    def get_wait_interval(self) -> int:
+        """
+            Get the wait interval of this context.
+            If the wait interval for element is not set, return the driver's wait interval.
+
+        :return: the wait interval
+        """
+        if self.__wait_interval is not None:
+            return self.__wait_interval
+        return self.get_web_driver().get_wait_interval()
+
+    def set_wait_interval(self, interval: int):
+        """
+            Set the wait interval of this context.
+
+        :param interval: the new wait interval (in milliseconds)
+        """
+        self.__wait_interval = interval
+
+    def get_wait_timeout(self) -> int:
+        """
+            Get the wait timeout of this context.
+            If the wait timeout for element is not set, return the driver's wait timeout.
+
+        :return: the wait timeout
+        """
+        if self.__wait_timeout is not None:
+            return self.__wait_timeout
+        return self.get_web_driver().get_wait_timeout()
+
+    def set_wait_timeout(self, timeout: int):
+        """
+            Set the wait timeout of this context.
+
+        :param timeout: the new wait timeout (in milliseconds)
+        """
+        self.__wait_timeout = timeout
+
+    def get_wait_polling(self) -> PollingStrategy:
+        """
+            Get the wait polling strategy of this context.
+            If the wait polling strategy for element is not set, return the driver's wait polling strategy.
+
+        :return: the wait polling strategy
+        """
+        if self.__wait_polling is not None:
+            return self.__wait_polling
+        return self.get_web_driver().get_wait_polling()
+
+    def set_wait_polling(self, polling: PollingStrategy):
+        """
+            Set the wait polling strategy of this context.
+
+        :param polling: the new wait polling strategy, e.g., FixedInterval() or ExponentialBackoff()
+        """
+        self.__wait_polling = polling
+
+    def get_retry_policy(self) -> RetryPolicy:
+        """
+            Get the retry policy of this context, the element operations recover from the errors by it.
+            If the retry policy for element is not set, return the driver's retry policy.
+
+        :return: the retry policy
+        """
+        if self.__retry_policy is not None:
+            return self.__retry_policy
+        return self.get_web_driver().get_retry_policy()
+
+    def set_retry_policy(self, retry_policy: RetryPolicy):
+        """
+            Set the retry policy of this context.
+
+        :param retry_policy: the new retry policy
+        """
+        self.__retry_policy = retry_policy
+
+    def waiter(self, interval: int = None, timeout: int = None, polling: PollingStrategy = None) -> AsyncWaiter:
+        """
+            Get an AsyncWaiter instance.
+
+        :param interval: the wait interval (in milliseconds). If None, use context's wait interval.
+        :param timeout: the wait timeout (in milliseconds). If None, use context's wait interval.
+        :param polling: the wait polling strategy. If None, use context's wait polling strategy.
+        """
+        _interval = self.get_wait_interval() if interval is None else interval
+        _timeout = self.get_wait_timeout() if timeout is None else timeout
+        _polling = self.get_wait_polling() if polling is None else polling
+        return AsyncWaiter(_interval, _timeout, _polling)
+
+    async def _find_element_ids(self, locator: Locator, first_only: bool) -> List[str]:
+        element_id = await self._element_id()
+        prefix = "/element" if element_id is None else "/element/%s/element" % element_id
+        w3c_locator = to_w3c_locator(locator, self.get_web_driver_info().context)
+        try:
+            if first_only:
+                return [(await self.get_web_driver()._execute("POST", prefix, w3c_locator))[W3C_ELEMENT_KEY]]
+            return [value[W3C_ELEMENT_KEY] for value in await self.get_web_driver()._execute("POST", prefix + "s", w3c_locator)]
+        except SeleniumInvalidSelectorException:
+            raise InvalidLocatorException("The value <%s> of locator <%s> is not a valid expression." % (locator.value, locator), self)
+
+    async def _find_first_element_id(self, locator: Locator) -> str:
+        try:
+            return (await self._find_element_ids(locator, True))[0]
+        except SeleniumStaleElementReferenceException:
+            self.get_web_driver()._trace_retry("stale", self)
+            await self._refresh()
+            return (await self._find_element_ids(locator, True))[0]
+
+    async def _find_element_id(self, locator: Locator) -> str:
+        try:
+            return await self._find_first_element_id(locator)
+        except SeleniumNoSuchElementException:
+            raise NoSuchElementException("Cannot find element by <%s> under:" % locator, self)
+        except SeleniumWebDriverException as wde:
+            raise EasyiumException(wde.msg, self)
+
+    async def find_element(self, locator: Union[str, Locator], condition: Callable[["AsyncDynamicElement"], bool] = lambda element: True,
+                           identifier: Callable[["AsyncDynamicElement"], Awaitable[str]] = None) -> "AsyncDynamicElement":
+        """
+            Find an AsyncDynamicElement under this context.
+            Note: if no element is found, None will be returned.
+
+        :param locator: the locator (relative to this context) of the element to be found, see AsyncStaticElement.
+        :param condition: end finding element when the found element match the condition function, it can be an async function.
+        :param identifier: the async function to generate the locator of the found element when it is persisted, see AsyncDynamicElement.
+        :return: the AsyncDynamicElement found by locator
+        """
+        # import the AsyncDynamicElement here to avoid cyclic dependency
+        from .element import AsyncDynamicElement
+
+        locator = Locator.of(locator)
+        element = {"inner": None}
+
+        async def _find_element():
+            try:
+                try:
+                    element["inner"] = AsyncDynamicElement(self, await self._find_first_element_id(locator), locator, identifier)
+                except NoSuchElementException:
+                    # Only AsyncElement can reach here
+                    await self.wait_for().exists()
+                    element["inner"] = AsyncDynamicElement(self, await self._find_first_element_id(locator), locator, identifier)
+            except SeleniumNoSuchElementException:
+                element["inner"] = None
+            except SeleniumWebDriverException as wde:
+                raise EasyiumException(wde.msg, self)
+            result = condition(element["inner"])
+            return await result if inspect.isawaitable(result) else result
+
+        try:
+            await self.waiter().wait_for(_find_element)
+        except TimeoutException as e:
+            if e.__class__ == ElementTimeoutException:
+                # raised by self.wait_for().exists() in _find_element()
+                raise
+            raise TimeoutException("Timed out waiting for the found element by <%s> under:\n%s\nmatches condition <%s>." % (locator, self, condition.__name__))
+
+        return element["inner"]
+
+    async def find_elements(self, locator: Union[str, Locator], condition: Callable[[List["AsyncDynamicElement"]], bool] = lambda elements: True,
+                            identifier: Callable[["AsyncDynamicElement"], Awaitable[str]] = None) -> List["AsyncDynamicElement"]:
+        """
+            Find AsyncDynamicElement list under this context.
+            Note: if no elements is found, empty list will be returned.
+
+        :param locator: the locator (relative to this context) of the elements to be found, see AsyncStaticElement.
+        :param condition: end finding elements when the found element list match the condition function, it can be an async function.
+        :param identifier: the async function to generate the locators of the found elements when they are persisted, see AsyncDynamicElement.
+        :return: the AsyncDynamicElement list found by locator
+        """
+        # import the AsyncDynamicElement here to avoid cyclic dependency
+        from .element import AsyncDynamicElement
+
+        locator = Locator.of(locator)
+        elements = {"inner": []}
+
+        async def _find_element_ids():
+            try:
+                return await self._find_element_ids(locator, False)
+            except SeleniumStaleElementReferenceException:
+                await self._refresh()
+                return await self._find_element_ids(locator, False)
+
+        async def _find_elements():
+            try:
+                try:
+                    element_ids = await _find_element_ids()
+                except NoSuchElementException:
+                    # Only AsyncElement can reach here
+                    await self.wait_for().exists()
+                    element_ids = await _find_element_ids()
+            except SeleniumWebDriverException as wde:
+                raise EasyiumException(wde.msg, self)
+            elements["inner"] = [AsyncDynamicElement(self, element_id, locator, identifier) for element_id in element_ids]
+            result = condition(elements["inner"])
+            return await result if inspect.isawaitable(result) else result
+
+        try:
+            await self.waiter().wait_for(_find_elements)
+        except TimeoutException as e:
+            if e.__class__ == ElementTimeoutException:
+                # raised by self.wait_for().exists() in _find_elements()
+                raise
+            raise TimeoutException("Timed out waiting for the found element list by <%s> under:\n%s\nmatches condition <%s>." % (locator, self, condition.__name__))
+
+        return elements["inner"]
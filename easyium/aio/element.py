@@ -0,0 +1,339 @@
+import asyncio
+import base64
+from typing import Awaitable, Callable, TypeVar, Union, TYPE_CHECKING
+
+from selenium.common.exceptions import WebDriverException as SeleniumWebDriverException, StaleElementReferenceException as SeleniumStaleElementReferenceException
+
+from ..exceptions import EasyiumException, NoSuchElementException, NotPersistException, LatePersistException
+from ..locator import Locator
+from ..retry import transport_errors
+from .context import AsyncContext
+from .waiter import AsyncElementWaitFor
+
+if TYPE_CHECKING:
+    from .web_driver import AsyncWebDriver
+    from ..web_driver import WebDriverInfo
+
+T = TypeVar("T")
+
+
+class AsyncElement(AsyncContext):
+    def __init__(self, parent: AsyncContext):
+        AsyncContext.__init__(self)
+        self.__parent = parent
+        self._inner_element_id = None
+
+    def get_parent(self) -> AsyncContext:
+        """
+            Get the parent context of this element.
+        """
+        return self.__parent
+
+    def get_web_driver(self) -> "AsyncWebDriver":
+        return self.__parent.get_web_driver()
+
+    def get_web_driver_info(self) -> "WebDriverInfo":
+        return self.__parent.get_web_driver_info()
+
+    async def _element_id(self) -> str:
+        if self._inner_element_id is None:
+            await self._refresh()
+        return self._inner_element_id
+
+    async def _run(self, operation: Callable[[], Awaitable[T]], until: str = "visible", idempotent: bool = True) -> T:
+        # the same recovery as RetryPolicy.run(), the waits and backoffs sleep in the event loop
+        retry_policy = self.get_retry_policy()
+        retry_policy._increase("calls")
+        stale_retries = wait_retries = transport_retries = 0
+        while True:
+            try:
+                return await operation()
+            except (SeleniumWebDriverException, NoSuchElementException) + transport_errors as e:
+                error, kind = e, retry_policy.classify(e)
+
+            if kind is None:
+                retry_policy._increase("failures")
+                raise EasyiumException(error.msg, self)
+
+            if kind == "stale":
+                if stale_retries >= retry_policy.get_stale_retries():
+                    retry_policy._increase("failures")
+                    raise EasyiumException(error.msg, self)
+                stale_retries += 1
+                retry_policy._increase("stale_retries")
+                self.get_web_driver()._trace_retry("stale", self)
+                try:
+                    await self._refresh()
+                    continue
+                except NoSuchElementException as e:
+                    error, kind = e, "missing"
+
+            if kind in ("missing", "not_interactable"):
+                if wait_retries >= retry_policy.get_wait_retries():
+                    retry_policy._increase("failures")
+                    raise error if isinstance(error, EasyiumException) else EasyiumException(error.msg, self)
+                wait_retries += 1
+                retry_policy._increase("wait_retries")
+                self.get_web_driver()._trace_retry(kind, self)
+                if kind == "not_interactable":
+                    await self.wait_for().actionable()
+                elif kind == "missing" and until == "exists":
+                    await self.wait_for().exists()
+                else:
+                    await self.wait_for().visible()
+                continue
+
+            # kind == "transport"
+            if not idempotent or transport_retries >= retry_policy.get_transport_retries():
+                retry_policy._increase("failures")
+                raise error
+            backoff = retry_policy.get_transport_backoff() * 2 ** transport_retries
+            transport_retries += 1
+            retry_policy._increase("transport_retries")
+            self.get_web_driver()._trace_retry("transport", self)
+            await asyncio.sleep(backoff / 1000.0)
+
+    async def _command(self, method: str, path: str, params: dict = None, until: str = "exists", idempotent: bool = True) -> any:
+        async def _execute_command():
+            return await self.get_web_driver()._execute(method, "/element/%s%s" % (await self._element_id(), path), params)
+
+        return await self._run(_execute_command, until, idempotent)
+
+    def wait_for(self, interval: int = None, timeout: int = None, polling=None) -> AsyncElementWaitFor:
+        """
+            Get an AsyncElementWaitFor instance.
+
+        :param interval: the wait interval (in milliseconds). If None, use element's wait interval.
+        :param timeout: the wait timeout (in milliseconds). If None, use element's wait interval.
+        :param polling: the wait polling strategy. If None, use element's wait polling strategy.
+        """
+        _interval = self.get_wait_interval() if interval is None else interval
+        _timeout = self.get_wait_timeout() if timeout is None else timeout
+        _polling = self.get_wait_polling() if polling is None else polling
+        return AsyncElementWaitFor(self, _interval, _timeout, _polling)
+
+    async def click(self):
+        """
+            Clicks this element.
+        """
+        await self._command("POST", "/click", until="visible", idempotent=False)
+
+    async def clear(self):
+        """
+            Clears the text if it's a text entry element.
+        """
+        await self._command("POST", "/clear", until="visible")
+
+    async def send_keys(self, *value: str):
+        """
+            Simulates typing into this element.
+
+        :param value: A string for typing, or setting form fields.
+        """
+        text = "".join(value)
+        await self._command("POST", "/value", {"text": text, "value": list(text)}, until="visible", idempotent=False)
+
+    async def get_text(self) -> str:
+        """
+            Gets the text of this element(including the text of its children).
+        """
+        return await self._command("GET", "/text")
+
+    async def get_tag_name(self) -> str:
+        """
+            Gets this element's tagName property.
+        """
+        return await self._command("GET", "/name")
+
+    async def get_attribute(self, name: str) -> str:
+        """
+            Gets the given attribute of this element, it is the W3C attribute command.
+
+        :param name: name of the attribute to retrieve.
+        """
+        return await self._command("GET", "/attribute/%s" % name)
+
+    async def get_property(self, name: str) -> any:
+        """
+            Gets the given property of this element.
+
+        :param name: Name of the property to retrieve.
+        """
+        return await self._command("GET", "/property/%s" % name)
+
+    async def get_value(self) -> str:
+        """
+            Gets the value of this element.
+        """
+        return await self.get_property("value")
+
+    async def get_css_value(self, property_name: str) -> str:
+        """
+            Gets the value of a CSS property.
+
+        :param property_name: the property name
+        """
+        return await self._command("GET", "/css/%s" % property_name)
+
+    async def get_rect(self) -> dict:
+        """
+            Gets the size and location of this element.
+
+        :return: the rect dict, {'x': x, 'y': y, 'width': width, 'height': height}
+        """
+        return await self._command("GET", "/rect")
+
+    async def get_location(self) -> dict:
+        """
+            Gets the location for the top-left corner of this element.
+
+        :return: the location dict, {'x': x, 'y': y}
+        """
+        rect = await self.get_rect()
+        return {"x": rect["x"], "y": rect["y"]}
+
+    async def get_size(self) -> dict:
+        """
+            Gets the size of this element.
+
+        :return: the size dict, {'width': width, 'height': height}
+        """
+        rect = await self.get_rect()
+        return {"width": rect["width"], "height": rect["height"]}
+
+    async def is_enabled(self) -> bool:
+        """
+            Return whether this element is enabled or not.
+        """
+        return await self._command("GET", "/enabled")
+
+    async def is_selected(self) -> bool:
+        """
+            Return whether this element is selected or not.
+        """
+        return await self._command("GET", "/selected")
+
+    async def is_displayed(self) -> bool:
+        """
+            Return whether this element is displayed or not.
+        """
+        try:
+            try:
+                return await self.get_web_driver()._execute("GET", "/element/%s/displayed" % await self._element_id())
+            except SeleniumStaleElementReferenceException:
+                self.get_web_driver()._trace_retry("stale", self)
+                await self._refresh()
+                return await self.get_web_driver()._execute("GET", "/element/%s/displayed" % await self._element_id())
+        except NoSuchElementException:
+            return False
+        except SeleniumWebDriverException as wde:
+            raise EasyiumException(wde.msg, self)
+
+    async def exists(self) -> bool:
+        """
+            Return whether this element is existing or not.
+        """
+        try:
+            try:
+                await self.get_web_driver()._execute("GET", "/element/%s/name" % await self._element_id())
+                return True
+            except SeleniumStaleElementReferenceException:
+                self.get_web_driver()._trace_retry("stale", self)
+                await self._refresh()
+                return True
+        except NoSuchElementException:
+            return False
+        except SeleniumWebDriverException as wde:
+            raise EasyiumException(wde.msg, self)
+
+    async def scroll_into_view(self):
+        """
+            Scroll this element into view.
+        """
+        await self.get_web_driver().execute_script("arguments[0].scrollIntoView();", self)
+
+    async def get_screenshot_as_base64(self) -> str:
+        """
+            Gets the screenshot of the current element as a base64 encoded string.
+        """
+        return await self._command("GET", "/screenshot")
+
+    async def get_screenshot_as_png(self) -> bytes:
+        """
+            Gets the screenshot of the current element as a binary data.
+        """
+        return base64.b64decode((await self.get_screenshot_as_base64()).encode("ascii"))
+
+
+class AsyncStaticElement(AsyncElement):
+    def __init__(self, parent: AsyncContext, locator: Union[str, Locator]):
+        """
+            Creates a new instance of the AsyncStaticElement, it is the awaitable version of StaticElement.
+
+        :param parent: the parent context
+        :param locator: the locator of this element (relative to parent context), see StaticElement.
+
+        :Usage:
+            await AsyncStaticElement(driver, "name=q").send_keys("easyium")
+        """
+        AsyncElement.__init__(self, parent)
+        self._locator = Locator.of(locator)
+
+    async def _refresh(self):
+        self._inner_element_id = None
+        self._inner_element_id = await self.get_parent()._find_element_id(self._locator)
+
+    async def persist(self):
+        await self.get_parent().persist()
+
+    def __str__(self):
+        return "%s\n|- AsyncStaticElement <ElementId: %s><Locator: %s>" % (self.get_parent(), self._inner_element_id, self._locator)
+
+
+class AsyncDynamicElement(AsyncElement):
+    def __init__(self, parent: AsyncContext, element_id: str, found_by: Locator = None,
+                 identifier: Callable[["AsyncDynamicElement"], Awaitable[str]] = None):
+        """
+            Creates a new instance of the AsyncDynamicElement, it is found by AsyncContext.find_element() or find_elements().
+            Like DynamicElement, it cannot auto-refresh until persist() is invoked, then it is refreshed by the generated locator.
+
+        :param parent: the parent context
+        :param element_id: the W3C element id
+        :param found_by: the locator used to find this element, None if it is returned by a script
+        :param identifier: the async function to generate the locator of this element. If None, use its "id" attribute.
+        """
+        AsyncElement.__init__(self, parent)
+        self._inner_element_id = element_id
+        self._locator = None
+        self.__found_by = found_by
+        self.__identifier = identify_by_id if identifier is None else identifier
+
+    async def _refresh(self):
+        if self._locator is None:
+            raise NotPersistException("persist() was not invoked so this Element cannot auto-refresh.", self)
+        self._inner_element_id = None
+        self._inner_element_id = await self.get_parent()._find_element_id(self._locator)
+
+    async def persist(self):
+        """
+            Generate the locator of this element by identifier, so this element can auto-refresh.
+        """
+        await self.get_parent().persist()
+
+        try:
+            if self._locator is None:
+                self._locator = Locator.of(await self.__identifier(self))
+        except NotPersistException:
+            raise LatePersistException(
+                "Trying to persist() a stale element. Try invoking persist() earlier.", self)
+
+    def __str__(self):
+        return "%s\n|- AsyncDynamicElement <ElementId: %s><Locator: %s><FoundBy: %s>" % (
+            self.get_parent(), self._inner_element_id, self._locator, self.__found_by)
+
+
+async def identify_by_id(element: AsyncElement) -> str:
+    """
+        The default identifier of AsyncDynamicElement, it generates the locator by the "id" attribute, like Identifier.id.
+    """
+    return "id=" + await element.get_attribute("id")
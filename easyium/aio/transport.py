@@ -0,0 +1,136 @@
+import asyncio
+import json
+import ssl
+from typing import List, Tuple
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+
+# the key of element reference in W3C protocol
+W3C_ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+_error_handler = ErrorHandler()
+
+
+class AsyncTransport:
+    def __init__(self, url: str, timeout: int = 120000, max_connections: int = 16):
+        """
+            Create a non-blocking HTTP/1.1 transport to the W3C endpoint of web driver server (e.g., "http://127.0.0.1:4444/wd/hub").
+            The connections are kept alive and reused, the sessions sharing this transport share the connections.
+
+        :param url: the url of web driver server
+        :param timeout: the timeout (in milliseconds) of a request
+        :param max_connections: the max number of concurrent connections, the other requests wait for an idle connection
+        """
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https"):
+            raise ValueError("The url <%s> is not a http or https url." % url)
+        self.__url = url
+        self.__host = parsed.hostname
+        self.__port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        self.__ssl = ssl.create_default_context() if parsed.scheme == "https" else None
+        self.__base_path = parsed.path.rstrip("/")
+        self.__timeout = timeout
+        self.__max_connections = max_connections
+        self.__idle_connections = []  # type: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]
+        self.__slots = None
+
+    def get_url(self) -> str:
+        return self.__url
+
+    async def execute(self, method: str, path: str, params: dict = None) -> any:
+        """
+            Send a command to the web driver server.
+
+        :param method: the http method, "GET", "POST" or "DELETE"
+        :param path: the path of command, e.g., "/session/{session id}/url"
+        :param params: the parameters of command, they are sent as json body
+        :return: the "value" of response
+        """
+        body = b"" if params is None and method != "POST" else json.dumps({} if params is None else params).encode("utf-8")
+        if self.__slots is None:
+            # create it in the running loop
+            self.__slots = asyncio.Semaphore(self.__max_connections)
+        async with self.__slots:
+            status, data = await asyncio.wait_for(self.__request(method, self.__base_path + path, body), self.__timeout / 1000.0)
+
+        if status >= 400 or (isinstance(data, dict) and isinstance(data.get("value"), dict) and "error" in data["value"]):
+            if not isinstance(data, dict):
+                # not a W3C error, e.g., an html error page of a proxy
+                raise WebDriverException("HTTP %s: %s" % (status, "" if data is None else data))
+            # map the W3C error to the same exception as selenium
+            _error_handler.check_response({"status": status if status >= 400 else 500, "value": json.dumps(data)})
+        return data.get("value") if isinstance(data, dict) else data
+
+    async def __request(self, method: str, path: str, body: bytes) -> Tuple[int, any]:
+        while True:
+            reused = bool(self.__idle_connections)
+            reader, writer = self.__idle_connections.pop() if reused else \
+                await asyncio.open_connection(self.__host, self.__port, ssl=self.__ssl)
+            try:
+                writer.write(("%s %s HTTP/1.1\r\nHost: %s:%s\r\nAccept: application/json\r\nAccept-Encoding: identity\r\n"
+                              "Content-Type: application/json;charset=UTF-8\r\nContent-Length: %s\r\nConnection: keep-alive\r\n\r\n" % (
+                                  method, path, self.__host, self.__port, len(body))).encode("latin-1") + body)
+                await writer.drain()
+                status, headers, data = await self.__read_response(reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if reused:
+                    # the idle connection is closed by server, retry with another connection
+                    continue
+                raise
+            except BaseException:
+                # the response is not consumed, the connection cannot be reused
+                writer.close()
+                raise
+
+            if headers.get("connection", "").lower() == "close":
+                writer.close()
+            else:
+                self.__idle_connections.append((reader, writer))
+            try:
+                return status, json.loads(data.decode("utf-8")) if data else None
+            except ValueError:
+                return status, data.decode("utf-8", "replace")
+
+    @staticmethod
+    async def __read_response(reader: asyncio.StreamReader) -> Tuple[int, dict, bytes]:
+        status_line = await reader.readuntil(b"\r\n")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                if size == 0:
+                    # skip the trailers
+                    while await reader.readuntil(b"\r\n") != b"\r\n":
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            return status, headers, b"".join(chunks)
+        if "content-length" not in headers:
+            # the body ends with the connection
+            headers["connection"] = "close"
+            return status, headers, await reader.read()
+        return status, headers, await reader.readexactly(int(headers["content-length"]))
+
+    async def close(self):
+        """
+            Close the idle connections.
+        """
+        idle_connections, self.__idle_connections = self.__idle_connections, []
+        for _, writer in idle_connections:
+            writer.close()
+
+    def __str__(self):
+        return "AsyncTransport <Url: %s><MaxConnections: %s>" % (self.__url, self.__max_connections)
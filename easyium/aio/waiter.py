@@ -0,0 +1,182 @@
+import asyncio
+from typing import Awaitable, Callable, TYPE_CHECKING
+
+from ..deadline import Deadline
+from ..exceptions import TimeoutException, ElementTimeoutException, WebDriverTimeoutException
+from ..polling import PollingStrategy, FixedInterval
+
+if TYPE_CHECKING:
+    from .element import AsyncElement
+    from .web_driver import AsyncWebDriver
+
+
+class AsyncWaiter:
+    def __init__(self, interval: int = 1000, timeout: int = 30000, polling: PollingStrategy = None, deadline: Deadline = None):
+        """
+            Create an AsyncWaiter instance, it is the awaitable version of Waiter.
+            The active Deadline of with statement is not applied, because it is bound to thread instead of task, pass the deadline explicitly.
+
+        :param interval: the wait interval (in milliseconds)
+        :param timeout: the wait timeout (in milliseconds), it is ignored if deadline is given.
+        :param polling: the polling strategy. If None, sleep a fixed interval between two polls.
+        :param deadline: the deadline shared with other waits. If None, start a new deadline by timeout when waiting.
+        """
+        self.__interval = interval
+        self.__timeout = timeout
+        self.__polling = FixedInterval() if polling is None else polling
+        self.__deadline = deadline
+
+    async def wait_for(self, condition_function: Callable[..., Awaitable[bool]], *function_args, **function_kwargs):
+        """
+            Wait for the condition, the event loop runs the other tasks when sleeping.
+
+        :param condition_function: the async condition function
+        :param function_args: the args for condition_function
+        :param function_kwargs: the kwargs for condition_function
+        """
+        deadline = Deadline(self.__timeout) if self.__deadline is None else self.__deadline
+
+        if await condition_function(*function_args, **function_kwargs):
+            return
+
+        for delay in self.__polling.intervals(self.__interval):
+            rest_timeout = deadline.get_rest_timeout()
+            if rest_timeout < 0:
+                break
+            await asyncio.sleep(min(delay, rest_timeout) / 1000.0)
+            if await condition_function(*function_args, **function_kwargs):
+                return
+
+        raise TimeoutException("Timed out waiting for <%s>." % condition_function.__name__)
+
+
+class AsyncElementWaitFor:
+    def __init__(self, element: "AsyncElement", interval: int, timeout: int, polling: PollingStrategy = None):
+        self.__element = element
+        self.__interval = interval
+        self.__timeout = timeout
+        self.__polling = polling
+        self.__desired_occurrence = True
+
+    async def __wait_for(self, condition: Callable[[], Awaitable[bool]], description: str, deadline: Deadline = None):
+        async def is_element_condition_occurred():
+            return await condition() == self.__desired_occurrence
+
+        try:
+            await AsyncWaiter(self.__interval, self.__timeout, self.__polling, deadline).wait_for(is_element_condition_occurred)
+        except TimeoutException:
+            raise ElementTimeoutException(
+                "Timed out waiting for <%s> to be <%s>." % (description, self.__desired_occurrence))
+
+    def not_(self) -> "AsyncElementWaitFor":
+        """
+            Wait for not.
+        """
+        self.__desired_occurrence = not self.__desired_occurrence
+        return self
+
+    async def exists(self):
+        """
+            Wait for this element exists.
+        """
+        await self.__wait_for(self.__element.exists, "ElementExistence [\n%s\n]" % self.__element)
+
+    async def visible(self):
+        """
+            Wait for this element visible.
+        """
+        await self.__wait_for(self.__element.is_displayed, "ElementVisible [\n%s\n]" % self.__element)
+
+    async def actionable(self):
+        """
+            Wait for this element actionable, it is visible and enabled.
+        """
+        async def _actionable():
+            return await self.__element.is_displayed() and await self.__element.is_enabled()
+
+        await self.__wait_for(_actionable, "ElementActionable [\n%s\n]" % self.__element)
+
+    async def text_equals(self, text: str):
+        """
+            Wait for this element's text equals the expected text.
+
+        :param text: the expected text
+        """
+        deadline = Deadline(self.__timeout)
+        await AsyncElementWaitFor(self.__element, self.__interval, self.__timeout, self.__polling)._exists_before(deadline)
+
+        async def _text_equals():
+            return await self.__element.get_text() == text
+
+        await self.__wait_for(_text_equals, "ElementTextEquals [element: \n%s\n][text: %s]" % (self.__element, text), deadline)
+
+    async def attribute_equals(self, attribute: str, value: str):
+        """
+            Wait for this element's attribute value equals the expected value.
+
+        :param attribute: the attribute of this element.
+        :param value: the expected value.
+        """
+        deadline = Deadline(self.__timeout)
+        await AsyncElementWaitFor(self.__element, self.__interval, self.__timeout, self.__polling)._exists_before(deadline)
+
+        async def _attribute_equals():
+            return await self.__element.get_attribute(attribute) == value
+
+        await self.__wait_for(_attribute_equals, "ElementAttributeEquals [element: \n%s\n][attribute: %s][value: %s]" % (
+            self.__element, attribute, value), deadline)
+
+    async def _exists_before(self, deadline: Deadline):
+        await self.__wait_for(self.__element.exists, "ElementExistence [\n%s\n]" % self.__element, deadline)
+
+
+class AsyncWebDriverWaitFor:
+    def __init__(self, web_driver: "AsyncWebDriver", interval: int, timeout: int, polling: PollingStrategy = None):
+        self.__web_driver = web_driver
+        self.__waiter = AsyncWaiter(interval, timeout, polling)
+        self.__desired_occurrence = True
+
+    async def __wait_for(self, condition: Callable[[], Awaitable[bool]], description: str):
+        async def is_web_driver_condition_occurred():
+            return await condition() == self.__desired_occurrence
+
+        try:
+            await self.__waiter.wait_for(is_web_driver_condition_occurred)
+        except TimeoutException:
+            raise WebDriverTimeoutException(
+                "Timed out waiting for <%s> to be <%s>." % (description, self.__desired_occurrence))
+
+    def not_(self) -> "AsyncWebDriverWaitFor":
+        """
+            Wait for not.
+        """
+        self.__desired_occurrence = not self.__desired_occurrence
+        return self
+
+    async def url_equals(self, url: str):
+        """
+            Wait for the current url equals the expected url.
+
+        :param url: the expected url
+        """
+        async def _url_equals():
+            return await self.__web_driver.get_current_url() == url
+
+        await self.__wait_for(_url_equals, "URLEquals [webdriver: \n%s\n][url: %s]" % (self.__web_driver, url))
+
+    async def text_present(self, text: str):
+        """
+            Wait for the text present in the page source.
+
+        :param text: the expected text
+        """
+        async def _text_present():
+            return text in await self.__web_driver.get_page_source()
+
+        await self.__wait_for(_text_present, "TextPresent [webdriver: \n%s\n][text: %s]" % (self.__web_driver, text))
+
+    async def alert_present(self):
+        """
+            Wait for the alert present.
+        """
+        await self.__wait_for(self.__web_driver.is_alert_present, "AlertPresent [\n%s\n]" % self.__web_driver)
@@ -0,0 +1,338 @@
+import base64
+import re
+import time
+from typing import List, Union
+
+from selenium.common.exceptions import NoAlertPresentException as SeleniumNoAlertPresentException
+
+from ..enumeration import WebDriverContext, WebDriverPlatform
+from ..polling import FixedInterval, PollingStrategy
+from ..retry import RetryPolicy
+from ..tracing import Tracer
+from ..web_driver import WebDriverInfo
+from .context import AsyncContext
+from .element import AsyncDynamicElement, AsyncElement
+from .transport import AsyncTransport, W3C_ELEMENT_KEY
+from .waiter import AsyncWebDriverWaitFor
+
+
+class AsyncWebDriver(AsyncContext):
+    def __init__(self, transport: AsyncTransport, session_id: str, web_driver_info: WebDriverInfo, capabilities: dict = None):
+        """
+            Create an AsyncWebDriver for an existing session, it is the awaitable version of WebDriver.
+            Usually you get one by AsyncWebDriver.create().
+
+        :param transport: the transport to the web driver server
+        :param session_id: the id of the session
+        :param web_driver_info: the web driver info
+        :param capabilities: the capabilities returned by the web driver server
+        """
+        AsyncContext.__init__(self)
+        self.__transport = transport
+        self.__session_id = session_id
+        self.__web_driver_info = web_driver_info
+        self.__capabilities = {} if capabilities is None else capabilities
+
+        # set default wait interval, timeout, polling strategy and retry policy
+        self.set_wait_interval(1000)
+        self.set_wait_timeout(30000)
+        self.set_wait_polling(FixedInterval())
+        self.set_retry_policy(RetryPolicy())
+        self.__tracer = None
+
+    @staticmethod
+    async def create(transport: Union[str, AsyncTransport], capabilities: dict, platform: WebDriverPlatform = WebDriverPlatform.PC,
+                     context: WebDriverContext = WebDriverContext.CHROME) -> "AsyncWebDriver":
+        """
+            Start a new session on the web driver server.
+            The sessions created with the same AsyncTransport share its keep-alive connections.
+
+        :param transport: the AsyncTransport, or the url of web driver server
+        :param capabilities: the W3C capabilities, e.g., {"browserName": "chrome"}
+        :param platform: the platform of the session
+        :param context: the context of the session
+        :return: the AsyncWebDriver
+
+        :Usage:
+            transport = AsyncTransport("http://127.0.0.1:4444/wd/hub")
+            drivers = await asyncio.gather(*[AsyncWebDriver.create(transport, {"browserName": "chrome"}) for _ in range(10)])
+        """
+        _transport = AsyncTransport(transport) if isinstance(transport, str) else transport
+        value = await _transport.execute("POST", "/session", {"capabilities": {"firstMatch": [{}], "alwaysMatch": capabilities}})
+        return AsyncWebDriver(_transport, value["sessionId"], WebDriverInfo(platform, context), value.get("capabilities"))
+
+    async def _execute(self, method: str, path: str, params: dict = None) -> any:
+        if self.__tracer is None:
+            return await self.__transport.execute(method, "/session/%s%s" % (self.__session_id, path), params)
+
+        start, started = time.time(), time.monotonic()
+        error = None
+        try:
+            return await self.__transport.execute(method, "/session/%s%s" % (self.__session_id, path), params)
+        except BaseException as e:
+            error = e.__class__.__name__
+            raise
+        finally:
+            # the element ids are removed from the command name, so the same commands share a histogram
+            self.__tracer._record_command(self.__session_id, "%s %s" % (method, re.sub(r"/element/[^/]+", "/element/{id}", path)),
+                                          params, start, (time.monotonic() - started) * 1000.0, error)
+
+    def get_tracer(self) -> Tracer:
+        """
+            Get the tracer of this web driver.
+
+        :return: the tracer, None if it is not set
+        """
+        return self.__tracer
+
+    def set_tracer(self, tracer: Tracer):
+        """
+            Set the tracer of this web driver, it is disabled by default.
+            If it is set, every command sent to the web driver server is recorded with its wall time, the easyium method and the locator,
+            so are the retries of the element operations.
+
+        :param tracer: the tracer, None to disable it
+        """
+        self.__tracer = tracer
+
+    def _trace_retry(self, kind: str, context: AsyncContext):
+        if self.__tracer is not None:
+            self.__tracer._record_retry(kind, context)
+
+    async def _element_id(self) -> str:
+        return None
+
+    async def _refresh(self):
+        pass
+
+    def get_web_driver(self) -> "AsyncWebDriver":
+        """
+            Get self.
+
+        :return: self
+        """
+        return self
+
+    def get_web_driver_info(self) -> WebDriverInfo:
+        """
+            Get current info of this web driver.
+
+        :return: the web driver info
+        """
+        return self.__web_driver_info
+
+    def get_session_id(self) -> str:
+        """
+            Get the id of the session.
+        """
+        return self.__session_id
+
+    def get_capabilities(self) -> dict:
+        """
+            Get the capabilities returned by the web driver server.
+        """
+        return self.__capabilities
+
+    def wait_for(self, interval: int = None, timeout: int = None, polling: PollingStrategy = None) -> AsyncWebDriverWaitFor:
+        """
+            Get an AsyncWebDriverWaitFor instance.
+
+        :param interval: the wait interval (in milliseconds). If None, use driver's wait interval.
+        :param timeout: the wait timeout (in milliseconds). If None, use driver's wait interval.
+        :param polling: the wait polling strategy. If None, use driver's wait polling strategy.
+        """
+        _interval = self.get_wait_interval() if interval is None else interval
+        _timeout = self.get_wait_timeout() if timeout is None else timeout
+        _polling = self.get_wait_polling() if polling is None else polling
+        return AsyncWebDriverWaitFor(self, _interval, _timeout, _polling)
+
+    async def quit(self):
+        """
+            Quits the driver and closes every associated window.
+        """
+        await self._execute("DELETE", "")
+
+    # Navigation
+
+    async def get(self, url: str):
+        """
+            Loads a web page in the current browser session.
+        """
+        await self._execute("POST", "/url", {"url": url})
+
+    async def refresh(self):
+        """
+            Refreshes the current page.
+        """
+        await self._execute("POST", "/refresh")
+
+    async def back(self):
+        """
+            Goes one step backward in the browser history.
+        """
+        await self._execute("POST", "/back")
+
+    async def forward(self):
+        """
+            Goes one step forward in the browser history.
+        """
+        await self._execute("POST", "/forward")
+
+    async def get_title(self) -> str:
+        """
+            Returns the title of the current page.
+        """
+        return await self._execute("GET", "/title")
+
+    async def get_current_url(self) -> str:
+        """
+            Gets the URL of the current page.
+        """
+        return await self._execute("GET", "/url")
+
+    async def get_page_source(self) -> str:
+        """
+            Gets the source of the current page.
+        """
+        return await self._execute("GET", "/source")
+
+    # Windows and frames
+
+    async def get_current_window_handle(self) -> str:
+        """
+            Returns the handle of the current window.
+        """
+        return await self._execute("GET", "/window")
+
+    async def get_window_handles(self) -> List[str]:
+        """
+            Returns the handles of all windows within the current session.
+        """
+        return await self._execute("GET", "/window/handles")
+
+    async def switch_to_window(self, window_handle: str):
+        """
+            Switches focus to the specified window.
+
+        :param window_handle: The window handle of the window to switch to.
+        """
+        await self._execute("POST", "/window", {"handle": window_handle})
+
+    async def close_window(self):
+        """
+            Close the current window.
+        """
+        await self._execute("DELETE", "/window")
+
+    async def get_window_size(self) -> dict:
+        """
+            Gets the width and height of the current window.
+
+        :return: the size dict, {'width': width, 'height': height}
+        """
+        rect = await self._execute("GET", "/window/rect")
+        return {"width": rect["width"], "height": rect["height"]}
+
+    async def set_window_size(self, width: int, height: int):
+        """
+            Sets the width and height of the current window.
+        """
+        await self._execute("POST", "/window/rect", {"width": int(width), "height": int(height)})
+
+    async def switch_to_frame(self, frame_reference: Union[int, AsyncElement]):
+        """
+            Switches focus to the specified frame, by index or element.
+        """
+        frame_id = frame_reference if isinstance(frame_reference, int) else {W3C_ELEMENT_KEY: await frame_reference._element_id()}
+        await self._execute("POST", "/frame", {"id": frame_id})
+
+    async def switch_to_default_content(self):
+        """
+            Selects the main document when a page contains iframes.
+        """
+        await self._execute("POST", "/frame", {"id": None})
+
+    # Cookies and alerts
+
+    async def get_cookies(self) -> List[dict]:
+        """
+            Returns a set of dictionaries, corresponding to cookies visible in the current session.
+        """
+        return await self._execute("GET", "/cookie")
+
+    async def delete_all_cookies(self):
+        """
+            Delete all cookies in the scope of the session.
+        """
+        await self._execute("DELETE", "/cookie")
+
+    async def is_alert_present(self) -> bool:
+        """
+            Return whether the alert is present or not.
+        """
+        try:
+            await self._execute("GET", "/alert/text")
+            return True
+        except SeleniumNoAlertPresentException:
+            return False
+
+    # Script and screenshot
+
+    async def execute_script(self, script: str, *args) -> any:
+        """
+            Synchronously Executes JavaScript in the current window/frame.
+            The AsyncElement arguments are passed as elements, and the returned elements are AsyncDynamicElements.
+
+        :param script: The JavaScript to execute.
+        :param args: Any applicable arguments for your JavaScript.
+        """
+        return self.__convert_result(await self._execute("POST", "/execute/sync", {"script": script, "args": [await self.__convert_arg(arg) for arg in args]}))
+
+    async def execute_async_script(self, script: str, *args) -> any:
+        """
+            Asynchronously Executes JavaScript in the current window/frame.
+
+        :param script: The JavaScript to execute.
+        :param args: Any applicable arguments for your JavaScript.
+        """
+        return self.__convert_result(await self._execute("POST", "/execute/async", {"script": script, "args": [await self.__convert_arg(arg) for arg in args]}))
+
+    async def __convert_arg(self, arg: any) -> any:
+        if isinstance(arg, AsyncElement):
+            return {W3C_ELEMENT_KEY: await arg._element_id()}
+        if isinstance(arg, (list, tuple)):
+            return [await self.__convert_arg(item) for item in arg]
+        if isinstance(arg, dict):
+            return {key: await self.__convert_arg(value) for key, value in arg.items()}
+        return arg
+
+    def __convert_result(self, result: any) -> any:
+        if isinstance(result, dict):
+            if W3C_ELEMENT_KEY in result:
+                return AsyncDynamicElement(self, result[W3C_ELEMENT_KEY])
+            return {key: self.__convert_result(value) for key, value in result.items()}
+        if isinstance(result, list):
+            return [self.__convert_result(item) for item in result]
+        return result
+
+    async def get_screenshot_as_base64(self) -> str:
+        """
+            Gets the screenshot of the current window as a base64 encoded string.
+        """
+        return await self._execute("GET", "/screenshot")
+
+    async def get_screenshot_as_png(self) -> bytes:
+        """
+            Gets the screenshot of the current window as a binary data.
+        """
+        return base64.b64decode((await self.get_screenshot_as_base64()).encode("ascii"))
+
+    def __str__(self):
+        return "AsyncWebDriver <Platform: %s><Context: %s><SessionId: %s>" % (
+            self.__web_driver_info.platform, self.__web_driver_info.context, self.__session_id)
+
+    async def __aenter__(self) -> "AsyncWebDriver":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.quit()
@@ -0,0 +1,172 @@
+import gzip
+import hashlib
+import os
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Tuple, Union
+
+
+class ArtifactSink:
+    def __init__(self, max_workers: int = 2, compress_level: int = None, dedupe: bool = True, max_pending: int = 64):
+        """
+            Create an ArtifactSink, it writes the artifacts (e.g., screenshots and page sources) to disk by a background thread pool,
+            so the test thread does not wait for the encoding and disk I/O.
+
+        :param max_workers: the number of threads to write the artifacts
+        :param compress_level: the gzip compress level (1-9), ".gz" is appended to the filename. If None, the artifacts are not compressed.
+        :param dedupe: whether to link (or copy if link is not supported) the file written before instead of writing the same content again
+        :param max_pending: the max number of artifacts waiting to be written, write() blocks if it is reached, so the memory is bounded
+
+        :Usage:
+            sink = ArtifactSink(compress_level=6)
+            driver.set_artifact_sink(sink)
+            driver.save_screenshot('/Screenshots/foo.png')
+            driver.save_page_source('/Screenshots/foo.html')
+            sink.flush()
+        """
+        if compress_level is not None and not 1 <= compress_level <= 9:
+            raise ValueError("The compress level <%s> is not between 1 and 9." % compress_level)
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="easyium-artifact")
+        self.__compress_level = compress_level
+        self.__dedupe = dedupe
+        self.__pending_slots = threading.BoundedSemaphore(max_pending)
+        self.__lock = threading.Lock()
+        self.__pending = set()
+        self.__failures = []  # type: List[Tuple[str, Exception]]
+        self.__last_failures = []  # type: List[Tuple[str, Exception]]
+        self.__written = {}  # type: Dict[str, Tuple[threading.Event, List[str]]]
+        self.__path_digests = {}  # type: Dict[str, str]
+        self.__closed = False
+
+    def write(self, filename: str, content: Union[bytes, str]) -> Future:
+        """
+            Write the artifact asynchronously, the string content is encoded in utf-8.
+
+        :param filename: the full path of the file to write
+        :param content: the content, e.g., the png bytes of a screenshot or the page source
+        :return: the future of the written path, its exception is set if the writing fails
+        """
+        if self.__closed:
+            raise ValueError("The artifact sink is closed.")
+        self.__pending_slots.acquire()
+        try:
+            future = self.__executor.submit(self.__write, filename, content)
+        except BaseException:
+            self.__pending_slots.release()
+            raise
+        with self.__lock:
+            self.__pending.add(future)
+        future.add_done_callback(self.__on_done)
+        return future
+
+    def flush(self, timeout: int = None) -> bool:
+        """
+            Wait for the pending artifacts to be written.
+            Returns False if any artifact failed to be written since last flush, else returns True.
+            The failures can be got by get_failures() before next flush.
+
+        :param timeout: the max time (in milliseconds) to wait. If None, wait until all the pending artifacts are written.
+        """
+        with self.__lock:
+            pending = list(self.__pending)
+        _, not_done = wait(pending, None if timeout is None else timeout / 1000.0)
+        if not_done:
+            return False
+
+        with self.__lock:
+            self.__last_failures, self.__failures = self.__failures, []
+            return not self.__last_failures
+
+    def get_failures(self) -> List[Tuple[str, Exception]]:
+        """
+            Get the failures found by last flush.
+
+        :return: the list of (filename, exception)
+        """
+        return list(self.__last_failures)
+
+    def close(self) -> bool:
+        """
+            Write the pending artifacts and stop the threads. Returns False if any artifact failed to be written.
+        """
+        self.__closed = True
+        result = self.flush()
+        self.__executor.shutdown(wait=True)
+        return result
+
+    def __on_done(self, future: Future):
+        with self.__lock:
+            self.__pending.discard(future)
+        self.__pending_slots.release()
+
+    def __write(self, filename: str, content: Union[bytes, str]) -> str:
+        try:
+            data = content.encode("utf-8") if isinstance(content, str) else bytes(content)
+            path = filename if self.__compress_level is None else filename + ".gz"
+            if not self.__dedupe:
+                self.__write_file(path, data)
+                return path
+
+            digest = hashlib.sha1(data).hexdigest()
+            with self.__lock:
+                # the file is replaced by a different content, it cannot be the source of dedupe any more
+                replaced_digest = self.__path_digests.get(path)
+                if replaced_digest is not None and replaced_digest != digest:
+                    replaced_entry = self.__written.get(replaced_digest)
+                    if replaced_entry is not None and replaced_entry[1][:1] == [path]:
+                        del self.__written[replaced_digest]
+                self.__path_digests[path] = digest
+                entry = self.__written.get(digest)
+                first = entry is None
+                if first:
+                    entry = self.__written[digest] = (threading.Event(), [])
+            written, paths = entry
+
+            if first:
+                try:
+                    self.__write_file(path, data)
+                    paths.append(path)
+                finally:
+                    written.set()
+                return path
+
+            # the first writer of the same content is running, so it is safe to wait for it here
+            written.wait()
+            if paths:
+                temp_path = "%s.%s.%s.tmp" % (path, os.getpid(), threading.get_ident())
+                try:
+                    os.link(paths[0], temp_path)
+                except OSError:
+                    shutil.copyfile(paths[0], temp_path)
+                os.replace(temp_path, path)
+            else:
+                self.__write_file(path, data)
+            return path
+        except Exception as e:
+            with self.__lock:
+                self.__failures.append((filename, e))
+            raise
+
+    def __write_file(self, path: str, data: bytes):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # write to a new file and replace, so a file linked by the deduped artifacts is never overwritten
+        temp_path = "%s.%s.%s.tmp" % (path, os.getpid(), threading.get_ident())
+        if self.__compress_level is None:
+            with open(temp_path, "wb") as f:
+                f.write(data)
+        else:
+            with gzip.open(temp_path, "wb", compresslevel=self.__compress_level) as f:
+                f.write(data)
+        os.replace(temp_path, path)
+
+    def __enter__(self) -> "ArtifactSink":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __str__(self):
+        return "ArtifactSink <CompressLevel: %s><Dedupe: %s>" % (self.__compress_level, self.__dedupe)
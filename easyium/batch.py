@@ -0,0 +1,249 @@
+from typing import List, TYPE_CHECKING
+
+from .enumeration import WebDriverContext
+from .exceptions import EasyiumException, UnsupportedOperationException
+from .script import script_registry
+
+if TYPE_CHECKING:
+    from .element import Element
+    from .web_driver import WebDriver
+
+# arguments: operations [[kind, element index, args], ...], element 1, element 2, ...
+# return: a result {value: value} or {error: message} for each operation, it stops at the first failed operation
+script_registry.register("easyium.action_batch", """
+    var operations = arguments[0], elements = Array.prototype.slice.call(arguments, 1), results = [];
+
+    function primitive(value) {
+        return value === undefined || (value !== null && typeof value === 'object') || typeof value === 'function' ? null : value;
+    }
+
+    function run(kind, el, args) {
+        switch (kind) {
+            case 'set_value':
+                el.setAttribute('value', args[0]);
+                return null;
+            case 'set_text':
+                el.innerText = args[0];
+                return null;
+            case 'focus':
+                el.focus();
+                return null;
+            case 'blur':
+                el.blur();
+                return null;
+            case 'click':
+                el.click();
+                return null;
+            case 'scroll_into_view':
+                el.scrollIntoView();
+                return null;
+            case 'dispatch_event':
+                el.dispatchEvent(new Event(args[0], {bubbles: args[1], cancelable: args[2]}));
+                return null;
+            case 'get_value':
+                return primitive(el.value);
+            case 'get_text':
+                return (el.innerText === undefined ? el.textContent : el.innerText).trim();
+            case 'get_attribute':
+                return el.getAttribute(args[0]);
+        }
+        throw new Error('Unknown operation <' + kind + '>.');
+    }
+
+    for (var i = 0; i < operations.length; i++) {
+        var operation = operations[i];
+        try {
+            results.push({value: run(operation[0], elements[operation[1]], operation[2])});
+        } catch (e) {
+            results.push({error: String(e && e.message ? e.message : e)});
+            break;
+        }
+    }
+    return results;
+""")
+
+
+class BatchResult:
+    def __init__(self, element: "Element", operation: str):
+        """
+            The result of an operation in ActionBatch, it is available after the batch is executed.
+
+        :param element: the element of the operation
+        :param operation: the name of the operation
+        """
+        self.__element = element
+        self.__operation = operation
+        self.__done = False
+        self.__value = None
+        self.__error = None
+
+    def _set_value(self, value: any):
+        self.__done = True
+        self.__value = value
+
+    def _set_error(self, error: EasyiumException):
+        self.__done = True
+        self.__error = error
+
+    def is_done(self) -> bool:
+        """
+            Whether the operation is executed, successfully or not.
+        """
+        return self.__done
+
+    def get_error(self) -> EasyiumException:
+        """
+            Get the error of the operation.
+
+        :return: the error, None if the operation succeeded or is not executed
+        """
+        return self.__error
+
+    def get(self) -> any:
+        """
+            Get the return value of the operation, it is None for the operations without return value.
+            The error of the operation is raised if it failed.
+        """
+        if self.__error is not None:
+            raise self.__error
+        if not self.__done:
+            raise EasyiumException("Operation <%s> is not executed, the batch is not executed or a previous operation failed." % self.__operation,
+                                   self.__element)
+        return self.__value
+
+    def __str__(self):
+        return "BatchResult <Operation: %s><Done: %s><Value: %s><Error: %s>" % (
+            self.__operation, self.__done, self.__value, None if self.__error is None else self.__error.msg)
+
+
+class ActionBatch:
+    def __init__(self, web_driver: "WebDriver"):
+        """
+            Create an ActionBatch, it collects the javascript operations on elements and executes them by one script call.
+            The operations are executed in order and the batch stops at the first failed operation.
+            It is only available in web context.
+
+        :param web_driver: the web driver
+
+        :Usage:
+            with driver.batch() as batch:
+                batch.set_value(StaticElement(driver, "id=name"), "easyium")
+                batch.set_value(StaticElement(driver, "id=email"), "easyium@example.com")
+                value = batch.get_value(StaticElement(driver, "id=name"))
+                batch.click(StaticElement(driver, "id=submit"))
+            print(value.get())
+        """
+        self.__web_driver = web_driver
+        self.__operations = []
+        self.__elements = []
+        self.__results = []
+
+    def __add(self, element: "Element", operation: str, *args) -> BatchResult:
+        for index, _element in enumerate(self.__elements):
+            if _element is element:
+                break
+        else:
+            index = len(self.__elements)
+            self.__elements.append(element)
+        result = BatchResult(element, operation)
+        self.__operations.append([operation, index, list(args)])
+        self.__results.append(result)
+        return result
+
+    def set_value(self, element: "Element", value: str) -> BatchResult:
+        """
+            Set the value on the element, like Element.set_value().
+        """
+        return self.__add(element, "set_value", value)
+
+    def set_text(self, element: "Element", text: str) -> BatchResult:
+        """
+            Set the text of the element, like Element.set_text().
+        """
+        return self.__add(element, "set_text", text)
+
+    def focus(self, element: "Element") -> BatchResult:
+        """
+            Focus the element.
+        """
+        return self.__add(element, "focus")
+
+    def blur(self, element: "Element") -> BatchResult:
+        """
+            Remove keyboard focus from the element.
+        """
+        return self.__add(element, "blur")
+
+    def click(self, element: "Element") -> BatchResult:
+        """
+            Click the element by javascript, it does not check whether the element is covered.
+        """
+        return self.__add(element, "click")
+
+    def scroll_into_view(self, element: "Element") -> BatchResult:
+        """
+            Scroll the element into view.
+        """
+        return self.__add(element, "scroll_into_view")
+
+    def dispatch_event(self, element: "Element", event_type: str, bubbles: bool = True, cancelable: bool = True) -> BatchResult:
+        """
+            Dispatch an event on the element.
+
+        :param event_type: the type of event, e.g., "change" or "input"
+        :param bubbles: whether the event bubbles
+        :param cancelable: whether the event is cancelable
+        """
+        return self.__add(element, "dispatch_event", event_type, bubbles, cancelable)
+
+    def get_value(self, element: "Element") -> BatchResult:
+        """
+            Get the value of the element.
+        """
+        return self.__add(element, "get_value")
+
+    def get_text(self, element: "Element") -> BatchResult:
+        """
+            Get the text of the element, it is the trimmed innerText.
+        """
+        return self.__add(element, "get_text")
+
+    def get_attribute(self, element: "Element", name: str) -> BatchResult:
+        """
+            Get the attribute declared in the element's HTML markup.
+        """
+        return self.__add(element, "get_attribute", name)
+
+    def execute(self) -> List[BatchResult]:
+        """
+            Execute the collected operations by one script call, the batch is cleared after executing.
+            The error of the first failed operation is raised.
+
+        :return: the results of the operations
+        """
+        operations, elements, results = self.__operations, self.__elements, self.__results
+        self.__operations, self.__elements, self.__results = [], [], []
+        if not operations:
+            return results
+
+        if self.__web_driver.get_web_driver_info().context not in WebDriverContext._WEB:
+            raise UnsupportedOperationException("ActionBatch is only available in web context.")
+
+        # the script is not executed if an element is stale, so it is safe to refresh the elements and retry
+        script_results = elements[0].get_retry_policy().run(
+            elements[0], lambda: self.__web_driver.execute_registered_script("easyium.action_batch", operations, *elements),
+            "exists", idempotent=False, related_elements=elements[1:])
+
+        for operation, result, script_result in zip(operations, results, script_results):
+            if "error" in script_result:
+                result._set_error(EasyiumException("Batch operation <%s> failed: %s" % (operation[0], script_result["error"]), elements[operation[1]]))
+                raise result.get_error()
+            result._set_value(script_result.get("value"))
+        return results
+
+    def __enter__(self) -> "ActionBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.execute()
@@ -6,12 +6,15 @@ from selenium.common.exceptions import StaleElementReferenceException as Seleniu
     InvalidSelectorException as SeleniumInvalidSelectorException, WebDriverException as SeleniumWebDriverException
 
 from .exceptions import InvalidLocatorException, NoSuchElementException, EasyiumException, TimeoutException, ElementTimeoutException
-from .identifier import Identifier
-from .locator import locator_to_by_value
+from .identifier import Identifier, DomTagIdentifier
+from .locator import Locator, locator_to_by_value
+from .polling import PollingStrategy
+from .retry import RetryPolicy
 from .waiter import Waiter, WebDriverWaitFor, ElementWaitFor
 
 if TYPE_CHECKING:
-    from .dynamic_element import DynamicElement
+    from .dynamic_element import DynamicElement, ElementList
+    from .store import ArtifactStore
     from .web_driver import WebDriver, WebDriverInfo
 
 
@@ -19,6 +22,10 @@ class Context:
     def __init__(self):
         self.__wait_interval = None
         self.__wait_timeout = None
+        self.__wait_polling = None
+        self.__event_driven_wait = None
+        self.__retry_policy = None
+        self.__actionability_check = None
 
     def get_web_driver(self) -> "WebDriver":
         pass
@@ -47,6 +54,20 @@ class Context:
     def get_screenshot_as_base64(self) -> str:
         pass
 
+    def store_screenshot(self, store: "ArtifactStore", step: str = None) -> str:
+        """
+            Gets the screenshot of this context and puts it into the artifact store,
+            the same screenshot is saved only once in the store.
+
+        :param store: the artifact store
+        :param step: the test step to record in the index of store
+        :return: the digest of the screenshot
+
+        :Usage:
+            digest = context.store_screenshot(store, 'test_login/submit')
+        """
+        return store.put(self.get_screenshot_as_png(), step, "png")
+
     def get_wait_interval(self) -> int:
         """
             Get the wait interval of this context.
@@ -66,6 +87,87 @@ class Context:
         """
         self.__wait_interval = interval
 
+    def get_wait_polling(self) -> PollingStrategy:
+        """
+            Get the wait polling strategy of this context.
+            If the wait polling strategy for element is not set, return the driver's wait polling strategy.
+
+        :return: the wait polling strategy
+        """
+        if self.__wait_polling is not None:
+            return self.__wait_polling
+        return self.get_web_driver().get_wait_polling()
+
+    def set_wait_polling(self, polling: PollingStrategy):
+        """
+            Set the wait polling strategy of this context.
+
+        :param polling: the new wait polling strategy, e.g., FixedInterval() or ExponentialBackoff()
+        """
+        self.__wait_polling = polling
+
+    def is_event_driven_wait(self) -> bool:
+        """
+            Whether the element waits of this context are event driven.
+            If it is not set for element, return the driver's setting.
+
+        :return: whether the element waits are event driven
+        """
+        if self.__event_driven_wait is not None:
+            return self.__event_driven_wait
+        return self.get_web_driver().is_event_driven_wait()
+
+    def set_event_driven_wait(self, event_driven: bool):
+        """
+            Set whether the element waits of this context are event driven.
+            In web context, an event driven wait evaluates the condition in browser by one execute_async_script call,
+            which returns as soon as the condition flips instead of polling it from here.
+            It applies to element's wait_for().visible(), text_equals(), attribute_equals(), attribute_contains_one() and attribute_contains_all().
+
+        :param event_driven: whether the element waits are event driven
+        """
+        self.__event_driven_wait = event_driven
+
+    def get_retry_policy(self) -> RetryPolicy:
+        """
+            Get the retry policy of this context, the element operations recover from the errors by it.
+            If the retry policy for element is not set, return the driver's retry policy.
+
+        :return: the retry policy
+        """
+        if self.__retry_policy is not None:
+            return self.__retry_policy
+        return self.get_web_driver().get_retry_policy()
+
+    def set_retry_policy(self, retry_policy: RetryPolicy):
+        """
+            Set the retry policy of this context.
+
+        :param retry_policy: the new retry policy
+        """
+        self.__retry_policy = retry_policy
+
+    def is_actionability_check(self) -> bool:
+        """
+            Whether the element actions of this context wait for the element to be actionable before acting.
+            If it is not set for element, return the driver's setting.
+
+        :return: whether the actionability check is enabled
+        """
+        if self.__actionability_check is not None:
+            return self.__actionability_check
+        return self.get_web_driver().is_actionability_check()
+
+    def set_actionability_check(self, actionability_check: bool):
+        """
+            Set whether the element actions of this context wait for the element to be actionable before acting.
+            It applies to element's click(), double_click() and send_keys(), see ElementWaitFor.actionable().
+            So the action is not sent to an element which is covered by an overlay or still moving.
+
+        :param actionability_check: whether the actionability check is enabled
+        """
+        self.__actionability_check = actionability_check
+
     def get_wait_timeout(self) -> int:
         """
             Get the wait timeout of this context.
@@ -85,26 +187,29 @@ class Context:
         """
         self.__wait_timeout = timeout
 
-    def wait_for(self, interval=None, timeout=None) -> Union[ElementWaitFor, WebDriverWaitFor]:
+    def wait_for(self, interval=None, timeout=None, polling=None) -> Union[ElementWaitFor, WebDriverWaitFor]:
         pass
 
-    def waiter(self, interval: int = None, timeout: int = None):
+    def waiter(self, interval: int = None, timeout: int = None, polling: PollingStrategy = None):
         """
             Get a Waiter instance.
 
         :param interval: the wait interval (in milliseconds). If None, use context's wait interval.
         :param timeout: the wait timeout (in milliseconds). If None, use context's wait interval.
+        :param polling: the wait polling strategy. If None, use context's wait polling strategy.
         """
         _interval = self.get_wait_interval() if interval is None else interval
         _timeout = self.get_wait_timeout() if timeout is None else timeout
-        return Waiter(_interval, _timeout)
+        _polling = self.get_wait_polling() if polling is None else polling
+        return Waiter(_interval, _timeout, _polling, tracer=self.get_web_driver().get_tracer())
 
-    def _find_selenium_element(self, locator: str) -> AppiumElement:
+    def _find_selenium_element(self, locator: Union[str, Locator]) -> AppiumElement:
         by, value = locator_to_by_value(locator)
         try:
             try:
                 return self._selenium_context().find_element(by, value)
             except SeleniumStaleElementReferenceException:
+                self.get_web_driver()._trace_retry("stale", self)
                 self._refresh()
                 return self._selenium_context().find_element(by, value)
         except SeleniumInvalidSelectorException:
@@ -114,13 +219,13 @@ class Context:
         except SeleniumWebDriverException as wde:
             raise EasyiumException(wde.msg, self)
 
-    def has_child(self, locator: str) -> bool:
+    def has_child(self, locator: Union[str, Locator]) -> bool:
         """
             Whether this context has a child element.
 
         :param locator:
             the locator (relative to this context) of the child element.
-            The format of locator is: "by=value", the possible values of "by" are::
+            It is a Locator or a string in format "by=value", the possible values of "by" are::
 
                 "id": By.ID
                 "xpath": By.XPATH
@@ -142,7 +247,96 @@ class Context:
         """
         return self.find_element(locator) is not None
 
-    def find_element(self, locator: str, identifier: Callable[["DynamicElement"], str] = Identifier.id, condition: Callable[["DynamicElement"], bool] = lambda element: True) \
+    def probe(self, locator: Union[str, Locator], grace: int = 0) -> bool:
+        """
+            Whether this context has a child element right now.
+            Unlike has_child(), it does not wait for the wait timeout of this context, and it returns False if this context does not exist.
+
+        :param locator:
+            the locator (relative to this context) of the child element.
+            It is a Locator or a string in format "by=value", the possible values of "by" are::
+
+                "id": By.ID
+                "xpath": By.XPATH
+                "link": By.LINK_TEXT
+                "partial_link": By.PARTIAL_LINK_TEXT
+                "name": By.NAME
+                "tag": By.TAG_NAME
+                "class": By.CLASS_NAME
+                "css": By.CSS_SELECTOR
+                "ios_pre": MobileBy.IOS_PREDICATE
+                "ios_ui": MobileBy.IOS_UIAUTOMATION
+                "ios_class": MobileBy.IOS_CLASS_CHAIN
+                "android_ui": MobileBy.ANDROID_UIAUTOMATOR
+                "android_tag": MobileBy.ANDROID_VIEWTAG
+                "android_data": MobileBy.ANDROID_DATA_MATCHER
+                "acc_id": MobileBy.ACCESSIBILITY_ID
+                "custom": MobileBy.CUSTOM
+        :param grace: the grace period (in milliseconds) to wait for the child element to appear, it is separate from the wait timeout of this context.
+        :return: whether this context has a child element.
+
+        :Usage:
+            if driver.probe("id=cookie-banner", grace=500):
+                StaticElement(driver, "id=accept-cookies").click()
+        """
+        return self.count(locator, grace) > 0
+
+    def count(self, locator: Union[str, Locator], grace: int = 0) -> int:
+        """
+            Count the child elements of this context right now.
+            It does not wait for the wait timeout of this context, and it returns 0 if this context does not exist.
+
+        :param locator:
+            the locator (relative to this context) of the child elements.
+            It is a Locator or a string in format "by=value", the possible values of "by" are::
+
+                "id": By.ID
+                "xpath": By.XPATH
+                "link": By.LINK_TEXT
+                "partial_link": By.PARTIAL_LINK_TEXT
+                "name": By.NAME
+                "tag": By.TAG_NAME
+                "class": By.CLASS_NAME
+                "css": By.CSS_SELECTOR
+                "ios_pre": MobileBy.IOS_PREDICATE
+                "ios_ui": MobileBy.IOS_UIAUTOMATION
+                "ios_class": MobileBy.IOS_CLASS_CHAIN
+                "android_ui": MobileBy.ANDROID_UIAUTOMATOR
+                "android_tag": MobileBy.ANDROID_VIEWTAG
+                "android_data": MobileBy.ANDROID_DATA_MATCHER
+                "acc_id": MobileBy.ACCESSIBILITY_ID
+                "custom": MobileBy.CUSTOM
+        :param grace: the grace period (in milliseconds) to wait for at least one child element to appear, it is separate from the wait timeout of this context.
+        :return: the count of the child elements.
+        """
+        by, value = locator_to_by_value(locator)
+        count = {"inner": 0}
+
+        def _count_elements():
+            try:
+                try:
+                    count["inner"] = len(self._selenium_context().find_elements(by, value))
+                except SeleniumStaleElementReferenceException:
+                    self.get_web_driver()._trace_retry("stale", self)
+                    self._refresh()
+                    count["inner"] = len(self._selenium_context().find_elements(by, value))
+            except NoSuchElementException:
+                # Only Element can reach here, this context does not exist
+                count["inner"] = 0
+            except SeleniumInvalidSelectorException:
+                raise InvalidLocatorException("The value <%s> of locator <%s> is not a valid expression." % (value, locator), self)
+            except SeleniumWebDriverException as wde:
+                raise EasyiumException(wde.msg, self)
+            return count["inner"] > 0
+
+        try:
+            self.waiter(timeout=grace).wait_for(_count_elements)
+        except TimeoutException:
+            pass
+
+        return count["inner"]
+
+    def find_element(self, locator: Union[str, Locator], identifier: Callable[["DynamicElement"], str] = Identifier.id, condition: Callable[["DynamicElement"], bool] = lambda element: True) \
             -> "DynamicElement":
         """
             Find a DynamicElement under this context.
@@ -150,7 +344,7 @@ class Context:
 
         :param locator:
             the locator (relative to this context) of the element to be found.
-            The format of locator is: "by=value", the possible values of "by" are::
+            It is a Locator or a string in format "by=value", the possible values of "by" are::
 
                 "id": By.ID
                 "xpath": By.XPATH
@@ -173,6 +367,8 @@ class Context:
             Otherwise, you can create one like this::
 
                 context.find_element("class=foo", lambda e: "xpath=.//*[@bar='%s']" % e.get_attribute("bar"))
+
+            Identifier.dom_tag stamps the found element in web context, so it can be refreshed by one indexed lookup.
         :param condition:
             end finding element when the found element match the condition function.
             e.g., end finding element when the found element is not None
@@ -186,15 +382,24 @@ class Context:
         by, value = locator_to_by_value(locator)
         element = {"inner": None}
 
+        def _create_element():
+            if isinstance(identifier, DomTagIdentifier):
+                stamped = identifier._find_and_stamp(self, locator, True)
+                if stamped is not None:
+                    if not stamped:
+                        raise SeleniumNoSuchElementException("Cannot find element by <%s>." % locator)
+                    return DynamicElement(self, stamped[0][0], locator, identifier, locator=stamped[0][1])
+            return DynamicElement(self, self._selenium_context().find_element(by, value), locator, identifier)
+
         def _find_element():
             try:
                 try:
-                    element["inner"] = DynamicElement(self, self._selenium_context().find_element(by, value), locator, identifier)
+                    element["inner"] = _create_element()
                     return element["inner"]
                 except (NoSuchElementException, SeleniumStaleElementReferenceException):
                     # Only Element can reach here
                     self.wait_for().exists()
-                    element["inner"] = DynamicElement(self, self._selenium_context().find_element(by, value), locator, identifier)
+                    element["inner"] = _create_element()
                     return element["inner"]
             except SeleniumInvalidSelectorException:
                 raise InvalidLocatorException("The value <%s> of locator <%s> is not a valid expression." % (value, locator), self)
@@ -210,20 +415,21 @@ class Context:
             if e.__class__ == ElementTimeoutException:
                 # raised by self.wait_for().exists() in _find_element()
                 raise
-            raise TimeoutException("Timed out waiting for the found element by <%s> under:\n%s\nmatches condition <%s>." % (locator, self, condition.__name__))
+            raise self.get_web_driver()._capture_failure(TimeoutException(
+                "Timed out waiting for the found element by <%s> under:\n%s\nmatches condition <%s>." % (locator, self, condition.__name__)))
 
         return element["inner"]
 
-    def find_elements(self, locator: str, identifier: Callable[["DynamicElement"], str] = Identifier.id,
-                      condition: Callable[[List["DynamicElement"]], bool] = lambda elements: True) \
-            -> List["DynamicElement"]:
+    def find_elements(self, locator: Union[str, Locator], identifier: Callable[["DynamicElement"], str] = Identifier.id,
+                      condition: Callable[[List["DynamicElement"]], bool] = lambda elements: True, prefetch: List[str] = None) \
+            -> "ElementList":
         """
             Find DynamicElement list under this context.
             Note: if no elements is found, empty list will be returned.
 
         :param locator:
             the locator (relative to this context) of the elements to be found.
-            The format of locator is: "by=value", the possible values of "by" are::
+            It is a Locator or a string in format "by=value", the possible values of "by" are::
 
                 "id": By.ID
                 "xpath": By.XPATH
@@ -246,30 +452,49 @@ class Context:
             Otherwise, you can create one like this::
 
                 context.find_elements("class=foo", identifier=lambda element: "xpath=.//*[@bar='%s']" % element.get_attribute("bar"))
+
+            If the identifier provides batch(elements) (e.g., the ones based on an attribute), the locators of all the found elements
+            are generated by one call when the first of them is persisted.
+            Identifier.dom_tag stamps the found elements in web context, so they can be refreshed by one indexed lookup.
         :param condition:
             end finding elements when the found element list match the condition function.
             e.g., end finding elements when the found element list is not empty
 
                 context.find_elements("class=foo", condition=lambda elements: elements)
+        :param prefetch:
+            the fields to fetch for all the found elements, they are fetched by one script call in web context.
+            See WebDriver.fetch_many() for the possible fields. e.g.,
+
+                rows = context.find_elements("css=tr", prefetch=["text", "attr:data-id"])
+                texts = rows.get_prefetched("text")
         :return: the DynamicElement list found by locator
         """
         # import the DynamicElement here to avoid cyclic dependency
-        from .dynamic_element import DynamicElement
+        from .dynamic_element import DynamicElement, ElementList, IdentifierBatch
 
         by, value = locator_to_by_value(locator)
         elements = {"inner": []}
 
+        def _create_elements():
+            if isinstance(identifier, DomTagIdentifier):
+                stamped = identifier._find_and_stamp(self, locator, False)
+                if stamped is not None:
+                    return [DynamicElement(self, selenium_element, locator, identifier, locator=stamp_locator)
+                            for selenium_element, stamp_locator in stamped]
+            # the found elements share one batch to generate their locators together on persisting
+            identifier_batch = IdentifierBatch(identifier)
+            return [DynamicElement(self, selenium_element, locator, identifier, identifier_batch)
+                    for selenium_element in self._selenium_context().find_elements(by, value)]
+
         def _find_elements():
             try:
                 try:
-                    selenium_elements = self._selenium_context().find_elements(by, value)
-                    elements["inner"] = [DynamicElement(self, selenium_element, locator, identifier) for selenium_element in selenium_elements]
+                    elements["inner"] = _create_elements()
                     return elements["inner"]
                 except (NoSuchElementException, SeleniumStaleElementReferenceException):
                     # Only Element can reach here
                     self.wait_for().exists()
-                    selenium_elements = self._selenium_context().find_elements(by, value)
-                    elements["inner"] = [DynamicElement(self, selenium_element, locator, identifier) for selenium_element in selenium_elements]
+                    elements["inner"] = _create_elements()
                     return elements["inner"]
             except SeleniumInvalidSelectorException:
                 raise InvalidLocatorException("The value <%s> of locator <%s> is not a valid expression." % (value, locator), self)
@@ -282,6 +507,9 @@ class Context:
             if e.__class__ == ElementTimeoutException:
                 # raised by self.wait_for().exists() in _find_elements()
                 raise
-            raise TimeoutException("Timed out waiting for the found element list by <%s> under:\n%s\nmatches condition <%s>." % (locator, self, condition.__name__))
+            raise self.get_web_driver()._capture_failure(TimeoutException(
+                "Timed out waiting for the found element list by <%s> under:\n%s\nmatches condition <%s>." % (locator, self, condition.__name__)))
 
-        return elements["inner"]
+        if prefetch:
+            return ElementList(elements["inner"], self.get_web_driver().fetch_many(elements["inner"], prefetch))
+        return ElementList(elements["inner"])
@@ -0,0 +1,75 @@
+import threading
+import time
+
+_local = threading.local()
+
+
+def _active_deadlines() -> list:
+    if not hasattr(_local, "deadlines"):
+        _local.deadlines = []
+    return _local.deadlines
+
+
+class Deadline:
+    def __init__(self, timeout: float):
+        """
+            Create a Deadline which expires after timeout from now.
+            Use it in with statement to bound all the waits in the block, the nested waits share its rest timeout.
+
+        :param timeout: the timeout (in milliseconds)
+
+        :Usage:
+            with Deadline(10000):
+                StaticElement(driver, "id=submit").click()
+                driver.wait_for().url_equals("https://example.com/done")
+        """
+        self.__expire_time = time.monotonic() * 1000.0 + timeout
+
+    @staticmethod
+    def current() -> "Deadline":
+        """
+            Get the innermost active deadline of current thread.
+
+        :return: the active deadline, None if there is no active deadline
+        """
+        deadlines = _active_deadlines()
+        return deadlines[-1] if deadlines else None
+
+    @staticmethod
+    def within(timeout: float) -> "Deadline":
+        """
+            Create a Deadline which expires after timeout from now, but no later than the active deadline.
+
+        :param timeout: the timeout (in milliseconds)
+        """
+        return Deadline(timeout)._bounded()
+
+    def _bounded(self) -> "Deadline":
+        current = Deadline.current()
+        if current is not None and current.__expire_time < self.__expire_time:
+            return current
+        return self
+
+    def get_rest_timeout(self) -> float:
+        """
+            Get the rest timeout of this deadline, it is negative if this deadline has expired.
+
+        :return: the rest timeout (in milliseconds)
+        """
+        return self.__expire_time - time.monotonic() * 1000.0
+
+    def is_expired(self) -> bool:
+        """
+            Whether this deadline has expired.
+        """
+        return self.get_rest_timeout() < 0
+
+    def __enter__(self):
+        _active_deadlines().append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active_deadlines().pop()
+
+    def __str__(self):
+        return "Deadline <RestTimeout: %s>" % self.get_rest_timeout()
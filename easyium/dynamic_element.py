@@ -1,27 +1,80 @@
-from typing import Callable
+from typing import Callable, Dict, List
 
 from appium.webdriver.webelement import WebElement as AppiumElement
+from selenium.common.exceptions import WebDriverException as SeleniumWebDriverException
 
 from .context import Context
 from .element import Element
-from .exceptions import NotPersistException, LatePersistException
+from .enumeration import WebDriverContext
+from .exceptions import EasyiumException, NoSuchElementException, NotPersistException, LatePersistException
+from .identifier import DomTagIdentifier
+
+
+class IdentifierBatch:
+    def __init__(self, identifier: Callable[[Element], str]):
+        """
+            The shared identifying of the elements found together by Context.find_elements().
+            If the identifier provides batch(elements), the locators of all the elements are generated
+            by one call when the first element is persisted, so persisting the others costs nothing.
+
+        :param identifier: the identifier of the elements
+        """
+        self.__identifier = identifier
+        self.__elements = []
+        self.__locators = None
+
+    def add(self, element: "DynamicElement"):
+        self.__elements.append(element)
+
+    def identify(self, element: "DynamicElement") -> str:
+        """
+            Get the generated locator of the element.
+
+        :return: the locator, None if it cannot be generated in batch
+        """
+        if self.__locators is None:
+            self.__locators = {}
+            if hasattr(self.__identifier, "batch") and element.get_web_driver_info().context in WebDriverContext._WEB:
+                try:
+                    with element.get_web_driver()._expect_failures():
+                        locators = self.__identifier.batch(self.__elements)
+                    self.__locators = {id(e): locator for e, locator in zip(self.__elements, locators)}
+                except (SeleniumWebDriverException, EasyiumException):
+                    # identify the elements one by one
+                    pass
+            # the elements are no longer needed
+            self.__elements = []
+        return self.__locators.get(id(element))
 
 
 class DynamicElement(Element):
-    def __init__(self, parent: Context, selenium_element: AppiumElement, found_by, identifier: Callable[[Element], str]):
+    def __init__(self, parent: Context, selenium_element: AppiumElement, found_by, identifier: Callable[[Element], str],
+                 identifier_batch: IdentifierBatch = None, locator: str = None):
         Element.__init__(self, parent)
         # from element
         self._inner_selenium_element = selenium_element
-        self._locator = None
+        self._locator = locator
         # self
         self.__found_by = found_by
         self.__identifier = identifier
+        self.__identifier_batch = identifier_batch
+        if identifier_batch is not None:
+            identifier_batch.add(self)
 
     def _refresh(self):
         if self._locator is None:
             raise NotPersistException("persist() was not invoked so this Element cannot auto-refresh.", self)
         self._inner_selenium_element = None
-        self._inner_selenium_element = self.get_parent()._find_selenium_element(self._locator)
+        try:
+            self._inner_selenium_element = self.get_parent()._find_selenium_element(self._locator)
+        except NoSuchElementException:
+            if not isinstance(self.__identifier, DomTagIdentifier):
+                raise
+            # the stamp is lost, e.g., the node is re-rendered
+            recovered = self.__identifier._recover(self.get_parent(), self.__found_by)
+            if recovered is None:
+                raise
+            self._inner_selenium_element, self._locator = recovered
 
     def persist(self):
         """
@@ -31,7 +84,10 @@ class DynamicElement(Element):
 
         try:
             if self._locator is None:
-                self._locator = self.__identifier(self)
+                if self.__identifier_batch is not None:
+                    self._locator = self.__identifier_batch.identify(self)
+                if self._locator is None:
+                    self._locator = self.__identifier(self)
         except NotPersistException:
             raise LatePersistException(
                 "Trying to persist() a stale element. Try invoking persist() earlier.", self)
@@ -43,3 +99,28 @@ class DynamicElement(Element):
         else:
             return "%s\n|- DynamicElement <SeleniumElementId: %s><Locator: %s><FoundBy: %s>" % (
                 self.get_parent(), self._inner_selenium_element.id, self._locator, self.__found_by)
+
+
+class ElementList(list):
+    def __init__(self, elements: List[DynamicElement] = (), prefetched: Dict[str, list] = None):
+        """
+            The DynamicElement list found by Context.find_elements(), it carries the prefetched fields of the elements.
+
+        :param elements: the found elements
+        :param prefetched: the columns of prefetched values, see WebDriver.fetch_many()
+        """
+        list.__init__(self, elements)
+        self.__prefetched = {} if prefetched is None else prefetched
+
+    def get_prefetched(self, field: str) -> list:
+        """
+            Get the prefetched values of a field, they are in the order of elements.
+            The values are fetched when the elements are found, they are not refreshed.
+
+        :param field: the field passed to prefetch, e.g., "attr:href"
+        :return: the prefetched values
+        """
+        try:
+            return self.__prefetched[field]
+        except KeyError:
+            raise KeyError("Field <%s> is not prefetched, the prefetched fields are %s." % (field, list(self.__prefetched)))
@@ -1,17 +1,131 @@
-from typing import Union
+from typing import List, Union
 
 from appium.webdriver.webelement import WebElement as AppiumElement
-from selenium.common.exceptions import WebDriverException as SeleniumWebDriverException, StaleElementReferenceException as SeleniumStaleElementReferenceException, \
-    InvalidElementStateException as SeleniumInvalidElementStateException
+from selenium.common.exceptions import WebDriverException as SeleniumWebDriverException, StaleElementReferenceException as SeleniumStaleElementReferenceException
 
 from .context import Context
 from .decorator import SupportedBy
 from .enumeration import WebDriverContext, WebDriverPlatform
 from .exceptions import EasyiumException, NoSuchElementException
+from .polling import PollingStrategy
+from .script import script_registry
+from .snapshot import ElementSnapshot, default_snapshot_fields
 from .waiter import ElementWaitFor
 from .web_driver import WebDriver, WebDriverInfo
 
 
+# the helper scripts, they are sent to browser once per document, see WebDriver.execute_registered_script()
+script_registry.register("easyium.double_click", """
+    var dblclickEventObj = null;
+    if (typeof window.Event == "function") {
+        dblclickEventObj = new MouseEvent('dblclick', {'bubbles': true, 'cancelable': true});
+    } else {
+        dblclickEventObj = document.createEvent("MouseEvents");
+        dblclickEventObj.initMouseEvent('dblclick', true, true, window, 0, 0, 0, 0, 0, false, false, false, false, 0, null);
+    }
+    arguments[0].dispatchEvent(dblclickEventObj);
+""")
+
+script_registry.register("easyium.context_click", """
+    var clickEventObj = null;
+    if (typeof window.Event == "function") {
+        clickEventObj = new MouseEvent('click', {'bubbles': true, 'cancelable': true, 'button': 2, 'buttons': 2});
+    } else {
+        clickEventObj = document.createEvent("MouseEvents");
+        clickEventObj.initMouseEvent('click', true, true, window, 0, 0, 0, 0, 0, false, false, false, false, 2, 2);
+    }
+    arguments[0].dispatchEvent(clickEventObj);
+""")
+
+script_registry.register("easyium.mouse_over", """
+    var mouseoverEventObj = null;
+    if (typeof window.Event == "function") {
+        mouseoverEventObj = new MouseEvent('mouseover', {'bubbles': true, 'cancelable': true});
+    } else {
+        mouseoverEventObj = document.createEvent("MouseEvents");
+        mouseoverEventObj.initMouseEvent('mouseover', true, true, window, 0, 0, 0, 0, 0, false, false, false, false, 0, null);
+    }
+    arguments[0].dispatchEvent(mouseoverEventObj);
+""")
+
+script_registry.register("easyium.mouse_out", """
+    var mouseoutEventObj = null;
+    if (typeof window.Event == "function") {
+        mouseoutEventObj = new MouseEvent('mouseout', {'bubbles': true, 'cancelable': true});
+    } else {
+        mouseoutEventObj = document.createEvent("MouseEvents");
+        mouseoutEventObj.initMouseEvent('mouseout', true, true, window, 0, 0, 0, 0, 0, false, false, false, false, 0, null);
+    }
+    arguments[0].dispatchEvent(mouseoutEventObj);
+""")
+
+script_registry.register("easyium.set_selection_range", """
+    function getTextNodesIn(node) {
+        var textNodes = [];
+        if (node.nodeType == 3) {
+            textNodes.push(node);
+        } else {
+            var children = node.childNodes;
+            for (var i = 0, len = children.length; i < len; ++i) {
+                textNodes.push.apply(textNodes, getTextNodesIn(children[i]));
+            }
+        }
+        return textNodes;
+    }
+
+    function setSelectionRange(el, start, end) {
+        if (el.tagName == 'INPUT' || el.tagName == 'TEXTAREA'){
+            if(el.createTextRange){
+                var Range=el.createTextRange();
+                Range.collapse();
+                Range.moveEnd('character',end);
+                Range.moveStart('character',start);
+                Range.select();
+            }else if(el.setSelectionRange){
+                el.focus();
+                el.setSelectionRange(start,end);
+            }
+        } else {
+            if (document.createRange && window.getSelection) {
+                var range = document.createRange();
+                range.selectNodeContents(el);
+                var textNodes = getTextNodesIn(el);
+                var foundStart = false;
+                var charCount = 0, endCharCount;
+
+                for (var i = 0, textNode; textNode = textNodes[i++]; ) {
+                    endCharCount = charCount + textNode.length;
+                    if (!foundStart && start >= charCount
+                            && (start < endCharCount ||
+                            (start == endCharCount && i <= textNodes.length))) {
+                        range.setStart(textNode, start - charCount);
+                        foundStart = true;
+                    }
+                    if (foundStart && end <= endCharCount) {
+                        range.setEnd(textNode, end - charCount);
+                        break;
+                    }
+                    charCount = endCharCount;
+                }
+
+                var sel = window.getSelection();
+                sel.removeAllRanges();
+                sel.addRange(range);
+            } else if (document.selection && document.body.createTextRange) {
+                var textRange = document.body.createTextRange();
+                textRange.moveToElementText(el);
+                textRange.collapse(true);
+                textRange.moveEnd('character', end);
+                textRange.moveStart('character', start);
+                textRange.select();
+            }
+        }
+    }
+
+    setSelectionRange(arguments[0], arguments[1], arguments[2]);
+""")
+
+
 class Element(Context):
     def __init__(self, parent: Context):
         Context.__init__(self)
@@ -19,6 +133,9 @@ class Element(Context):
         self._inner_selenium_element = None
         self._locator = None
         self.__parent = parent
+        # the cached snapshot and the selenium element it is taken from
+        self.__snapshot = None
+        self.__snapshot_selenium_element = None
 
     def get_web_driver(self) -> WebDriver:
         """
@@ -54,16 +171,18 @@ class Element(Context):
             self._refresh()
         return self._inner_selenium_element
 
-    def wait_for(self, interval: int = None, timeout: int = None) -> ElementWaitFor:
+    def wait_for(self, interval: int = None, timeout: int = None, polling: PollingStrategy = None) -> ElementWaitFor:
         """
             Get a ElementWaitFor instance.
 
         :param interval: the wait interval (in milliseconds). If None, use element's wait interval.
         :param timeout: the wait timeout (in milliseconds). If None, use element's wait timeout.
+        :param polling: the wait polling strategy. If None, use element's wait polling strategy.
         """
         _interval = self.get_wait_interval() if interval is None else interval
         _timeout = self.get_wait_timeout() if timeout is None else timeout
-        return ElementWaitFor(self, _interval, _timeout)
+        _polling = self.get_wait_polling() if polling is None else polling
+        return ElementWaitFor(self, _interval, _timeout, _polling, self.is_event_driven_wait())
 
     def focus(self):
         """
@@ -87,89 +206,43 @@ class Element(Context):
         """
             Clears the text if it's a text entry element.
         """
-        try:
-            try:
-                self._selenium_element().clear()
-            except (NoSuchElementException, SeleniumStaleElementReferenceException, SeleniumInvalidElementStateException):
-                self.wait_for().visible()
-                self._selenium_element().clear()
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        self.get_retry_policy().run(self, lambda: self._selenium_element().clear())
 
     def click(self):
         """
             Clicks this element.
         """
-        try:
-            try:
-                self._selenium_element().click()
-            except (NoSuchElementException, SeleniumStaleElementReferenceException, SeleniumInvalidElementStateException):
-                self.wait_for().visible()
-                self._selenium_element().click()
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        if self.is_actionability_check():
+            self.wait_for().actionable()
+        self.get_retry_policy().run(self, lambda: self._selenium_element().click(), idempotent=False)
 
     def double_click(self):
         """
             Double click this element.
         """
-        script = """
-            var dblclickEventObj = null;
-            if (typeof window.Event == "function") {
-                dblclickEventObj = new MouseEvent('dblclick', {'bubbles': true, 'cancelable': true});
-            } else {
-                dblclickEventObj = document.createEvent("MouseEvents");
-                dblclickEventObj.initMouseEvent('dblclick', true, true, window, 0, 0, 0, 0, 0, false, false, false, false, 0, null);
-            }
-            arguments[0].dispatchEvent(dblclickEventObj);
-        """
-        try:
-            try:
-                if self.get_web_driver_info().context == WebDriverContext.SAFARI \
-                        and self.get_web_driver_info().platform == WebDriverPlatform.PC:
-                    self.get_web_driver().execute_script(script, self)
-                else:
-                    self.get_web_driver().create_action_chains().double_click(self._selenium_element()).perform()
-            except (NoSuchElementException, SeleniumStaleElementReferenceException, SeleniumInvalidElementStateException):
-                self.wait_for().visible()
-                if self.get_web_driver_info().context == WebDriverContext.SAFARI \
-                        and self.get_web_driver_info().platform == WebDriverPlatform.PC:
-                    self.get_web_driver().execute_script(script, self)
-                else:
-                    self.get_web_driver().create_action_chains().double_click(self._selenium_element()).perform()
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        def _double_click():
+            if self.get_web_driver_info().context == WebDriverContext.SAFARI \
+                    and self.get_web_driver_info().platform == WebDriverPlatform.PC:
+                self.get_web_driver().execute_registered_script("easyium.double_click", self)
+            else:
+                self.get_web_driver().create_action_chains().double_click(self._selenium_element()).perform()
+
+        if self.is_actionability_check():
+            self.wait_for().actionable()
+        self.get_retry_policy().run(self, _double_click, idempotent=False)
 
     def context_click(self):
         """
             Context click this element.
         """
-        script = """
-            var clickEventObj = null;
-            if (typeof window.Event == "function") {
-                clickEventObj = new MouseEvent('click', {'bubbles': true, 'cancelable': true, 'button': 2, 'buttons': 2});
-            } else {
-                clickEventObj = document.createEvent("MouseEvents");
-                clickEventObj.initMouseEvent('click', true, true, window, 0, 0, 0, 0, 0, false, false, false, false, 2, 2);
-            }
-            arguments[0].dispatchEvent(clickEventObj);
-        """
-        try:
-            try:
-                if self.get_web_driver_info().context == WebDriverContext.SAFARI \
-                        and self.get_web_driver_info().platform == WebDriverPlatform.PC:
-                    self.get_web_driver().execute_script(script, self)
-                else:
-                    self.get_web_driver().create_action_chains().context_click(self._selenium_element()).perform()
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().visible()
-                if self.get_web_driver_info().context == WebDriverContext.SAFARI \
-                        and self.get_web_driver_info().platform == WebDriverPlatform.PC:
-                    self.get_web_driver().execute_script(script, self)
-                else:
-                    self.get_web_driver().create_action_chains().context_click(self._selenium_element()).perform()
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        def _context_click():
+            if self.get_web_driver_info().context == WebDriverContext.SAFARI \
+                    and self.get_web_driver_info().platform == WebDriverPlatform.PC:
+                self.get_web_driver().execute_registered_script("easyium.context_click", self)
+            else:
+                self.get_web_driver().create_action_chains().context_click(self._selenium_element()).perform()
+
+        self.get_retry_policy().run(self, _context_click, idempotent=False)
 
     def send_keys(self, *value: str):
         """
@@ -193,27 +266,15 @@ class Element(Context):
             # file_input.send_keys(os.path.abspath("path/to/profilepic.gif"))
 
         """
-        try:
-            try:
-                self._selenium_element().send_keys(*value)
-            except (NoSuchElementException, SeleniumStaleElementReferenceException, SeleniumInvalidElementStateException):
-                self.wait_for().visible()
-                self._selenium_element().send_keys(*value)
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        if self.is_actionability_check():
+            self.wait_for().actionable()
+        self.get_retry_policy().run(self, lambda: self._selenium_element().send_keys(*value), idempotent=False)
 
     def submit(self):
         """
             Submits a form.
         """
-        try:
-            try:
-                self._selenium_element().submit()
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().visible()
-                self._selenium_element().submit()
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        self.get_retry_policy().run(self, lambda: self._selenium_element().submit(), idempotent=False)
 
     def get_property(self, name: str) -> str:
         """
@@ -224,14 +285,7 @@ class Element(Context):
         :Usage:
             text_length = target_element.get_property("text_length")
         """
-        try:
-            try:
-                return self._selenium_element().get_property(name)
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                return self._selenium_element().get_property(name)
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        return self.get_retry_policy().run(self, lambda: self._selenium_element().get_property(name), "exists")
 
     def get_dom_attribute(self, name: str) -> str:
         """
@@ -242,14 +296,7 @@ class Element(Context):
         :Usage:
             cls = target_element.get_dom_attribute("class")
         """
-        try:
-            try:
-                return self._selenium_element().get_dom_attribute(name)
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                return self._selenium_element().get_dom_attribute(name)
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        return self.get_retry_policy().run(self, lambda: self._selenium_element().get_dom_attribute(name), "exists")
 
     def get_attribute(self, name: str) -> Union[str, bool]:
         """
@@ -271,14 +318,7 @@ class Element(Context):
             # Check if the "active" CSS class is applied to an element.
             is_active = "active" in target_element.get_attribute("class")
         """
-        try:
-            try:
-                return self._selenium_element().get_attribute(name)
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                return self._selenium_element().get_attribute(name)
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        return self.get_retry_policy().run(self, lambda: self._selenium_element().get_attribute(name), "exists")
 
     def set_attribute(self, name: str, value: str):
         """
@@ -298,14 +338,7 @@ class Element(Context):
 
         :param property_name: the property name
         """
-        try:
-            try:
-                return self._selenium_element().value_of_css_property(property_name)
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                return self._selenium_element().value_of_css_property(property_name)
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        return self.get_retry_policy().run(self, lambda: self._selenium_element().value_of_css_property(property_name), "exists")
 
     def get_value_of_css_property(self, property_name: str) -> str:
         """
@@ -321,14 +354,7 @@ class Element(Context):
 
         :return: the location dict, {'x': x, 'y': y}
         """
-        try:
-            try:
-                return self._selenium_element().location
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                return self._selenium_element().location
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        return self.get_retry_policy().run(self, lambda: self._selenium_element().location, "exists")
 
     def get_location_in_view(self) -> dict:
         """
@@ -339,20 +365,14 @@ class Element(Context):
             this element is not visible.
         """
         context = self.get_web_driver_info().context
-        try:
-            try:
-                if context == WebDriverContext.NATIVE_APP:
-                    return self._selenium_element().location_in_view
-                else:
-                    return self._selenium_element().location_once_scrolled_into_view
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                if context == WebDriverContext.NATIVE_APP:
-                    return self._selenium_element().location_in_view
-                else:
-                    return self._selenium_element().location_once_scrolled_into_view
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+
+        def _get_location_in_view():
+            if context == WebDriverContext.NATIVE_APP:
+                return self._selenium_element().location_in_view
+            else:
+                return self._selenium_element().location_once_scrolled_into_view
+
+        return self.get_retry_policy().run(self, _get_location_in_view, "exists")
 
     def get_size(self) -> dict:
         """
@@ -360,14 +380,7 @@ class Element(Context):
 
         :return: the size dict, {'width': width, 'height': height}
         """
-        try:
-            try:
-                return self._selenium_element().size
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                return self._selenium_element().size
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        return self.get_retry_policy().run(self, lambda: self._selenium_element().size, "exists")
 
     def get_rect(self) -> dict:
         """
@@ -375,14 +388,7 @@ class Element(Context):
 
         :return: the rect dict, {'width': width, 'height': height, 'x': x, 'y': y}
         """
-        try:
-            try:
-                return self._selenium_element().rect
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                return self._selenium_element().rect
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        return self.get_retry_policy().run(self, lambda: self._selenium_element().rect, "exists")
 
     def get_center(self) -> dict:
         """
@@ -390,22 +396,53 @@ class Element(Context):
 
         :return: the location dict, {'x': x, 'y': y}
         """
-        rect = self.get_rect()
+        snapshot = self.__get_fresh_snapshot(["rect"])
+        rect = self.get_rect() if snapshot is None else snapshot.get_rect()
         return {"x": rect["x"] + rect["width"] / 2,
                 "y": rect["y"] + rect["height"] / 2}
 
+    def snapshot(self, fields: List[str] = None, ttl: int = None) -> ElementSnapshot:
+        """
+            Take a snapshot of the state of this element.
+            In web context, all the fields are fetched by one script call, otherwise they are fetched one by one.
+
+        :param fields: the fields to take, see WebDriver.fetch_many() for the possible fields.
+            If None, take "text", "tag", "rect", "displayed", "enabled" and "selected".
+        :param ttl: the time to live (in milliseconds) of the snapshot.
+            The calls of snapshot() in its ttl reuse it instead of taking a new one if it has the fields, so does get_center().
+            It is dropped when this element is refreshed. If None, the snapshot is not reused.
+        :return: the immutable snapshot
+
+        :Usage:
+            state = element.snapshot(fields=["text", "displayed", "attr:href"], ttl=1000)
+            if state.is_displayed():
+                print(state.get_text(), state.get_attribute("href"))
+        """
+        _fields = default_snapshot_fields if fields is None else fields
+        snapshot = self.__get_fresh_snapshot(_fields)
+        if snapshot is not None:
+            return snapshot
+
+        columns = self.get_web_driver().fetch_many([self], _fields)
+        snapshot = ElementSnapshot({field: column[0] for field, column in columns.items()}, ttl)
+        if ttl is not None:
+            self.__snapshot = snapshot
+            self.__snapshot_selenium_element = self._inner_selenium_element
+        return snapshot
+
+    def __get_fresh_snapshot(self, fields: List[str]) -> ElementSnapshot:
+        # the cached snapshot is dropped if this element is refreshed since it is taken
+        snapshot = self.__snapshot
+        if snapshot is None or self.__snapshot_selenium_element is not self._inner_selenium_element \
+                or not snapshot.is_fresh() or not snapshot.has_fields(fields):
+            return None
+        return snapshot
+
     def get_tag_name(self) -> str:
         """
             Gets this element's tagName property.
         """
-        try:
-            try:
-                return self._selenium_element().tag_name
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                return self._selenium_element().tag_name
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        return self.get_retry_policy().run(self, lambda: self._selenium_element().tag_name, "exists")
 
     def get_value(self) -> str:
         """
@@ -413,14 +450,7 @@ class Element(Context):
             Can be used to get the text of a text entry element.
             Text entry elements are INPUT and TEXTAREA elements.
         """
-        try:
-            try:
-                return self._selenium_element().get_attribute("value")
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                return self._selenium_element().get_attribute("value")
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        return self.get_retry_policy().run(self, lambda: self._selenium_element().get_attribute("value"), "exists")
 
     def set_value(self, value: str):
         """
@@ -429,33 +459,20 @@ class Element(Context):
         :param value: the value to be set on this element
         """
         context = self.get_web_driver_info().context
-        try:
-            try:
-                if context == WebDriverContext.NATIVE_APP:
-                    self._selenium_element().set_value(value)
-                else:
-                    self.get_web_driver().execute_script("arguments[0].setAttribute('value', '%s')" % value, self)
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                if context == WebDriverContext.NATIVE_APP:
-                    self._selenium_element().set_value(value)
-                else:
-                    self.get_web_driver().execute_script("arguments[0].setAttribute('value', '%s')" % value, self)
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+
+        def _set_value():
+            if context == WebDriverContext.NATIVE_APP:
+                self._selenium_element().set_value(value)
+            else:
+                self.get_web_driver().execute_script("arguments[0].setAttribute('value', '%s')" % value, self)
+
+        self.get_retry_policy().run(self, _set_value, "exists")
 
     def get_text(self) -> str:
         """
             Gets the text of this element(including the text of its children).
         """
-        try:
-            try:
-                return self._selenium_element().text
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                return self._selenium_element().text
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        return self.get_retry_policy().run(self, lambda: self._selenium_element().text, "exists")
 
     def set_text(self, text: str):
         """
@@ -464,20 +481,14 @@ class Element(Context):
         :param text: the text to be sent to this element
         """
         context = self.get_web_driver_info().context
-        try:
-            try:
-                if context == WebDriverContext.NATIVE_APP:
-                    self._selenium_element().set_text(text)
-                else:
-                    self.get_web_driver().execute_script("arguments[0].innerText = '%s'" % text, self)
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                if context == WebDriverContext.NATIVE_APP:
-                    self._selenium_element().set_text(text)
-                else:
-                    self.get_web_driver().execute_script("arguments[0].innerText = '%s'" % text, self)
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+
+        def _set_text():
+            if context == WebDriverContext.NATIVE_APP:
+                self._selenium_element().set_text(text)
+            else:
+                self.get_web_driver().execute_script("arguments[0].innerText = '%s'" % text, self)
+
+        self.get_retry_policy().run(self, _set_text, "exists")
 
     def get_text_node_content(self, text_node_index: int) -> str:
         """
@@ -504,73 +515,8 @@ class Element(Context):
         :param start: start position
         :param end: end position
         """
-        script = """
-            function getTextNodesIn(node) {
-                var textNodes = [];
-                if (node.nodeType == 3) {
-                    textNodes.push(node);
-                } else {
-                    var children = node.childNodes;
-                    for (var i = 0, len = children.length; i < len; ++i) {
-                        textNodes.push.apply(textNodes, getTextNodesIn(children[i]));
-                    }
-                }
-                return textNodes;
-            }
-
-            function setSelectionRange(el, start, end) {
-                if (el.tagName == 'INPUT' || el.tagName == 'TEXTAREA'){
-                    if(el.createTextRange){
-                        var Range=el.createTextRange();
-                        Range.collapse();
-                        Range.moveEnd('character',end);
-                        Range.moveStart('character',start);
-                        Range.select();
-                    }else if(el.setSelectionRange){
-                        el.focus();
-                        el.setSelectionRange(start,end);
-                    }
-                } else {
-                    if (document.createRange && window.getSelection) {
-                        var range = document.createRange();
-                        range.selectNodeContents(el);
-                        var textNodes = getTextNodesIn(el);
-                        var foundStart = false;
-                        var charCount = 0, endCharCount;
-
-                        for (var i = 0, textNode; textNode = textNodes[i++]; ) {
-                            endCharCount = charCount + textNode.length;
-                            if (!foundStart && start >= charCount
-                                    && (start < endCharCount ||
-                                    (start == endCharCount && i <= textNodes.length))) {
-                                range.setStart(textNode, start - charCount);
-                                foundStart = true;
-                            }
-                            if (foundStart && end <= endCharCount) {
-                                range.setEnd(textNode, end - charCount);
-                                break;
-                            }
-                            charCount = endCharCount;
-                        }
-
-                        var sel = window.getSelection();
-                        sel.removeAllRanges();
-                        sel.addRange(range);
-                    } else if (document.selection && document.body.createTextRange) {
-                        var textRange = document.body.createTextRange();
-                        textRange.moveToElementText(el);
-                        textRange.collapse(true);
-                        textRange.moveEnd('character', end);
-                        textRange.moveStart('character', start);
-                        textRange.select();
-                    }
-                }
-            }
-
-            setSelectionRange(arguments[0], %s, %s);
-        """
         try:
-            self.get_web_driver().execute_script(script % (start, end), self)
+            self.get_web_driver().execute_registered_script("easyium.set_selection_range", self, start, end)
         except SeleniumWebDriverException as wde:
             raise EasyiumException(wde.msg, self)
 
@@ -587,28 +533,14 @@ class Element(Context):
         """
             Returns whether the element is enabled.
         """
-        try:
-            try:
-                return self._selenium_element().is_enabled()
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().visible()
-                return self._selenium_element().is_enabled()
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        return self.get_retry_policy().run(self, lambda: self._selenium_element().is_enabled())
 
     def is_selected(self) -> bool:
         """
             Returns whether this element is selected.
             Can be used to check if a checkbox or radio button is selected.
         """
-        try:
-            try:
-                return self._selenium_element().is_selected()
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().visible()
-                return self._selenium_element().is_selected()
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        return self.get_retry_policy().run(self, lambda: self._selenium_element().is_selected())
 
     def mouse_over(self, native: bool = False):
         """
@@ -616,30 +548,13 @@ class Element(Context):
         
         :param native: use the selenium native implementation
         """
-        script = """
-            var mouseoverEventObj = null;
-            if (typeof window.Event == "function") {
-                mouseoverEventObj = new MouseEvent('mouseover', {'bubbles': true, 'cancelable': true});
-            } else {
-                mouseoverEventObj = document.createEvent("MouseEvents");
-                mouseoverEventObj.initMouseEvent('mouseover', true, true, window, 0, 0, 0, 0, 0, false, false, false, false, 0, null);
-            }
-            arguments[0].dispatchEvent(mouseoverEventObj);
-        """
-        try:
-            try:
-                if native:
-                    self.get_web_driver().create_action_chains().move_to_element(self._selenium_element()).perform()
-                else:
-                    self.get_web_driver().execute_script(script, self)
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                if native:
-                    self.get_web_driver().create_action_chains().move_to_element(self._selenium_element()).perform()
-                else:
-                    self.get_web_driver().execute_script(script, self)
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        def _mouse_over():
+            if native:
+                self.get_web_driver().create_action_chains().move_to_element(self._selenium_element()).perform()
+            else:
+                self.get_web_driver().execute_registered_script("easyium.mouse_over", self)
+
+        self.get_retry_policy().run(self, _mouse_over, "exists", idempotent=False)
 
     def mouse_out(self, native: bool = False):
         """
@@ -647,30 +562,13 @@ class Element(Context):
             
         :param native: use the selenium native implementation
         """
-        script = """
-            var mouseoutEventObj = null;
-            if (typeof window.Event == "function") {
-                mouseoutEventObj = new MouseEvent('mouseout', {'bubbles': true, 'cancelable': true});
-            } else {
-                mouseoutEventObj = document.createEvent("MouseEvents");
-                mouseoutEventObj.initMouseEvent('mouseout', true, true, window, 0, 0, 0, 0, 0, false, false, false, false, 0, null);
-            }
-            arguments[0].dispatchEvent(mouseoutEventObj);
-        """
-        try:
-            try:
-                if native:
-                    self.get_web_driver().create_action_chains().move_by_offset(-99999, -99999).perform()
-                else:
-                    self.get_web_driver().execute_script(script, self)
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                if native:
-                    self.get_web_driver().create_action_chains().move_by_offset(-99999, -99999).perform()
-                else:
-                    self.get_web_driver().execute_script(script, self)
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        def _mouse_out():
+            if native:
+                self.get_web_driver().create_action_chains().move_by_offset(-99999, -99999).perform()
+            else:
+                self.get_web_driver().execute_registered_script("easyium.mouse_out", self)
+
+        self.get_retry_policy().run(self, _mouse_out, "exists", idempotent=False)
 
     def drag_and_drop_by_offset(self, x_offset: float, y_offset: float):
         """
@@ -680,24 +578,16 @@ class Element(Context):
         :param y_offset: Y offset to drop
         """
         context = self.get_web_driver_info().context
-        try:
-            try:
-                if context == WebDriverContext.NATIVE_APP:
-                    self.get_web_driver().create_touch_action().long_press(self._selenium_element()).move_to(
-                        x=x_offset, y=y_offset).release().perform()
-                else:
-                    self.get_web_driver().create_action_chains().click_and_hold(self._selenium_element()).move_by_offset(
-                        x_offset, y_offset).release().perform()
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().visible()
-                if context == WebDriverContext.NATIVE_APP:
-                    self.get_web_driver().create_touch_action().long_press(self._selenium_element()).move_to(
-                        x=x_offset, y=y_offset).release().perform()
-                else:
-                    self.get_web_driver().create_action_chains().click_and_hold(self._selenium_element()).move_by_offset(
-                        x_offset, y_offset).release().perform()
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+
+        def _drag_and_drop_by_offset():
+            if context == WebDriverContext.NATIVE_APP:
+                self.get_web_driver().create_touch_action().long_press(self._selenium_element()).move_to(
+                    x=x_offset, y=y_offset).release().perform()
+            else:
+                self.get_web_driver().create_action_chains().click_and_hold(self._selenium_element()).move_by_offset(
+                    x_offset, y_offset).release().perform()
+
+        self.get_retry_policy().run(self, _drag_and_drop_by_offset, idempotent=False)
 
     def drag_and_drop_to(self, target_element: "Element"):
         """
@@ -706,25 +596,16 @@ class Element(Context):
         :param target_element: the target element to drop
         """
         context = self.get_web_driver_info().context
-        try:
-            try:
-                if context == WebDriverContext.NATIVE_APP:
-                    self.get_web_driver().create_touch_action().long_press(self._selenium_element()).move_to(
-                        target_element._selenium_element()).release().perform()
-                else:
-                    self.get_web_driver().create_action_chains().click_and_hold(
-                        self._selenium_element()).move_to_element(target_element._selenium_element()).release().perform()
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().visible()
-                target_element.wait_for().visible()
-                if context == WebDriverContext.NATIVE_APP:
-                    self.get_web_driver().create_touch_action().long_press(self._selenium_element()).move_to(
-                        target_element._selenium_element()).release().perform()
-                else:
-                    self.get_web_driver().create_action_chains().click_and_hold(
-                        self._selenium_element()).move_to_element(target_element._selenium_element()).release().perform()
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+
+        def _drag_and_drop_to():
+            if context == WebDriverContext.NATIVE_APP:
+                self.get_web_driver().create_touch_action().long_press(self._selenium_element()).move_to(
+                    target_element._selenium_element()).release().perform()
+            else:
+                self.get_web_driver().create_action_chains().click_and_hold(
+                    self._selenium_element()).move_to_element(target_element._selenium_element()).release().perform()
+
+        self.get_retry_policy().run(self, _drag_and_drop_to, idempotent=False, related_elements=[target_element])
 
     def drag_and_drop_to_with_offset(self, target_element: "Element", x_offset: float, y_offset: float):
         """
@@ -736,25 +617,16 @@ class Element(Context):
         :param y_offset: Y offset to drop
         """
         context = self.get_web_driver_info().context
-        try:
-            try:
-                if context == WebDriverContext.NATIVE_APP:
-                    self.get_web_driver().create_touch_action().long_press(self._selenium_element()).move_to(
-                        target_element._selenium_element(), x_offset, y_offset).release().perform()
-                else:
-                    self.get_web_driver().create_action_chains().click_and_hold(self._selenium_element()).move_to_element_with_offset(
-                        target_element._selenium_element(), x_offset, y_offset).release().perform()
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().visible()
-                target_element.wait_for().visible()
-                if context == WebDriverContext.NATIVE_APP:
-                    self.get_web_driver().create_touch_action().long_press(self._selenium_element()).move_to(
-                        target_element._selenium_element(), x_offset, y_offset).release().perform()
-                else:
-                    self.get_web_driver().create_action_chains().click_and_hold(self._selenium_element()).move_to_element_with_offset(
-                        target_element._selenium_element(), x_offset, y_offset).release().perform()
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+
+        def _drag_and_drop_to_with_offset():
+            if context == WebDriverContext.NATIVE_APP:
+                self.get_web_driver().create_touch_action().long_press(self._selenium_element()).move_to(
+                    target_element._selenium_element(), x_offset, y_offset).release().perform()
+            else:
+                self.get_web_driver().create_action_chains().click_and_hold(self._selenium_element()).move_to_element_with_offset(
+                    target_element._selenium_element(), x_offset, y_offset).release().perform()
+
+        self.get_retry_policy().run(self, _drag_and_drop_to_with_offset, idempotent=False, related_elements=[target_element])
 
     @SupportedBy(WebDriverPlatform._MOBILE)
     def multiple_tap(self, count: int = 1):
@@ -763,14 +635,8 @@ class Element(Context):
 
         :param count: how many tap actions to perform on this element.
         """
-        try:
-            try:
-                self.get_web_driver().create_touch_action().tap(self._selenium_element(), None, None, count).perform()
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().visible()
-                self.get_web_driver().create_touch_action().tap(self._selenium_element(), None, None, count).perform()
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        self.get_retry_policy().run(
+            self, lambda: self.get_web_driver().create_touch_action().tap(self._selenium_element(), None, None, count).perform(), idempotent=False)
 
     @SupportedBy(WebDriverPlatform._MOBILE)
     def tap(self):
@@ -793,14 +659,10 @@ class Element(Context):
 
         :param duration: the duration of long press lasts(in ms).
         """
-        try:
-            try:
-                self.get_web_driver().create_touch_action().long_press(self._selenium_element(), None, None, duration).release().perform()
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().visible()
-                self.get_web_driver().create_touch_action().long_press(self._selenium_element(), None, None, duration).release().perform()
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        def _long_press():
+            self.get_web_driver().create_touch_action().long_press(self._selenium_element(), None, None, duration).release().perform()
+
+        self.get_retry_policy().run(self, _long_press, idempotent=False)
 
     @SupportedBy(WebDriverPlatform._MOBILE)
     def scroll(self, direction: str):
@@ -809,48 +671,31 @@ class Element(Context):
 
         :param direction: the direction to scroll, the possible values are: up, down, left, right
         """
-        try:
-            try:
-                scroll_params = {
-                    "direction": direction,
-                    "element": self._selenium_element().id
-                }
-                self.get_web_driver().execute_script("mobile: scroll", scroll_params)
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().visible()
-                scroll_params = {
-                    "direction": direction,
-                    "element": self._selenium_element().id
-                }
-                self.get_web_driver().execute_script("mobile: scroll", scroll_params)
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        def _scroll():
+            scroll_params = {
+                "direction": direction,
+                "element": self._selenium_element().id
+            }
+            self.get_web_driver().execute_script("mobile: scroll", scroll_params)
+
+        self.get_retry_policy().run(self, _scroll, idempotent=False)
 
     def scroll_into_view(self):
         """
             Scrolls this element into view.
         """
         context = self.get_web_driver_info().context
-        try:
-            try:
-                if context == WebDriverContext.NATIVE_APP:
-                    scroll_params = {
-                        "element": self._selenium_element().id
-                    }
-                    self.get_web_driver().execute_script("mobile: scrollTo", scroll_params)
-                else:
-                    self.get_web_driver().execute_script("arguments[0].scrollIntoView();", self)
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                if context == WebDriverContext.NATIVE_APP:
-                    scroll_params = {
-                        "element": self._selenium_element().id
-                    }
-                    self.get_web_driver().execute_script("mobile: scrollTo", scroll_params)
-                else:
-                    self.get_web_driver().execute_script("arguments[0].scrollIntoView();", self)
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+
+        def _scroll_into_view():
+            if context == WebDriverContext.NATIVE_APP:
+                scroll_params = {
+                    "element": self._selenium_element().id
+                }
+                self.get_web_driver().execute_script("mobile: scrollTo", scroll_params)
+            else:
+                self.get_web_driver().execute_script("arguments[0].scrollIntoView();", self)
+
+        self.get_retry_policy().run(self, _scroll_into_view, "exists")
 
     @SupportedBy(WebDriverPlatform._MOBILE)
     def scroll_to(self, target_element: "Element", duration: int = None):
@@ -860,15 +705,10 @@ class Element(Context):
         :param target_element: the target element to be scrolled to
         :param duration: a duration after press and move to target element. Default is 600 ms for W3C spec. Zero for MJSONWP.
         """
-        try:
-            try:
-                self.get_web_driver()._selenium_web_driver().scroll(self._selenium_element(), target_element._selenium_element(), duration)
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                target_element.wait_for().exists()
-                self.get_web_driver()._selenium_web_driver().scroll(self._selenium_element(), target_element._selenium_element(), duration)
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        def _scroll_to():
+            self.get_web_driver()._selenium_web_driver().scroll(self._selenium_element(), target_element._selenium_element(), duration)
+
+        self.get_retry_policy().run(self, _scroll_to, "exists", idempotent=False, related_elements=[target_element])
 
     @SupportedBy(WebDriverPlatform._MOBILE)
     def pinch(self, percent: int = 200, steps: int = 50):
@@ -878,14 +718,8 @@ class Element(Context):
         :param percent: amount to pinch. Defaults to 200%
         :param steps: number of steps in the pinch action
         """
-        try:
-            try:
-                self.get_web_driver()._selenium_web_driver().pinch(self._selenium_element(), percent, steps)
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().visible()
-                self.get_web_driver()._selenium_web_driver().pinch(self._selenium_element(), percent, steps)
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        self.get_retry_policy().run(
+            self, lambda: self.get_web_driver()._selenium_web_driver().pinch(self._selenium_element(), percent, steps), idempotent=False)
 
     @SupportedBy(WebDriverPlatform._MOBILE)
     def zoom(self, percent: int = 200, steps: int = 50):
@@ -895,14 +729,8 @@ class Element(Context):
         :param percent: amount to zoom. Defaults to 200%
         :param steps: number of steps in the zoom action
         """
-        try:
-            try:
-                self.get_web_driver()._selenium_web_driver().zoom(self._selenium_element(), percent, steps)
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().visible()
-                self.get_web_driver()._selenium_web_driver().zoom(self._selenium_element(), percent, steps)
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        self.get_retry_policy().run(
+            self, lambda: self.get_web_driver()._selenium_web_driver().zoom(self._selenium_element(), percent, steps), idempotent=False)
 
     def get_screenshot_as_file(self, filename: str) -> bool:
         """
@@ -914,14 +742,11 @@ class Element(Context):
         :Usage:
             element.get_screenshot_as_file('/Screenshots/foo.png')
         """
-        try:
-            try:
-                return self._selenium_element().screenshot(filename)
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                return self._selenium_element().screenshot(filename)
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        artifact_sink = self.get_web_driver().get_artifact_sink()
+        if artifact_sink is not None:
+            artifact_sink.write(filename, self.get_screenshot_as_png())
+            return True
+        return self.get_retry_policy().run(self, lambda: self._selenium_element().screenshot(filename), "exists")
 
     def save_screenshot(self, filename: str) -> bool:
         """
@@ -942,14 +767,7 @@ class Element(Context):
         :Usage:
             element_png = element.get_screenshot_as_png()
         """
-        try:
-            try:
-                return self._selenium_element().screenshot_as_png
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                return self._selenium_element().screenshot_as_png
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        return self.get_retry_policy().run(self, lambda: self._selenium_element().screenshot_as_png, "exists")
 
     def get_screenshot_as_base64(self) -> str:
         """
@@ -958,14 +776,7 @@ class Element(Context):
         :Usage:
             img_b64 = element.get_screenshot_as_base64()
         """
-        try:
-            try:
-                return self._selenium_element().screenshot_as_base64
-            except (NoSuchElementException, SeleniumStaleElementReferenceException):
-                self.wait_for().exists()
-                return self._selenium_element().screenshot_as_base64
-        except SeleniumWebDriverException as wde:
-            raise EasyiumException(wde.msg, self)
+        return self.get_retry_policy().run(self, lambda: self._selenium_element().screenshot_as_base64, "exists")
 
     def is_displayed(self) -> bool:
         """
@@ -975,6 +786,7 @@ class Element(Context):
             try:
                 return self._selenium_element().is_displayed()
             except SeleniumStaleElementReferenceException:
+                self.get_web_driver()._trace_retry("stale", self)
                 self._refresh()
                 return self._selenium_element().is_displayed()
         except NoSuchElementException:
@@ -991,6 +803,7 @@ class Element(Context):
                 self._selenium_element().is_displayed()
                 return True
             except SeleniumStaleElementReferenceException:
+                self.get_web_driver()._trace_retry("stale", self)
                 self._refresh()
                 return True
         except NoSuchElementException:
@@ -13,6 +13,8 @@ class EasyiumException(Exception):
         self.msg = filter_msg_regex.sub("", msg)
         self.message = self.msg
         self.context = context
+        # the diagnostics gathered by the FailureCapture of web driver, see WebDriver.set_failure_capture()
+        self.diagnostics = None
 
     def __str__(self):
         exception_msg = ""
@@ -53,3 +55,18 @@ class InvalidLocatorException(EasyiumException):
 
 class UnsupportedOperationException(EasyiumException):
     pass
+
+
+class ExecutionException(EasyiumException):
+    def __init__(self, msg: str = None, results: list = None, errors: list = None):
+        EasyiumException.__init__(self, msg)
+        # the results of all the tasks in order, None for the failed or cancelled tasks
+        self.results = results
+        # the list of (index of task, exception)
+        self.errors = errors
+
+    def __str__(self):
+        exception_msg = self.msg
+        for index, error in self.errors:
+            exception_msg += "\n  Task <%s>: %s: %s" % (index, error.__class__.__name__, str(error).split("\n")[0])
+        return exception_msg
@@ -0,0 +1,202 @@
+import multiprocessing
+import multiprocessing.util
+import queue
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_EXCEPTION, ALL_COMPLETED
+from typing import Callable, Dict, Iterable, List, TYPE_CHECKING
+
+from .exceptions import EasyiumException, ExecutionException
+
+if TYPE_CHECKING:
+    from .web_driver import WebDriver
+
+# the web driver of current worker process
+_process_web_driver = None
+
+
+def _create_web_driver(factory: Callable, node: str) -> "WebDriver":
+    return factory() if node is None else factory(node)
+
+
+def _init_worker_process(factory: Callable, slots: "queue.Queue"):
+    global _process_web_driver
+    # the slot is held by the process until it exits
+    _process_web_driver = _create_web_driver(factory, slots.get())
+    multiprocessing.util.Finalize(_process_web_driver, _process_web_driver.quit, exitpriority=10)
+
+
+def _run_in_worker_process(function: Callable, args: tuple) -> any:
+    return function(_process_web_driver, *args)
+
+
+class WebDriverExecutor:
+    def __init__(self, factory: Callable[..., "WebDriver"], max_workers: int = 4, nodes: Dict[str, int] = None, use_processes: bool = False):
+        """
+            Create a WebDriverExecutor, it runs the functions on many web driver sessions in parallel.
+            Each worker creates its own web driver by the factory when it runs the first function, and quits it when the executor is shut down.
+
+        :param factory: the function to create a web driver. If nodes is given, it is called with the node, e.g., lambda node: Remote(node, options)
+        :param max_workers: the max number of workers, it is capped by the total sessions of nodes
+        :param nodes: the dict of grid node to the max number of concurrent sessions on it. If None, the factory is called without argument.
+        :param use_processes: whether to run the workers in processes instead of threads,
+            the factory, the functions and their arguments and results must be picklable then
+
+        :Usage:
+            def search(driver, keyword):
+                driver.get("http://www.google.com")
+                StaticElement(driver, "name=q").send_keys(keyword)
+                return driver.get_title()
+
+            with WebDriverExecutor(lambda: Chrome(), max_workers=4) as executor:
+                titles = executor.map(search, ["easyium", "selenium", "appium"])
+        """
+        self.__factory = factory
+        slot_nodes = [None] * max_workers if nodes is None else [node for node, count in nodes.items() for _ in range(count)]
+        if not slot_nodes:
+            raise ValueError("The nodes <%s> have no session slot." % nodes)
+        self.__max_workers = min(max_workers, len(slot_nodes))
+        self.__use_processes = use_processes
+        self.__cancelled = threading.Event()
+        self.__futures_lock = threading.Lock()
+        self.__futures = set()
+
+        if use_processes:
+            self.__manager = multiprocessing.Manager()
+            self.__slots = self.__manager.Queue()
+            for node in slot_nodes:
+                self.__slots.put(node)
+            self.__executor = ProcessPoolExecutor(self.__max_workers, initializer=_init_worker_process, initargs=(factory, self.__slots))
+        else:
+            self.__slots = queue.Queue()
+            for node in slot_nodes:
+                self.__slots.put(node)
+            self.__executor = ThreadPoolExecutor(self.__max_workers, thread_name_prefix="easyium-executor")
+            self.__local = threading.local()
+            self.__web_drivers_lock = threading.Lock()
+            self.__web_drivers = []  # type: List[WebDriver]
+
+    def get_max_workers(self) -> int:
+        """
+            Get the max number of workers.
+        """
+        return self.__max_workers
+
+    def submit(self, function: Callable[..., any], *args) -> Future:
+        """
+            Run the function with the web driver of a worker.
+
+        :param function: the function, it is called with the web driver and args, e.g., function(driver, *args)
+        :param args: the arguments of the function
+        :return: the future of the function's result
+        """
+        if self.__cancelled.is_set():
+            raise EasyiumException("The web driver executor is cancelled.")
+        if self.__use_processes:
+            future = self.__executor.submit(_run_in_worker_process, function, args)
+        else:
+            future = self.__executor.submit(self.__run_in_worker_thread, function, args)
+        with self.__futures_lock:
+            self.__futures.add(future)
+        future.add_done_callback(self.__discard_future)
+        return future
+
+    def map(self, function: Callable[..., any], items: Iterable[any], fail_fast: bool = False, timeout: int = None) -> List[any]:
+        """
+            Run the function for each item in parallel and collect the results in order.
+            If any function fails, ExecutionException is raised after the other functions finish,
+            it holds the results of all the functions and the errors.
+
+        :param function: the function, it is called with the web driver and the item, e.g., function(driver, item)
+        :param items: the items
+        :param fail_fast: whether to cancel the pending functions when a function fails
+        :param timeout: the max time (in milliseconds) to wait for the functions, the unfinished ones are cancelled and reported as errors
+        :return: the results of the functions
+        """
+        end_time = None if timeout is None else time.monotonic() + timeout / 1000.0
+        futures = [self.submit(function, item) for item in items]
+        done, not_done = wait(futures, None if end_time is None else max(end_time - time.monotonic(), 0), FIRST_EXCEPTION if fail_fast else ALL_COMPLETED)
+        if fail_fast and not_done and any(not future.cancelled() and future.exception() is not None for future in done):
+            for future in not_done:
+                future.cancel()
+            # the running functions are waited in the rest of timeout
+            done, not_done = wait(not_done, None if end_time is None else max(end_time - time.monotonic(), 0))
+        for future in not_done:
+            future.cancel()
+
+        results = []
+        errors = []
+        for index, future in enumerate(futures):
+            try:
+                if future in not_done and not future.cancelled():
+                    raise EasyiumException("Timed out after %s ms." % timeout)
+                results.append(future.result(0))
+            except CancelledError:
+                results.append(None)
+                errors.append((index, EasyiumException("The task is cancelled.")))
+            except Exception as e:
+                results.append(None)
+                errors.append((index, e))
+        if errors:
+            raise ExecutionException("%s of %s tasks failed." % (len(errors), len(futures)), results, errors)
+        return results
+
+    def cancel(self):
+        """
+            Cancel the pending functions and reject the new ones, the running functions are not interrupted.
+        """
+        self.__cancelled.set()
+        with self.__futures_lock:
+            futures = list(self.__futures)
+        for future in futures:
+            future.cancel()
+
+    def shutdown(self, wait: bool = True):
+        """
+            Shut down the workers and quit their web drivers.
+
+        :param wait: whether to wait for the running functions to finish
+        """
+        self.__executor.shutdown(wait=wait)
+        if self.__use_processes:
+            # the web drivers are quit by the finalizers of worker processes
+            self.__manager.shutdown()
+            return
+        with self.__web_drivers_lock:
+            web_drivers, self.__web_drivers = self.__web_drivers, []
+        for web_driver in web_drivers:
+            try:
+                web_driver.quit()
+            except Exception:
+                # the session may be broken already
+                pass
+
+    def __run_in_worker_thread(self, function: Callable, args: tuple) -> any:
+        web_driver = getattr(self.__local, "web_driver", None)
+        if web_driver is None:
+            # the slot is held by the worker thread until the executor is shut down
+            node = self.__slots.get()
+            try:
+                web_driver = _create_web_driver(self.__factory, node)
+            except Exception:
+                self.__slots.put(node)
+                raise
+            self.__local.web_driver = web_driver
+            with self.__web_drivers_lock:
+                self.__web_drivers.append(web_driver)
+        return function(web_driver, *args)
+
+    def __discard_future(self, future: Future):
+        with self.__futures_lock:
+            self.__futures.discard(future)
+
+    def __enter__(self) -> "WebDriverExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            self.cancel()
+        self.shutdown()
+
+    def __str__(self):
+        return "WebDriverExecutor <MaxWorkers: %s><UseProcesses: %s>" % (self.__max_workers, self.__use_processes)
@@ -0,0 +1,79 @@
+import time
+from typing import Callable, Dict, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .web_driver import WebDriver
+
+
+class FailureCapture:
+    def __init__(self, screenshot: bool = True, page_source: bool = True, current_url: bool = True, log_types: List[str] = ("browser",),
+                 timeout: int = 5000):
+        """
+            Create a FailureCapture, it gathers the diagnostics of the web driver when an operation finally fails,
+            e.g., a wait is timed out or an element operation fails after the retries of RetryPolicy.
+            The diagnostics are gathered one by one in the failed thread, so no command runs concurrently with the test on the session.
+            The diagnostics are attached to the raised exception as a dict "diagnostics", the keys are:
+            "screenshot" (png bytes), "page_source", "current_url", "logs" (the dict of log type to log entries),
+            "errors" (the dict of diagnostic name to the error message if it is failed or skipped) and "elapsed" (in milliseconds).
+
+        :param screenshot: whether to capture the screenshot
+        :param page_source: whether to capture the page source
+        :param current_url: whether to capture the current url
+        :param log_types: the types of logs to capture, e.g., "browser", "driver" or "logcat"
+        :param timeout: the time budget (in milliseconds) to gather the diagnostics, the ones not started in it are skipped.
+            The started one is always finished, so a slow command can exceed the budget up to the read timeout of the connection.
+
+        :Usage:
+            driver.set_failure_capture(FailureCapture(timeout=3000))
+            try:
+                StaticElement(driver, "id=submit").click()
+            except EasyiumException as e:
+                print(e.diagnostics["current_url"])
+        """
+        self.__screenshot = screenshot
+        self.__page_source = page_source
+        self.__current_url = current_url
+        self.__log_types = list(log_types)
+        self.__timeout = timeout
+
+    def capture(self, web_driver: "WebDriver") -> Dict[str, any]:
+        """
+            Gather the diagnostics of the web driver in order, the ones not started in the timeout are skipped.
+
+        :param web_driver: the web driver
+        :return: the diagnostics
+        """
+        # use selenium web driver directly, so gathering the diagnostics never triggers the retries and waits
+        selenium_web_driver = web_driver._selenium_web_driver()
+        tasks = []  # type: List[Tuple[str, Callable[[], any]]]
+        if self.__screenshot:
+            tasks.append(("screenshot", selenium_web_driver.get_screenshot_as_png))
+        if self.__page_source:
+            tasks.append(("page_source", lambda: selenium_web_driver.page_source))
+        if self.__current_url:
+            tasks.append(("current_url", lambda: selenium_web_driver.current_url))
+        for log_type in self.__log_types:
+            tasks.append(("logs.%s" % log_type, lambda _log_type=log_type: selenium_web_driver.get_log(_log_type)))
+
+        start_time = time.time()
+        diagnostics = {"logs": {}, "errors": {}}
+        for name, task in tasks:
+            # never leave a command running in background, it would run concurrently with the next commands of the test
+            if (time.time() - start_time) * 1000 >= self.__timeout:
+                diagnostics["errors"][name] = "Skipped after %s ms." % self.__timeout
+                continue
+            try:
+                value = task()
+            except Exception as e:
+                diagnostics["errors"][name] = str(e).strip() or e.__class__.__name__
+                continue
+            if name.startswith("logs."):
+                diagnostics["logs"][name[5:]] = value
+            else:
+                diagnostics[name] = value
+        diagnostics["elapsed"] = int((time.time() - start_time) * 1000)
+        return diagnostics
+
+    def __str__(self):
+        return "FailureCapture <Screenshot: %s><PageSource: %s><CurrentUrl: %s><LogTypes: %s><Timeout: %s>" % (
+            self.__screenshot, self.__page_source, self.__current_url, self.__log_types, self.__timeout)
@@ -0,0 +1,89 @@
+from typing import Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .element import Element
+
+# the fields without name
+plain_fields = ["text", "tag", "value", "rect", "displayed", "enabled", "selected"]
+
+# the fields with a name, in format "kind:name", e.g., "attr:href"
+named_fields = ["attr", "prop", "css"]
+
+# arguments: field specs [[kind, name], ...], element 1, element 2, ...
+# return: a column of values for each field
+FETCH_FIELDS_SCRIPT = """
+    var fields = arguments[0], elements = Array.prototype.slice.call(arguments, 1);
+
+    function primitive(value) {
+        return value === undefined || (value !== null && typeof value === 'object') || typeof value === 'function' ? null : value;
+    }
+
+    function fetch(el, kind, name) {
+        switch (kind) {
+            case 'text':
+                return (el.innerText === undefined ? el.textContent : el.innerText).trim();
+            case 'tag':
+                return el.tagName.toLowerCase();
+            case 'value':
+                return primitive(el.value);
+            case 'rect':
+                var rect = el.getBoundingClientRect();
+                return {x: rect.left + window.pageXOffset, y: rect.top + window.pageYOffset, width: rect.width, height: rect.height};
+            case 'displayed':
+                var style = window.getComputedStyle(el);
+                if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') return false;
+                return el.getClientRects().length > 0;
+            case 'enabled':
+                return !el.disabled;
+            case 'selected':
+                return !!(el.selected || el.checked);
+            case 'attr':
+                return el.getAttribute(name);
+            case 'prop':
+                return primitive(el[name]);
+            case 'css':
+                return window.getComputedStyle(el).getPropertyValue(name);
+        }
+    }
+
+    return fields.map(function (field) {
+        return elements.map(function (el) {
+            return fetch(el, field[0], field[1]);
+        });
+    });
+"""
+
+
+def parse_field(field: str) -> Tuple[str, str]:
+    """
+        Parse the field to [kind, name].
+
+    :param field: the field, e.g., "text", "rect" or "attr:href"
+    """
+    separator_index = field.find(":")
+    if separator_index == -1:
+        kind, name = field, None
+    else:
+        kind, name = field[:separator_index], field[separator_index + 1:]
+    if (name is None and kind not in plain_fields) or (name is not None and kind not in named_fields):
+        raise ValueError("Field <%s> is not supported, the possible fields are %s and %s." % (
+            field, plain_fields, ["%s:<name>" % kind for kind in named_fields]))
+    return kind, name
+
+
+def fetch_field_natively(element: "Element", kind: str, name: str) -> any:
+    """
+        Fetch the field of element by the element api, it is used where script is not available.
+    """
+    return {
+        "text": lambda: element.get_text(),
+        "tag": lambda: element.get_tag_name(),
+        "value": lambda: element.get_value(),
+        "rect": lambda: element.get_rect(),
+        "displayed": lambda: element.is_displayed(),
+        "enabled": lambda: element.is_enabled(),
+        "selected": lambda: element.is_selected(),
+        "attr": lambda: element.get_attribute(name),
+        "prop": lambda: element.get_property(name),
+        "css": lambda: element.get_css_value(name)
+    }[kind]()
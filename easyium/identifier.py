@@ -1,8 +1,163 @@
+import uuid
+from typing import List, Tuple, Union, TYPE_CHECKING
+
+from appium.webdriver.webelement import WebElement as AppiumElement
+from selenium.common.exceptions import JavascriptException as SeleniumJavascriptException, WebDriverException as SeleniumWebDriverException
+
+from .enumeration import WebDriverContext
+from .exceptions import EasyiumException, UnsupportedOperationException
+from .locator import Locator
+
+if TYPE_CHECKING:
+    from .context import Context
+    from .element import Element
+
+# the attribute to stamp the elements
+dom_tag_attribute = "data-easyium-id"
+
+# the prefix of the stamps, it is unique per process so the stamps of different processes never collide
+dom_tag_prefix = uuid.uuid4().hex[:8]
+
+# the stamp of an element is the prefix plus a counter of the page, an element keeps its stamp once stamped
+STAMP_FUNCTION = """
+    function stamp(el, attribute, prefix) {
+        var tag = el.getAttribute(attribute);
+        if (!tag) {
+            window.__easyiumDomTagCount = (window.__easyiumDomTagCount || 0) + 1;
+            tag = prefix + '-' + window.__easyiumDomTagCount;
+            el.setAttribute(attribute, tag);
+        }
+        return tag;
+    }
+"""
+
+# arguments: attribute, prefix, element 1, element 2, ...
+# return: the stamps of the elements
+STAMP_ELEMENTS_SCRIPT = STAMP_FUNCTION + """
+    var attribute = arguments[0], prefix = arguments[1];
+    return Array.prototype.slice.call(arguments, 2).map(function (el) {
+        return stamp(el, attribute, prefix);
+    });
+"""
+
+# arguments: context element or null for document, by name ("css" or "xpath"), value, first only, attribute, prefix
+# return: a list of [element, stamp]
+FIND_AND_STAMP_SCRIPT = STAMP_FUNCTION + """
+    var context = arguments[0] || document, byName = arguments[1], value = arguments[2], firstOnly = arguments[3],
+        attribute = arguments[4], prefix = arguments[5];
+    var found = [];
+    if (byName === 'xpath') {
+        var result = (context.ownerDocument || context).evaluate(value, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (var i = 0; i < result.snapshotLength; i++) found.push(result.snapshotItem(i));
+    } else {
+        found = Array.prototype.slice.call(context.querySelectorAll(value));
+    }
+    if (firstOnly) found = found.slice(0, 1);
+    return found.map(function (el) {
+        if (el.nodeType !== 1) throw new Error('The result of <' + byName + '=' + value + '> is not an element.');
+        return [el, stamp(el, attribute, prefix)];
+    });
+"""
+
+
+class AttributeIdentifier:
+    def __init__(self, by_name: str, attribute: str):
+        """
+            Create an identifier which generates the locator by an attribute of the element.
+            Besides identifying one element, it can identify a list of elements by one script call in web context.
+
+        :param by_name: the by name of the generated locator, e.g., "id"
+        :param attribute: the attribute of the element, e.g., "id"
+        """
+        self.__by_name = by_name
+        self.__attribute = attribute
+
+    def __call__(self, element: "Element") -> str:
+        return self.__by_name + "=" + element.get_attribute(self.__attribute)
+
+    def batch(self, elements: List["Element"]) -> List[str]:
+        """
+            Generate the locators of the elements by one fetch.
+
+        :param elements: the elements to identify
+        :return: the locators in the order of elements, None if the attribute of the element is absent
+        """
+        field = "attr:" + self.__attribute
+        values = elements[0].get_web_driver().fetch_many(elements, [field])[field]
+        return [None if value is None else self.__by_name + "=" + value for value in values]
+
+
+class DomTagIdentifier:
+    def __init__(self):
+        """
+            Create an identifier which stamps the element with a unique attribute "data-easyium-id",
+            the generated locator is a css locator of the stamp, e.g., css=[data-easyium-id="1a2b3c4d-7"].
+            The elements are stamped during the finding if the locator is a css or xpath one,
+            otherwise they are stamped by one script call when the first of them is persisted.
+            If the stamp is lost (e.g., the node is re-rendered), the element is recovered only if the original locator finds exactly one element.
+            It is only available in web context.
+        """
+        pass
+
+    def __call__(self, element: "Element") -> str:
+        return self.batch([element])[0]
+
+    def batch(self, elements: List["Element"]) -> List[str]:
+        """
+            Stamp the elements by one script call and generate their locators.
+
+        :param elements: the elements to identify
+        :return: the locators in the order of elements
+        """
+        web_driver = elements[0].get_web_driver()
+        if web_driver.get_web_driver_info().context not in WebDriverContext._WEB:
+            raise UnsupportedOperationException("Identifier.dom_tag is only available in web context.", elements[0])
+        tags = web_driver.execute_script(STAMP_ELEMENTS_SCRIPT, dom_tag_attribute, dom_tag_prefix, *elements)
+        return [self.__to_locator(tag) for tag in tags]
+
+    def _find_and_stamp(self, context: "Context", locator: Union[str, Locator], first_only: bool) -> List[Tuple[AppiumElement, str]]:
+        # find the selenium elements and stamp them by one script call
+        # return None if it is not possible, and the elements should be found by selenium
+        from .web_driver import WebDriver
+
+        _locator = Locator.of(locator)
+        if context.get_web_driver_info().context not in WebDriverContext._WEB or _locator.by_name not in ["css", "xpath"]:
+            return None
+        context_selenium_element = None if isinstance(context, WebDriver) else context._selenium_context()
+        try:
+            found = context.get_web_driver()._selenium_web_driver().execute_script(
+                FIND_AND_STAMP_SCRIPT, context_selenium_element, _locator.by_name, _locator.value, first_only, dom_tag_attribute, dom_tag_prefix)
+        except SeleniumJavascriptException:
+            # e.g., the expression is invalid, let selenium report it
+            return None
+        return [(selenium_element, self.__to_locator(tag)) for selenium_element, tag in found]
+
+    def _recover(self, parent: "Context", found_by: Union[str, Locator]) -> Tuple[AppiumElement, str]:
+        # recover the element whose stamp is lost by the original locator, then stamp it again
+        # return None if it cannot be recovered, the element at the same index may be another node, so only a single match is taken
+        try:
+            _found_by = Locator.of(found_by)
+            selenium_elements = parent._selenium_context().find_elements(_found_by.by, _found_by.value)
+            if len(selenium_elements) != 1:
+                return None
+            tag = parent.get_web_driver()._selenium_web_driver().execute_script(
+                STAMP_ELEMENTS_SCRIPT, dom_tag_attribute, dom_tag_prefix, selenium_elements[0])[0]
+        except SeleniumWebDriverException as wde:
+            raise EasyiumException(wde.msg, parent)
+        return selenium_elements[0], self.__to_locator(tag)
+
+    @staticmethod
+    def __to_locator(tag: str) -> str:
+        return 'css=[%s="%s"]' % (dom_tag_attribute, tag)
+
+
 class Identifier:
-    id = staticmethod(lambda element: "id=" + element.get_attribute("id"))
+    id = AttributeIdentifier("id", "id")
+
+    class_name = AttributeIdentifier("class", "class")
 
-    class_name = staticmethod(lambda element: "class=" + element.get_attribute("class"))
+    name = AttributeIdentifier("name", "name")
 
-    name = staticmethod(lambda element: "name=" + element.get_attribute("name"))
+    dom_tag = DomTagIdentifier()
 
     text = staticmethod(lambda element: "xpath=.//*[.='%s')]" % element.get_text())
@@ -0,0 +1,157 @@
+import struct
+import zlib
+from io import BytesIO
+from typing import BinaryIO, Tuple
+
+
+def import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("The image operations require numpy and Pillow, install them by: pip install easyium[image]")
+    return numpy
+
+
+def import_pillow_image():
+    try:
+        from PIL import Image
+    except ImportError:
+        raise ImportError("The image operations require numpy and Pillow, install them by: pip install easyium[image]")
+    return Image
+
+
+def decode_png(png: bytes) -> "numpy.ndarray":
+    """
+        Decode the png to an array in shape (height, width, 4), the channels are RGBA.
+    """
+    numpy = import_numpy()
+    Image = import_pillow_image()
+    with Image.open(BytesIO(png)) as image:
+        return numpy.asarray(image.convert("RGBA"))
+
+
+def encode_png(array: "numpy.ndarray") -> bytes:
+    """
+        Encode the array in shape (height, width, channels) to png.
+    """
+    Image = import_pillow_image()
+    output = BytesIO()
+    Image.fromarray(array).save(output, format="PNG")
+    return output.getvalue()
+
+
+def to_pixel_box(rect: dict, scale: float, width: int, height: int) -> Tuple[int, int, int, int]:
+    """
+        Convert the rect in css pixels to the box (left, top, right, bottom) in image pixels, it is clipped by the image.
+
+    :param rect: the rect dict, {'x': x, 'y': y, 'width': width, 'height': height}
+    :param scale: the image pixels per css pixel
+    :param width: the width of the image
+    :param height: the height of the image
+    :return: the box, it is empty (right <= left or bottom <= top) if the rect is out of the image
+    """
+    left = min(max(int(round(rect["x"] * scale)), 0), width)
+    top = min(max(int(round(rect["y"] * scale)), 0), height)
+    right = min(max(int(round((rect["x"] + rect["width"]) * scale)), 0), width)
+    bottom = min(max(int(round((rect["y"] + rect["height"]) * scale)), 0), height)
+    return left, top, right, bottom
+
+
+class PngWriter:
+    def __init__(self, file: BinaryIO, width: int, height: int, channels: int = 4, chunk_size: int = 65536):
+        """
+            Create a streaming png writer, the rows are compressed as soon as they are written,
+            so the memory does not grow with the height of the image.
+
+        :param file: the binary file to write
+        :param width: the width of the image
+        :param height: the height of the image
+        :param channels: 3 for RGB or 4 for RGBA
+        :param chunk_size: the size of compressed data to buffer before writing a chunk
+        """
+        if channels not in (3, 4):
+            raise ValueError("The channels <%s> is not supported, the possible values are 3 and 4." % channels)
+        self.__file = file
+        self.__width = width
+        self.__height = height
+        self.__channels = channels
+        self.__chunk_size = chunk_size
+        self.__compressor = zlib.compressobj(6)
+        self.__pending = []
+        self.__pending_size = 0
+        self.__written_rows = 0
+        # the position of the header, it is rewritten if the image is cropped
+        self.__offset = self.__file.tell() if self.__file.seekable() else None
+
+        self.__file.write(b"\x89PNG\r\n\x1a\n")
+        self.__write_chunk(b"IHDR", self.__header(height))
+
+    def get_written_rows(self) -> int:
+        return self.__written_rows
+
+    def write_rows(self, rows: "numpy.ndarray"):
+        """
+            Write the rows, the array is in shape (rows, width, channels) with dtype uint8.
+            The rows are read from the array without copying it.
+        """
+        if rows.ndim != 3 or rows.shape[1] != self.__width or rows.shape[2] != self.__channels:
+            raise ValueError("The rows in shape <%s> do not match the image <%s x %s x %s>." % (
+                rows.shape, self.__height, self.__width, self.__channels))
+        if self.__written_rows + rows.shape[0] > self.__height:
+            raise ValueError("The image has only %s rows." % self.__height)
+
+        for row in rows:
+            # filter type 0 (None) for each row
+            self.__compress(b"\x00")
+            self.__compress(memoryview(row).cast("B") if row.flags["C_CONTIGUOUS"] else row.tobytes())
+        self.__written_rows += rows.shape[0]
+
+    def close(self):
+        """
+            Finish the image. If fewer rows than the height are written, the image is cropped to the written rows,
+            it requires a seekable file.
+        """
+        if self.__written_rows < self.__height:
+            if self.__written_rows == 0:
+                raise ValueError("No row is written to the image.")
+            if self.__offset is None:
+                raise ValueError("Only %s of %s rows are written, the image cannot be cropped in an unseekable file." % (
+                    self.__written_rows, self.__height))
+        self.__append(self.__compressor.flush())
+        self.__flush_pending()
+        self.__write_chunk(b"IEND", b"")
+        if self.__written_rows < self.__height:
+            end = self.__file.tell()
+            # skip the signature, the length and the type of IHDR chunk
+            self.__file.seek(self.__offset + 16)
+            header = self.__header(self.__written_rows)
+            self.__file.write(header)
+            self.__file.write(struct.pack(">I", zlib.crc32(header, zlib.crc32(b"IHDR")) & 0xffffffff))
+            self.__file.seek(end)
+            self.__height = self.__written_rows
+
+    def __header(self, height: int) -> bytes:
+        # bit depth 8, color type 2 (RGB) or 6 (RGBA), default compression, filter and interlace
+        return struct.pack(">IIBBBBB", self.__width, height, 8, 6 if self.__channels == 4 else 2, 0, 0, 0)
+
+    def __compress(self, data):
+        self.__append(self.__compressor.compress(data))
+
+    def __append(self, compressed: bytes):
+        if compressed:
+            self.__pending.append(compressed)
+            self.__pending_size += len(compressed)
+            if self.__pending_size >= self.__chunk_size:
+                self.__flush_pending()
+
+    def __flush_pending(self):
+        if self.__pending:
+            self.__write_chunk(b"IDAT", b"".join(self.__pending))
+            self.__pending = []
+            self.__pending_size = 0
+
+    def __write_chunk(self, chunk_type: bytes, data: bytes):
+        self.__file.write(struct.pack(">I", len(data)))
+        self.__file.write(chunk_type)
+        self.__file.write(data)
+        self.__file.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(chunk_type)) & 0xffffffff))
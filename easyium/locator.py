@@ -1,4 +1,5 @@
-from typing import Tuple
+import functools
+from typing import Tuple, Union
 
 from appium.webdriver.common.mobileby import MobileBy
 from selenium.webdriver.common.by import By
@@ -25,14 +26,75 @@ locator_to_by_map = {
 }
 
 
-def locator_to_by_value(locator: str) -> Tuple[By, str]:
+class Locator:
+    __slots__ = ("__by_name", "__value")
+
+    def __init__(self, by_name: str, value: str):
+        """
+            Create a Locator. It is validated when created and it is hashable, so it can be reused and used as a key.
+            Usually you get a Locator by Locator.of("by=value"), which parses the locator string only once.
+
+        :param by_name: the name of by, the possible values are the keys of locator_to_by_map, e.g., "xpath"
+        :param value: the value of the locator
+        """
+        if by_name not in locator_to_by_map:
+            raise InvalidLocatorException("The by <%s> of locator <%s=%s> is not a valid By." % (by_name, by_name, value))
+        self.__by_name = by_name
+        self.__value = value
+
+    @staticmethod
+    def of(locator: Union[str, "Locator"]) -> "Locator":
+        """
+            Get the Locator of a locator string, the parsed Locators are cached.
+
+        :param locator: the locator string in format "by=value", or a Locator
+        :return: the Locator
+
+        :Usage:
+            SEARCH_BOX = Locator.of("name=q")
+            StaticElement(driver, SEARCH_BOX).send_keys("easyium")
+        """
+        if isinstance(locator, Locator):
+            return locator
+        return _parse_locator(locator)
+
+    @property
+    def by_name(self) -> str:
+        return self.__by_name
+
+    @property
+    def by(self) -> str:
+        return locator_to_by_map[self.__by_name]
+
+    @property
+    def value(self) -> str:
+        return self.__value
+
+    def __eq__(self, other):
+        return isinstance(other, Locator) and self.__by_name == other.__by_name and self.__value == other.__value
+
+    def __hash__(self):
+        return hash((self.__by_name, self.__value))
+
+    def __str__(self):
+        return "%s=%s" % (self.__by_name, self.__value)
+
+    def __repr__(self):
+        return "Locator.of(%r)" % str(self)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_locator(locator: str) -> Locator:
     separator_index = locator.find("=")
     if separator_index == -1:
         raise InvalidLocatorException("Separator '=' is not found.")
     by = locator[:separator_index]
     value = locator[separator_index + 1:]
-    try:
-        by = locator_to_by_map[by]
-    except KeyError:
+    if by not in locator_to_by_map:
         raise InvalidLocatorException("The by <%s> of locator <%s> is not a valid By." % (by, locator))
-    return by, value
+    return Locator(by, value)
+
+
+def locator_to_by_value(locator: Union[str, Locator]) -> Tuple[By, str]:
+    locator = Locator.of(locator)
+    return locator.by, locator.value
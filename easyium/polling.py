@@ -0,0 +1,71 @@
+import random
+from typing import Iterator
+
+
+class PollingStrategy:
+    def intervals(self, interval: int) -> Iterator[float]:
+        """
+            Generate the sleep durations between two polls.
+
+        :param interval: the wait interval (in milliseconds) of the waiter
+        :return: the iterator of sleep durations (in milliseconds)
+        """
+        pass
+
+
+class FixedInterval(PollingStrategy):
+    def __init__(self, interval: int = None):
+        """
+            Create a polling strategy which sleeps a fixed interval between two polls.
+
+        :param interval: the fixed interval (in milliseconds). If None, use the wait interval of the waiter.
+        """
+        self.__interval = interval
+
+    def intervals(self, interval: int) -> Iterator[float]:
+        _interval = interval if self.__interval is None else self.__interval
+        while True:
+            yield _interval
+
+    def __str__(self):
+        return "FixedInterval <Interval: %s>" % self.__interval
+
+
+class ExponentialBackoff(PollingStrategy):
+    def __init__(self, initial: int = 50, factor: float = 2.0, max_interval: int = None, jitter: float = 0.2, burst: int = 3):
+        """
+            Create a polling strategy which polls fast at first and backs off exponentially.
+
+        :param initial: the first sleep duration (in milliseconds)
+        :param factor: the multiplier applied to the sleep duration after each poll
+        :param max_interval: the cap of the sleep duration (in milliseconds). If None, use the wait interval of the waiter.
+        :param jitter: the random spread applied to each sleep duration, e.g., 0.2 means +/- 20%
+        :param burst: how many polls are done with the initial sleep duration before backing off
+
+        :Usage:
+            # poll at 50, 50, 50, 100, 200, 400, 800, 1000, 1000... ms
+            driver.set_wait_polling(ExponentialBackoff(initial=50, max_interval=1000, jitter=0))
+        """
+        self.__initial = initial
+        self.__factor = factor
+        self.__max_interval = max_interval
+        self.__jitter = jitter
+        self.__burst = burst
+
+    def intervals(self, interval: int) -> Iterator[float]:
+        max_interval = interval if self.__max_interval is None else self.__max_interval
+        for _ in range(self.__burst):
+            yield self.__spread(min(self.__initial, max_interval))
+        delay = self.__initial
+        while True:
+            delay = min(delay * self.__factor, max_interval)
+            yield self.__spread(delay)
+
+    def __spread(self, delay: float) -> float:
+        if self.__jitter <= 0:
+            return delay
+        return max(0.0, delay * random.uniform(1 - self.__jitter, 1 + self.__jitter))
+
+    def __str__(self):
+        return "ExponentialBackoff <Initial: %s><Factor: %s><MaxInterval: %s><Jitter: %s><Burst: %s>" % (
+            self.__initial, self.__factor, self.__max_interval, self.__jitter, self.__burst)
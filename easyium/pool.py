@@ -0,0 +1,264 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, TYPE_CHECKING
+
+from .enumeration import WebDriverContext
+from .exceptions import EasyiumException, TimeoutException
+
+if TYPE_CHECKING:
+    from .web_driver import WebDriver
+
+# clear the storages of current origin, it does not throw on the pages without storage (e.g., about:blank)
+CLEAR_STORAGE_SCRIPT = """
+    try { window.localStorage.clear(); } catch (e) {}
+    try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+def reset_web_driver(web_driver: "WebDriver"):
+    """
+        The default reset of WebDriverPool, it is fast enough to run between tests.
+        In web context: close the extra windows, switch to default content, delete the cookies,
+        clear the local and session storage of current origin and load about:blank.
+        In native context, nothing is reset.
+
+    :param web_driver: the web driver to reset
+    """
+    if web_driver.get_web_driver_info().context not in WebDriverContext._WEB:
+        return
+    window_handles = web_driver.get_window_handles()
+    for window_handle in window_handles[1:]:
+        web_driver.switch_to_window(window_handle)
+        web_driver.close_window()
+    web_driver.switch_to_window(window_handles[0])
+    web_driver.switch_to_default_content()
+    web_driver.delete_all_cookies()
+    # the storages belong to the origin, so clear them before leaving the page
+    web_driver.execute_script(CLEAR_STORAGE_SCRIPT)
+    web_driver.get("about:blank")
+
+
+def check_web_driver(web_driver: "WebDriver") -> bool:
+    """
+        The default health check of WebDriverPool, the session is healthy if it responds to a command.
+
+    :param web_driver: the web driver to check
+    """
+    web_driver.get_window_size()
+    return True
+
+
+class WebDriverPool:
+    def __init__(self, factory: Callable[[], "WebDriver"], size: int, prewarm: bool = True,
+                 reset: Callable[["WebDriver"], None] = reset_web_driver, health_check: Callable[["WebDriver"], bool] = check_web_driver):
+        """
+            Create a WebDriverPool, it keeps the warm web driver sessions and hands them out to the tests,
+            so the tests do not pay for starting the browser or device session.
+            A session is reset when it is returned, it is evicted and replaced if the reset or health check fails.
+
+        :param factory: the function to create a web driver, e.g., lambda: Chrome(options=options)
+        :param size: the max number of the sessions
+        :param prewarm: whether to create all the sessions concurrently when creating the pool, and replace the evicted ones in background.
+            If False, the sessions are created on demand.
+        :param reset: the function to reset a returned session, see reset_web_driver()
+        :param health_check: the function to check a returned session after reset, it returns False or raises an exception if the session is broken
+
+        :Usage:
+            pool = WebDriverPool(lambda: Chrome(), size=4)
+            with pool.session() as driver:
+                driver.get("http://www.google.com")
+            pool.close()
+        """
+        if size < 1:
+            raise ValueError("The size <%s> of web driver pool is less than 1." % size)
+        self.__factory = factory
+        self.__size = size
+        self.__prewarm = prewarm
+        self.__reset = reset
+        self.__health_check = health_check
+        self.__condition = threading.Condition()
+        self.__idle = deque()
+        self.__leased = set()
+        # the number of sessions which are created or being created
+        self.__total = 0
+        self.__closed = False
+
+        if prewarm:
+            self.__prewarm_sessions()
+
+    def __prewarm_sessions(self):
+        with self.__condition:
+            self.__total = self.__size
+        errors = []
+        threads = [threading.Thread(target=self.__create_idle_session, args=(errors,), daemon=True) for _ in range(self.__size)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            self.close()
+            raise errors[0]
+
+    def __create_idle_session(self, errors: List[Exception] = None):
+        try:
+            web_driver = self.__factory()
+        except Exception as e:
+            with self.__condition:
+                self.__total -= 1
+                self.__condition.notify()
+            if errors is not None:
+                errors.append(e)
+            return
+        with self.__condition:
+            if self.__closed:
+                self.__total -= 1
+                quit_web_driver = True
+            else:
+                self.__idle.append(web_driver)
+                self.__condition.notify()
+                quit_web_driver = False
+        if quit_web_driver:
+            self.__quit(web_driver)
+
+    def acquire(self, timeout: int = None) -> "WebDriver":
+        """
+            Take a session from this pool, it is created if there is no idle session and the pool is not full.
+            The session must be returned by release(), session() is preferred.
+
+        :param timeout: the max time (in milliseconds) to wait for an idle session. If None, wait forever.
+        :return: the web driver
+        """
+        end_time = None if timeout is None else time.time() + timeout / 1000.0
+        with self.__condition:
+            while True:
+                if self.__closed:
+                    raise EasyiumException("The web driver pool is closed.")
+                if self.__idle:
+                    web_driver = self.__idle.popleft()
+                    self.__leased.add(web_driver)
+                    return web_driver
+                if self.__total < self.__size:
+                    self.__total += 1
+                    break
+                rest_time = None if end_time is None else end_time - time.time()
+                if rest_time is not None and rest_time <= 0:
+                    raise TimeoutException("Timed out waiting for an idle web driver in pool <%s>." % self)
+                self.__condition.wait(rest_time)
+
+        # create the session out of lock, it takes seconds
+        try:
+            web_driver = self.__factory()
+        except Exception:
+            with self.__condition:
+                self.__total -= 1
+                self.__condition.notify()
+            raise
+        with self.__condition:
+            self.__leased.add(web_driver)
+        return web_driver
+
+    def release(self, web_driver: "WebDriver"):
+        """
+            Return the session to this pool, it is reset and checked before it is handed out again.
+
+        :param web_driver: the web driver taken by acquire()
+        """
+        with self.__condition:
+            if web_driver not in self.__leased:
+                raise ValueError("The web driver <%s> is not taken from this pool." % web_driver)
+
+        healthy = False
+        if not self.__closed:
+            try:
+                # a broken session is replaced, the failures are not captured
+                with web_driver._expect_failures():
+                    self.__reset(web_driver)
+                    healthy = self.__health_check(web_driver) is not False
+            except Exception:
+                healthy = False
+
+        with self.__condition:
+            self.__leased.discard(web_driver)
+            if healthy and not self.__closed:
+                self.__idle.append(web_driver)
+                self.__condition.notify()
+                return
+            self.__total -= 1
+            replace = self.__prewarm and not self.__closed
+            if replace:
+                self.__total += 1
+            else:
+                self.__condition.notify()
+
+        self.__quit(web_driver)
+        if replace:
+            threading.Thread(target=self.__create_idle_session, daemon=True).start()
+
+    @contextmanager
+    def session(self, timeout: int = None) -> Iterator["WebDriver"]:
+        """
+            Take a session from this pool and return it when the block exits.
+
+        :param timeout: the max time (in milliseconds) to wait for an idle session. If None, wait forever.
+
+        :Usage:
+            with pool.session() as driver:
+                driver.get("http://www.google.com")
+        """
+        web_driver = self.acquire(timeout)
+        try:
+            yield web_driver
+        finally:
+            self.release(web_driver)
+
+    def get_size(self) -> int:
+        """
+            Get the max number of the sessions.
+        """
+        return self.__size
+
+    def get_idle_count(self) -> int:
+        """
+            Get the number of the idle sessions.
+        """
+        with self.__condition:
+            return len(self.__idle)
+
+    def get_leased_count(self) -> int:
+        """
+            Get the number of the sessions taken by acquire() and not returned.
+        """
+        with self.__condition:
+            return len(self.__leased)
+
+    def close(self):
+        """
+            Quit the idle sessions, the leased sessions are quit when they are returned.
+        """
+        with self.__condition:
+            self.__closed = True
+            idle = list(self.__idle)
+            self.__idle.clear()
+            self.__total -= len(idle)
+            self.__condition.notify_all()
+        for web_driver in idle:
+            self.__quit(web_driver)
+
+    @staticmethod
+    def __quit(web_driver: "WebDriver"):
+        try:
+            web_driver.quit()
+        except Exception:
+            # the session may be broken already
+            pass
+
+    def __enter__(self) -> "WebDriverPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __str__(self):
+        return "WebDriverPool <Size: %s><Idle: %s><Leased: %s>" % (self.__size, self.get_idle_count(), self.get_leased_count())
@@ -0,0 +1,116 @@
+from typing import List, TYPE_CHECKING
+
+from selenium.common.exceptions import WebDriverException as SeleniumWebDriverException
+
+from .enumeration import WebDriverContext
+from .locator import Locator
+
+if TYPE_CHECKING:
+    from .element import Element
+    from .static_element import StaticElement
+
+# the locator by names which can be resolved in browser
+in_browser_by_names = ["css", "xpath", "id", "name", "tag"]
+
+# arguments: a list of chains, each chain is [root element or null for document, [[by name, value], ...]]
+# return: a list of found element lists, each list stops at the first level which is not found
+RESOLVE_CHAINS_SCRIPT = """
+    function quote(value) {
+        return window.CSS && window.CSS.escape ? '"' + window.CSS.escape(value) + '"' : JSON.stringify(value);
+    }
+
+    function find(context, byName, value) {
+        var node = null;
+        if (byName === 'xpath') {
+            node = (context.ownerDocument || context).evaluate(value, context, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        } else if (byName === 'tag') {
+            node = context.getElementsByTagName(value)[0] || null;
+        } else if (byName === 'id' || byName === 'name') {
+            node = context.querySelector('[' + byName + '=' + quote(value) + ']');
+        } else {
+            node = context.querySelector(value);
+        }
+        if (node !== null && node.nodeType !== 1) throw new Error('The result of <' + byName + '=' + value + '> is not an element.');
+        return node;
+    }
+
+    return arguments[0].map(function (chain) {
+        var context = chain[0] || document, found = [];
+        for (var i = 0; i < chain[1].length; i++) {
+            context = find(context, chain[1][i][0], chain[1][i][1]);
+            if (context === null) break;
+            found.push(context);
+        }
+        return found;
+    });
+"""
+
+
+def _get_chain(element: "StaticElement") -> List["StaticElement"]:
+    # the StaticElements from element up to the last ancestor which can be resolved in browser, leaf first
+    from .static_element import StaticElement
+
+    chain = []
+    context = element
+    while isinstance(context, StaticElement) and Locator.of(context._locator).by_name in in_browser_by_names:
+        chain.append(context)
+        context = context.get_parent()
+    return chain
+
+
+def is_resolvable_in_browser(element: "Element") -> bool:
+    """
+        Whether the element and its StaticElement ancestors can be resolved in browser by one script call.
+        It is True only if the element is a StaticElement in web context and at least its parent is resolved together.
+    """
+    from .static_element import StaticElement
+
+    return isinstance(element, StaticElement) \
+        and element.get_web_driver_info().context in WebDriverContext._WEB \
+        and len(_get_chain(element)) >= 2
+
+
+def is_batch_resolvable_in_browser(element: "Element") -> bool:
+    """
+        Whether the element can be resolved together with others by resolve_in_browser().
+        It is True if the element is a StaticElement in web context whose locator can be resolved in browser.
+    """
+    from .static_element import StaticElement
+
+    return isinstance(element, StaticElement) \
+        and element.get_web_driver_info().context in WebDriverContext._WEB \
+        and len(_get_chain(element)) >= 1
+
+
+def resolve_in_browser(elements: List["StaticElement"]) -> List["StaticElement"]:
+    """
+        Resolve the elements and their StaticElement ancestors by one script call.
+        The found elements and ancestors cache their selenium elements.
+        All the elements must be resolvable in browser, see is_resolvable_in_browser().
+
+    :param elements: the elements to resolve
+    :return: the first level which is not found for each element (None if the element is found),
+        or None if the script failed and the elements should be resolved level by level.
+    """
+    from .web_driver import WebDriver
+
+    chains = []
+    script_args = []
+    for element in elements:
+        chain = list(reversed(_get_chain(element)))
+        root = chain[0].get_parent()
+        root_selenium_element = None if isinstance(root, WebDriver) else root._selenium_context()
+        chains.append(chain)
+        script_args.append([root_selenium_element, [[Locator.of(level._locator).by_name, Locator.of(level._locator).value] for level in chain]])
+
+    try:
+        found_lists = elements[0].get_web_driver()._selenium_web_driver().execute_script(RESOLVE_CHAINS_SCRIPT, script_args)
+    except SeleniumWebDriverException:
+        return None
+
+    missing_levels = []
+    for chain, found in zip(chains, found_lists):
+        for level, selenium_element in zip(chain, found):
+            level._inner_selenium_element = selenium_element
+        missing_levels.append(chain[len(found)] if len(found) < len(chain) else None)
+    return missing_levels
@@ -0,0 +1,167 @@
+import socket
+import threading
+import time
+from typing import Callable, Dict, List, TypeVar, TYPE_CHECKING
+
+from selenium.common.exceptions import WebDriverException as SeleniumWebDriverException, StaleElementReferenceException as SeleniumStaleElementReferenceException, \
+    InvalidElementStateException as SeleniumInvalidElementStateException, ElementClickInterceptedException as SeleniumElementClickInterceptedException
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+
+from .deadline import Deadline
+from .exceptions import EasyiumException, NoSuchElementException
+
+if TYPE_CHECKING:
+    from .element import Element
+
+T = TypeVar("T")
+
+# the errors raised when the connection to the web driver server fails
+transport_errors = (Urllib3HTTPError, ConnectionError, socket.timeout)
+
+
+class RetryPolicy:
+    def __init__(self, stale_retries: int = 2, wait_retries: int = 1, transport_retries: int = 2, transport_backoff: int = 200):
+        """
+            Create a RetryPolicy, it decides how an element operation recovers from the errors:
+            a stale element is refreshed, a missing element is waited to be existing or visible,
+            a not interactable element is waited to be actionable, and a failed connection is retried with backoff for the idempotent operations.
+
+        :param stale_retries: how many times to refresh the element and retry when it is stale
+        :param wait_retries: how many times to wait for the element and retry when it is missing or not interactable
+        :param transport_retries: how many times to retry an idempotent operation when the connection to the web driver server fails
+        :param transport_backoff: the sleep (in milliseconds) before the first transport retry, it is doubled for each next one
+        """
+        self.__stale_retries = stale_retries
+        self.__wait_retries = wait_retries
+        self.__transport_retries = transport_retries
+        self.__transport_backoff = transport_backoff
+        self.__stats_lock = threading.Lock()
+        self.__stats = self.__empty_stats()
+
+    def get_stale_retries(self) -> int:
+        return self.__stale_retries
+
+    def get_wait_retries(self) -> int:
+        return self.__wait_retries
+
+    def get_transport_retries(self) -> int:
+        return self.__transport_retries
+
+    def get_transport_backoff(self) -> int:
+        return self.__transport_backoff
+
+    @staticmethod
+    def classify(exception: BaseException) -> str:
+        """
+            Classify the error raised by an element operation.
+
+        :param exception: the error
+        :return: "stale", "missing", "not_interactable" or "transport" for the recoverable errors, None for the others
+        """
+        if isinstance(exception, SeleniumStaleElementReferenceException):
+            return "stale"
+        if isinstance(exception, NoSuchElementException):
+            return "missing"
+        if isinstance(exception, (SeleniumInvalidElementStateException, SeleniumElementClickInterceptedException)):
+            return "not_interactable"
+        if isinstance(exception, transport_errors):
+            return "transport"
+        return None
+
+    def run(self, element: "Element", operation: Callable[[], T], until: str = "visible", idempotent: bool = True,
+            related_elements: List["Element"] = ()) -> T:
+        """
+            Run the element operation with this policy.
+
+        :param element: the element to operate
+        :param operation: the operation
+        :param until: the condition to wait for the missing element before retrying, "visible" or "exists"
+        :param idempotent: whether the operation can be retried after a failed connection
+        :param related_elements: the other elements used by the operation, e.g., the target element of drag and drop
+        :return: the result of the operation
+        """
+        self._increase("calls")
+        elements = [element] + list(related_elements)
+        stale_retries = wait_retries = transport_retries = 0
+        while True:
+            try:
+                return operation()
+            except (SeleniumWebDriverException, NoSuchElementException) + transport_errors as e:
+                error, kind = e, self.classify(e)
+
+            if kind is None:
+                self._increase("failures")
+                raise element.get_web_driver()._capture_failure(EasyiumException(error.msg, element))
+
+            if kind == "stale":
+                if stale_retries >= self.__stale_retries:
+                    self._increase("failures")
+                    raise element.get_web_driver()._capture_failure(EasyiumException(error.msg, element))
+                stale_retries += 1
+                self._increase("stale_retries")
+                element.get_web_driver()._trace_retry("stale", element)
+                try:
+                    # a stale reference only needs a refresh
+                    for _element in elements:
+                        _element._refresh()
+                    continue
+                except NoSuchElementException as e:
+                    error, kind = e, "missing"
+
+            if kind in ("missing", "not_interactable"):
+                if wait_retries >= self.__wait_retries:
+                    self._increase("failures")
+                    raise element.get_web_driver()._capture_failure(error if isinstance(error, EasyiumException) else EasyiumException(error.msg, element))
+                wait_retries += 1
+                self._increase("wait_retries")
+                element.get_web_driver()._trace_retry(kind, element)
+                for _element in elements:
+                    if kind == "not_interactable" and _element is element:
+                        # a covered or disabled element is visible already
+                        _element.wait_for().actionable()
+                    elif kind == "missing" and until == "exists":
+                        _element.wait_for().exists()
+                    else:
+                        _element.wait_for().visible()
+                continue
+
+            # kind == "transport"
+            if not idempotent or transport_retries >= self.__transport_retries:
+                self._increase("failures")
+                raise error
+            backoff = self.__transport_backoff * 2 ** transport_retries
+            transport_retries += 1
+            self._increase("transport_retries")
+            element.get_web_driver()._trace_retry("transport", element)
+            deadline = Deadline.current()
+            if deadline is not None:
+                backoff = min(backoff, max(deadline.get_rest_timeout(), 0))
+            time.sleep(backoff / 1000.0)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+            Get the counters of this policy, they are shared by all the elements using it.
+
+        :return: the counters, the keys are "calls", "stale_retries", "wait_retries", "transport_retries" and "failures"
+        """
+        with self.__stats_lock:
+            return dict(self.__stats)
+
+    def reset_stats(self):
+        """
+            Reset the counters of this policy.
+        """
+        with self.__stats_lock:
+            self.__stats = self.__empty_stats()
+
+    def _increase(self, name: str):
+        with self.__stats_lock:
+            self.__stats[name] += 1
+
+    @staticmethod
+    def __empty_stats() -> Dict[str, int]:
+        return {"calls": 0, "stale_retries": 0, "wait_retries": 0, "transport_retries": 0, "failures": 0}
+
+    def __str__(self):
+        return "RetryPolicy <StaleRetries: %s><WaitRetries: %s><TransportRetries: %s><TransportBackoff: %s>" % (
+            self.__stale_retries, self.__wait_retries, self.__transport_retries, self.__transport_backoff)
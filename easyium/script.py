@@ -0,0 +1,104 @@
+import hashlib
+import json
+import threading
+from typing import Dict
+
+# the hidden global to hold the installed scripts in browser
+SCRIPT_HOLDER = "__easyium__"
+
+# the value returned by a stub if the script is not installed in current document
+SCRIPT_MISSING = "__easyium_script_missing__"
+
+# %s: holder, key, holder, holder, key, body, holder, key
+INSTALL_SCRIPT_TEMPLATE = """
+    if (!window.%s) Object.defineProperty(window, %s, {value: {}, enumerable: false, configurable: true, writable: false});
+    window.%s[%s] = function () {
+%s
+    };
+    return window.%s[%s].apply(this, arguments);
+"""
+
+# %s: holder, holder, key, missing
+STUB_SCRIPT_TEMPLATE = "var f = window.%s && window.%s[%s]; return f ? f.apply(this, arguments) : %s;"
+
+# %s: holder, holder, key, missing
+ASYNC_STUB_SCRIPT_TEMPLATE = "var f = window.%s && window.%s[%s]; return f ? f.apply(this, arguments) : arguments[arguments.length - 1](%s);"
+
+
+class RegisteredScript:
+    def __init__(self, name: str, body: str):
+        """
+            A script registered in ScriptRegistry, it is installed as a named function on a hidden global of the document.
+
+        :param name: the name of the script
+        :param body: the body of the script, it reads the arguments by "arguments" like the script for execute_script()
+        """
+        self.name = name
+        self.body = body
+        # the version is the hash of body, so a changed script never reuses the installed one
+        self.version = hashlib.sha1(body.encode("utf-8")).hexdigest()[:10]
+        self.key = "%s@%s" % (name, self.version)
+
+        holder, key, missing = json.dumps(SCRIPT_HOLDER), json.dumps(self.key), json.dumps(SCRIPT_MISSING)
+        self.install_script = INSTALL_SCRIPT_TEMPLATE % (SCRIPT_HOLDER, holder, SCRIPT_HOLDER, key, body, SCRIPT_HOLDER, key)
+        self.stub_script = STUB_SCRIPT_TEMPLATE % (SCRIPT_HOLDER, SCRIPT_HOLDER, key, missing)
+        self.async_stub_script = ASYNC_STUB_SCRIPT_TEMPLATE % (SCRIPT_HOLDER, SCRIPT_HOLDER, key, missing)
+
+    def __str__(self):
+        return "RegisteredScript <Name: %s><Version: %s>" % (self.name, self.version)
+
+
+class ScriptRegistry:
+    def __init__(self):
+        """
+            The registry of the scripts which are executed repeatedly.
+            A registered script is sent to browser only once per document, the later calls send a short stub to invoke it.
+            If the document is changed (e.g., navigated), the script is installed again automatically.
+        """
+        self.__scripts = {}  # type: Dict[str, RegisteredScript]
+        self.__lock = threading.Lock()
+
+    def register(self, name: str, body: str) -> RegisteredScript:
+        """
+            Register a script. Registering a name again replaces the script.
+
+        :param name: the name of the script
+        :param body: the body of the script
+        :return: the registered script
+        """
+        script = RegisteredScript(name, body)
+        with self.__lock:
+            self.__scripts[name] = script
+        return script
+
+    def get(self, name: str) -> RegisteredScript:
+        """
+            Get a registered script.
+
+        :param name: the name of the script
+        :return: the registered script
+        """
+        try:
+            return self.__scripts[name]
+        except KeyError:
+            raise KeyError("Script <%s> is not registered." % name)
+
+    def has(self, name: str) -> bool:
+        """
+            Whether the script is registered.
+        """
+        return name in self.__scripts
+
+    def get_versions(self) -> Dict[str, str]:
+        """
+            Get the versions of all the registered scripts.
+
+        :return: the dict of name to version
+        """
+        with self.__lock:
+            return {name: script.version for name, script in self.__scripts.items()}
+
+
+# the registry shared by all the web drivers, the helper scripts of easyium are registered here
+script_registry = ScriptRegistry()
+
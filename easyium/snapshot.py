@@ -0,0 +1,93 @@
+import time
+from typing import Dict, List, Union
+
+# the fields of a snapshot by default
+default_snapshot_fields = ["text", "tag", "rect", "displayed", "enabled", "selected"]
+
+
+class ElementSnapshot:
+    __slots__ = ("__values", "__ttl", "__taken_time")
+
+    def __init__(self, values: Dict[str, any], ttl: int = None):
+        """
+            The immutable state of an element at the moment it is taken, see Element.snapshot().
+
+        :param values: the values of the fields, see WebDriver.fetch_many() for the possible fields
+        :param ttl: the time to live (in milliseconds). If None, the snapshot is never fresh for reusing.
+        """
+        self.__values = dict(values)
+        self.__ttl = ttl
+        self.__taken_time = time.monotonic() * 1000.0
+
+    def get(self, field: str) -> any:
+        """
+            Get the value of a field.
+
+        :param field: the field taken, e.g., "text" or "attr:href"
+        :return: the value of the field
+        """
+        try:
+            return self.__values[field]
+        except KeyError:
+            raise KeyError("Field <%s> is not in snapshot, the fields are %s." % (field, list(self.__values)))
+
+    def get_fields(self) -> List[str]:
+        """
+            Get the fields of this snapshot.
+        """
+        return list(self.__values)
+
+    def has_fields(self, fields: List[str]) -> bool:
+        """
+            Whether this snapshot has all the fields.
+        """
+        return all(field in self.__values for field in fields)
+
+    def get_age(self) -> float:
+        """
+            Get the time passed since this snapshot is taken.
+
+        :return: the age (in milliseconds)
+        """
+        return time.monotonic() * 1000.0 - self.__taken_time
+
+    def is_fresh(self) -> bool:
+        """
+            Whether this snapshot is still in its time to live.
+        """
+        return self.__ttl is not None and self.get_age() <= self.__ttl
+
+    def get_text(self) -> str:
+        return self.get("text")
+
+    def get_tag_name(self) -> str:
+        return self.get("tag")
+
+    def get_value(self) -> str:
+        return self.get("value")
+
+    def get_rect(self) -> dict:
+        return self.get("rect")
+
+    def is_displayed(self) -> bool:
+        return self.get("displayed")
+
+    def is_enabled(self) -> bool:
+        return self.get("enabled")
+
+    def is_selected(self) -> bool:
+        return self.get("selected")
+
+    def get_attribute(self, name: str) -> Union[str, None]:
+        return self.get("attr:" + name)
+
+    def __getitem__(self, field: str) -> any:
+        return self.get(field)
+
+    def __setattr__(self, name, value):
+        if hasattr(self, "_ElementSnapshot__taken_time"):
+            raise AttributeError("ElementSnapshot is immutable.")
+        object.__setattr__(self, name, value)
+
+    def __str__(self):
+        return "ElementSnapshot <Age: %s><TTL: %s><Values: %s>" % (self.get_age(), self.__ttl, self.__values)
@@ -1,16 +1,21 @@
+from typing import Union
+
 from .context import Context
 from .element import Element
+from .exceptions import NoSuchElementException
+from .locator import Locator
+from .resolver import is_resolvable_in_browser, resolve_in_browser
 
 
 class StaticElement(Element):
-    def __init__(self, parent: Context, locator: str):
+    def __init__(self, parent: Context, locator: Union[str, Locator]):
         """
             Creates a new instance of the StaticElement.
 
         :param parent: the parent context
         :param locator:
             the locator of this element (relative to parent context).
-            The format of locator is: "by=value", the possible values of "by" are::
+            It is a Locator or a string in format "by=value", the possible values of "by" are::
 
                 "id": By.ID
                 "xpath": By.XPATH
@@ -32,10 +37,17 @@ class StaticElement(Element):
         Element.__init__(self, parent)
         # from element
         self._inner_selenium_element = None
-        self._locator = locator
+        self._locator = Locator.of(locator)
 
     def _refresh(self):
         self._inner_selenium_element = None
+        if is_resolvable_in_browser(self):
+            # resolve the whole chain of StaticElements by one script call
+            missing_levels = resolve_in_browser([self])
+            if missing_levels is not None:
+                if missing_levels[0] is not None:
+                    raise NoSuchElementException("Cannot find element by <%s> under:" % missing_levels[0]._locator, missing_levels[0].get_parent())
+                return
         self._inner_selenium_element = self.get_parent()._find_selenium_element(self._locator)
 
     def persist(self):
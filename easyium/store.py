@@ -0,0 +1,185 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Union
+
+from .artifact import ArtifactSink
+
+
+class ArtifactStore:
+    def __init__(self, root: str, artifact_sink: ArtifactSink = None, index_name: str = "index.jsonl"):
+        """
+            Create an ArtifactStore, it is a content-addressed store for the artifacts (e.g., screenshots and page sources).
+            An artifact is saved as "<root>/objects/<first 2 chars of digest>/<digest>.<extension>",
+            the same content is saved only once even across the runs. The index file maps the test steps to the digests.
+
+        :param root: the root directory of the store, it can be shared by the runs
+        :param artifact_sink: the artifact sink to write the new objects asynchronously. If None, the objects are written synchronously.
+        :param index_name: the name of the index file under root, each line is a json object {"step", "digest", "extension", "size", "time"}
+
+        :Usage:
+            store = ArtifactStore('/Artifacts')
+            driver.store_screenshot(store, 'test_login/submit')
+            driver.store_page_source(store, 'test_login/submit')
+            print(store.find('test_login/submit'))
+        """
+        self.__root = root
+        self.__artifact_sink = artifact_sink
+        self.__index_path = os.path.join(root, index_name)
+        self.__lock = threading.Lock()
+        # the objects written by this instance and the ones being written by the artifact sink, so an object is not submitted twice
+        self.__stored = set()
+        self.__pending = {}  # type: Dict[str, Future]
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+
+    def get_root(self) -> str:
+        """
+            Get the root directory of this store.
+        """
+        return self.__root
+
+    @staticmethod
+    def digest(content: Union[bytes, str]) -> str:
+        """
+            Get the digest of the content, it is the 32 chars hex of blake2b.
+
+        :param content: the content, the string is encoded in utf-8
+        """
+        return hashlib.blake2b(content.encode("utf-8") if isinstance(content, str) else content, digest_size=16).hexdigest()
+
+    def put(self, content: Union[bytes, str], step: str = None, extension: str = "bin") -> str:
+        """
+            Put the artifact into this store, it is not written again if the same content is stored.
+
+        :param content: the content, the string is encoded in utf-8
+        :param step: the test step to record in the index. If None, the artifact is not indexed.
+        :param extension: the extension of the object file, e.g., "png" or "html"
+        :return: the digest of the content
+        """
+        data = content.encode("utf-8") if isinstance(content, str) else bytes(content)
+        digest = self.digest(data)
+        path = self.__object_path(digest, extension)
+
+        with self.__lock:
+            pending = self.__pending.get(path)
+            if pending is not None and pending.done():
+                # the callback of a done future may not have run yet
+                self.__on_written(path, pending)
+                pending = None
+            is_new = path not in self.__pending and path not in self.__stored and self.get_path(digest, extension) is None
+            if is_new and self.__artifact_sink is not None:
+                # reserve the path, so the concurrent put of the same content is not submitted again
+                self.__pending[path] = None
+        if is_new:
+            if self.__artifact_sink is not None:
+                try:
+                    future = self.__artifact_sink.write(path, data)
+                except BaseException:
+                    with self.__lock:
+                        del self.__pending[path]
+                    raise
+                with self.__lock:
+                    self.__pending[path] = future
+                future.add_done_callback(lambda done: self.__on_written(path, done, lock=True))
+            else:
+                self.__write_atomically(path, data)
+                with self.__lock:
+                    self.__stored.add(path)
+
+        if step is not None:
+            record = json.dumps({"step": step, "digest": digest, "extension": extension, "size": len(data), "time": time.time()})
+            with self.__lock:
+                with open(self.__index_path, "a", encoding="utf-8") as f:
+                    f.write(record + "\n")
+        return digest
+
+    def __on_written(self, path: str, future: Future, lock: bool = False):
+        if lock:
+            with self.__lock:
+                return self.__on_written(path, future)
+        if self.__pending.get(path) is not future:
+            return
+        del self.__pending[path]
+        # a failed object is not recorded as stored, so the next put of the same content writes it again
+        if future.exception() is None:
+            self.__stored.add(path)
+
+    def has(self, digest: str, extension: str = "bin") -> bool:
+        """
+            Whether the object of the digest is stored.
+        """
+        return self.get_path(digest, extension) is not None
+
+    def get_path(self, digest: str, extension: str = "bin") -> str:
+        """
+            Get the path of the object file.
+
+        :param digest: the digest
+        :param extension: the extension of the object file
+        :return: the path, or None if it is not stored. It ends with ".gz" if it is compressed by the artifact sink.
+        """
+        path = self.__object_path(digest, extension)
+        for candidate in (path, path + ".gz"):
+            if os.path.exists(candidate):
+                return candidate
+        return None
+
+    def get(self, digest: str, extension: str = "bin") -> bytes:
+        """
+            Get the content of the object.
+
+        :param digest: the digest
+        :param extension: the extension of the object file
+        :return: the content, it is decompressed if it is compressed by the artifact sink
+        """
+        path = self.get_path(digest, extension)
+        if path is None:
+            raise KeyError("Artifact <%s.%s> is not stored." % (digest, extension))
+        if path.endswith(".gz"):
+            with gzip.open(path, "rb") as f:
+                return f.read()
+        with open(path, "rb") as f:
+            return f.read()
+
+    def find(self, step: str) -> List[dict]:
+        """
+            Find the index records of the test step.
+
+        :param step: the test step
+        :return: the records in order, each one is a dict {"step", "digest", "extension", "size", "time"}
+        """
+        if not os.path.exists(self.__index_path):
+            return []
+        records = []
+        with open(self.__index_path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    record = json.loads(line)
+                    if record["step"] == step:
+                        records.append(record)
+        return records
+
+    def __object_path(self, digest: str, extension: str) -> str:
+        # the objects are sharded, so a directory never holds too many files
+        return os.path.join(self.__root, "objects", digest[:2], "%s.%s" % (digest, extension))
+
+    @staticmethod
+    def __write_atomically(path: str, data: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = "%s.%s.%s.tmp" % (path, os.getpid(), threading.get_ident())
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def __str__(self):
+        return "ArtifactStore <Root: %s>" % self.__root
@@ -0,0 +1,295 @@
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .context import Context
+    from .web_driver import WebDriver
+
+
+class TraceEvent:
+    __slots__ = ("kind", "name", "method", "locator", "start", "duration", "thread", "session", "error")
+
+    def __init__(self, kind: str, name: str, method: str = None, locator: str = None, start: float = None, duration: float = 0,
+                 session: str = None, error: str = None):
+        """
+            An event recorded by Tracer.
+
+        :param kind: "command" for a web driver command, "retry" for a retry of element operation, "sleep" for a sleep of Waiter
+        :param name: the command name (e.g., "clickElement"), the retry kind (e.g., "stale") or the waited condition
+        :param method: the easyium method which caused the event, e.g., "StaticElement.click"
+        :param locator: the locator involved
+        :param start: the start time (epoch in seconds)
+        :param duration: the elapsed time (in milliseconds), it is measured by the monotonic clock
+        :param session: the session id of web driver
+        :param error: the class name of the raised exception, None if it succeeded
+        """
+        self.kind = kind
+        self.name = name
+        self.method = method
+        self.locator = locator
+        self.start = time.time() if start is None else start
+        self.duration = duration
+        self.thread = threading.get_ident()
+        self.session = session
+        self.error = error
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __str__(self):
+        return "TraceEvent <Kind: %s><Name: %s><Method: %s><Locator: %s><Duration: %.3f><Error: %s>" % (
+            self.kind, self.name, self.method, self.locator, self.duration, self.error)
+
+
+class TraceExporter:
+    def export(self, event: TraceEvent):
+        """
+            Export an event, it is called from the thread which records the event.
+        """
+        pass
+
+    def close(self):
+        pass
+
+
+class HistogramExporter(TraceExporter):
+    def __init__(self, precision_bits: int = 6):
+        """
+            Create a HistogramExporter, it keeps a latency histogram in memory for each command name, retry kind and "sleep".
+            Like HDR histogram, the buckets are linear in each power of 2, so the relative error of a value is below 1 / 2 ** precision_bits
+            and the memory does not grow with the number of events.
+
+        :param precision_bits: the number of bits to keep for each value, 6 means the error is below 1.6%
+        """
+        self.__precision_bits = precision_bits
+        self.__lock = threading.Lock()
+        self.__histograms = {}  # type: Dict[str, Dict[int, int]]
+        self.__stats = {}  # type: Dict[str, List[float]]
+
+    def export(self, event: TraceEvent):
+        key = event.name if event.kind == "command" else "%s:%s" % (event.kind, event.name if event.kind == "retry" else "waiter")
+        # the values are kept in microseconds
+        value = max(int(event.duration * 1000), 0)
+        shift = max(value.bit_length() - self.__precision_bits, 0)
+        bucket = (value >> shift) << shift
+        with self.__lock:
+            histogram = self.__histograms.setdefault(key, {})
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+            stats = self.__stats.get(key)
+            if stats is None:
+                self.__stats[key] = [1, event.duration, event.duration, event.duration]
+            else:
+                stats[0] += 1
+                stats[1] += event.duration
+                stats[2] = min(stats[2], event.duration)
+                stats[3] = max(stats[3], event.duration)
+
+    def get_names(self) -> List[str]:
+        """
+            Get the names of the histograms, they are the command names, "retry:<kind>" and "sleep:waiter".
+        """
+        with self.__lock:
+            return sorted(self.__histograms)
+
+    def get_count(self, name: str) -> int:
+        with self.__lock:
+            return self.__stats[name][0] if name in self.__stats else 0
+
+    def get_percentile(self, name: str, percentile: float) -> float:
+        """
+            Get the value at the percentile.
+
+        :param name: the name of histogram
+        :param percentile: the percentile, e.g., 99 or 99.9
+        :return: the value (in milliseconds), None if there is no event
+        """
+        with self.__lock:
+            histogram = dict(self.__histograms.get(name, {}))
+        total = sum(histogram.values())
+        if total == 0:
+            return None
+        rank = max(percentile / 100.0 * total, 1)
+        count = 0
+        for bucket in sorted(histogram):
+            count += histogram[bucket]
+            if count >= rank:
+                return bucket / 1000.0
+        return max(histogram) / 1000.0
+
+    def get_summary(self) -> Dict[str, Dict[str, float]]:
+        """
+            Get the summary of all histograms.
+
+        :return: the dict of name to {"count", "total", "min", "mean", "max", "p50", "p90", "p99"}, the times are in milliseconds
+        """
+        summary = {}
+        for name in self.get_names():
+            with self.__lock:
+                count, total, minimum, maximum = self.__stats[name]
+            summary[name] = {"count": count, "total": total, "min": minimum, "mean": total / count, "max": maximum,
+                             "p50": self.get_percentile(name, 50), "p90": self.get_percentile(name, 90), "p99": self.get_percentile(name, 99)}
+        return summary
+
+    def reset(self):
+        with self.__lock:
+            self.__histograms = {}
+            self.__stats = {}
+
+
+class JsonLinesExporter(TraceExporter):
+    def __init__(self, filename: str):
+        """
+            Create a JsonLinesExporter, it appends each event to the file as a json line.
+
+        :param filename: the full path of the file
+        """
+        self.__lock = threading.Lock()
+        self.__file = open(filename, "a", encoding="utf-8")
+
+    def export(self, event: TraceEvent):
+        line = json.dumps(event.to_dict()) + "\n"
+        with self.__lock:
+            self.__file.write(line)
+
+    def close(self):
+        with self.__lock:
+            self.__file.close()
+
+
+class ChromeTraceExporter(TraceExporter):
+    def __init__(self, filename: str):
+        """
+            Create a ChromeTraceExporter, it writes the events in Chrome trace event format, which can be opened by chrome://tracing or Perfetto.
+            The commands and sleeps are complete events, the retries are instant events. The events are written as they come,
+            the file is valid json after close(), and the tools accept it before close() too.
+
+        :param filename: the full path of the file
+        """
+        self.__lock = threading.Lock()
+        self.__file = open(filename, "w", encoding="utf-8")
+        self.__file.write("[\n")
+        self.__first = True
+
+    def export(self, event: TraceEvent):
+        trace_event = {"name": event.name if event.kind != "sleep" else "sleep", "cat": event.kind, "ts": int(event.start * 1000000),
+                       "pid": os.getpid(), "tid": event.thread,
+                       "args": {"method": event.method, "locator": event.locator, "session": event.session, "error": event.error}}
+        if event.kind == "retry":
+            trace_event.update({"ph": "i", "s": "t"})
+        else:
+            trace_event.update({"ph": "X", "dur": int(event.duration * 1000)})
+        line = json.dumps(trace_event)
+        with self.__lock:
+            self.__file.write(line if self.__first else ",\n" + line)
+            self.__first = False
+
+    def close(self):
+        with self.__lock:
+            if not self.__file.closed:
+                self.__file.write("\n]\n")
+                self.__file.close()
+
+
+class Tracer:
+    def __init__(self, *exporters: TraceExporter):
+        """
+            Create a Tracer, it records every command sent by the web driver, the retries of element operations and the sleeps of Waiter.
+
+        :param exporters: the exporters of the events, e.g., HistogramExporter(), JsonLinesExporter() and ChromeTraceExporter()
+
+        :Usage:
+            histogram = HistogramExporter()
+            driver.set_tracer(Tracer(histogram, ChromeTraceExporter('/Traces/test_login.json')))
+            StaticElement(driver, "id=submit").click()
+            print(histogram.get_summary())
+        """
+        self.__exporters = list(exporters)
+
+    def get_exporters(self) -> List[TraceExporter]:
+        return list(self.__exporters)
+
+    def record(self, event: TraceEvent):
+        """
+            Send the event to the exporters.
+        """
+        for exporter in self.__exporters:
+            exporter.export(event)
+
+    def _record_command(self, session_id: str, driver_command: str, params: dict, start: float, duration: float, error: str):
+        method, context = _find_easyium_caller()
+        locator = getattr(context, "_locator", None)
+        if locator is None and isinstance(params, dict) and "using" in params and "value" in params:
+            locator = "%s=%s" % (params["using"], params["value"])
+        self.record(TraceEvent("command", driver_command, method, None if locator is None else str(locator), start, duration, session_id, error))
+
+    def _record_retry(self, kind: str, context: "Context"):
+        method, _ = _find_easyium_caller()
+        locator = getattr(context, "_locator", None)
+        self.record(TraceEvent("retry", kind, method, None if locator is None else str(locator)))
+
+    def _record_sleep(self, condition_name: str, start: float, duration: float):
+        method, context = _find_easyium_caller()
+        locator = getattr(context, "_locator", None)
+        self.record(TraceEvent("sleep", condition_name, method, None if locator is None else str(locator), start, duration))
+
+    def close(self):
+        """
+            Close the exporters.
+        """
+        for exporter in self.__exporters:
+            exporter.close()
+
+    def __enter__(self) -> "Tracer":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _find_easyium_caller():
+    # walk out of the selenium frames to the outermost easyium frame before the user code, e.g., Element.click()
+    frame = sys._getframe(2)
+    found = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("easyium.") and module != __name__:
+            if frame.f_code.co_name != "<lambda>" and not frame.f_code.co_name.startswith("__"):
+                found = frame
+        elif found is not None:
+            break
+        frame = frame.f_back
+    if found is None:
+        return None, None
+    context = found.f_locals.get("self")
+    owner = found.f_globals.get("__name__") if context is None else context.__class__.__name__
+    return "%s.%s" % (owner, found.f_code.co_name), context
+
+
+def install_tracer(web_driver: "WebDriver", tracer: Tracer):
+    """
+        Wrap the execute() of selenium web driver, so every command is recorded by the tracer.
+    """
+    selenium_web_driver = web_driver._selenium_web_driver()
+    # remove the previous wrapper, the class method is used then
+    selenium_web_driver.__dict__.pop("execute", None)
+    if tracer is None:
+        return
+    execute = selenium_web_driver.execute
+
+    def traced_execute(driver_command: str, params: dict = None):
+        # the start is the wall clock for the exporters, the duration is measured by the monotonic clock which never jumps
+        start, started = time.time(), time.monotonic()
+        error = None
+        try:
+            return execute(driver_command, params)
+        except BaseException as e:
+            error = e.__class__.__name__
+            raise
+        finally:
+            tracer._record_command(selenium_web_driver.session_id, driver_command, params, start, (time.monotonic() - started) * 1000.0, error)
+
+    selenium_web_driver.execute = traced_execute
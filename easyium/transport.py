@@ -0,0 +1,146 @@
+import threading
+from typing import Dict, Tuple
+from urllib.parse import urlparse
+
+import urllib3
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+
+class PooledConnection:
+    def __init__(self, pool_manager: urllib3.PoolManager, compress: bool):
+        """
+            The connection used by RemoteConnection in keep-alive mode, it sends the requests through the shared pool manager.
+            Each web driver has its own PooledConnection, so quitting one web driver does not close the connections of the others.
+
+        :param pool_manager: the pool manager of the endpoint
+        :param compress: whether to ask the server to compress the responses
+        """
+        self.__pool_manager = pool_manager
+        self.__compress = compress
+
+    def request(self, method: str, url: str, body: str = None, headers: dict = None, **kwargs) -> urllib3.HTTPResponse:
+        if self.__compress:
+            headers = dict(headers or {})
+            # the response is decoded by urllib3, so selenium reads it as usual
+            headers["Accept-Encoding"] = "gzip, deflate"
+        return self.__pool_manager.request(method, url, body=body, headers=headers, **kwargs)
+
+    def clear(self):
+        # called by RemoteConnection.close() when the web driver quits, the shared pool is closed by HttpTransport.close()
+        pass
+
+
+class HttpTransport:
+    def __init__(self, pool_size: int = 10, connect_timeout: int = 10000, read_timeout: int = None, compress: bool = True):
+        """
+            Create an HttpTransport, it keeps one connection pool per remote endpoint,
+            and the web drivers using the same endpoint share the keep-alive connections.
+
+        :param pool_size: the max number of connections kept for each endpoint
+        :param connect_timeout: the timeout (in milliseconds) to connect to the server
+        :param read_timeout: the timeout (in milliseconds) to read the response, it must cover the slowest command, e.g., a long page load.
+            If None, use selenium's timeout, see RemoteConnection.set_timeout().
+        :param compress: whether to ask the server to compress the responses, it helps the large responses like page source and screenshot
+
+        :Usage:
+            set_default_http_transport(HttpTransport(pool_size=20, read_timeout=300000))
+            driver = Appium("http://grid:4444/wd/hub", desired_capabilities)
+        """
+        self.__pool_size = pool_size
+        self.__connect_timeout = connect_timeout
+        self.__read_timeout = read_timeout
+        self.__compress = compress
+        self.__lock = threading.Lock()
+        self.__pool_managers = {}  # type: Dict[Tuple[str, str, str], urllib3.PoolManager]
+
+    def get_connection(self, command_executor: RemoteConnection) -> PooledConnection:
+        """
+            Get a connection using the shared pool of the command executor's endpoint.
+
+        :param command_executor: the command executor of selenium web driver
+        :return: the connection
+        """
+        parsed = urlparse(command_executor._url)
+        proxy_url = getattr(command_executor, "_proxy_url", None)
+        key = (parsed.scheme, parsed.netloc, proxy_url)
+        with self.__lock:
+            pool_manager = self.__pool_managers.get(key)
+            if pool_manager is None:
+                read_timeout = RemoteConnection.get_timeout() if self.__read_timeout is None else self.__read_timeout / 1000.0
+                pool_manager_args = {
+                    "num_pools": 4,
+                    "maxsize": self.__pool_size,
+                    "timeout": urllib3.Timeout(connect=self.__connect_timeout / 1000.0, read=read_timeout)
+                }
+                ca_certs = getattr(command_executor, "_ca_certs", None)
+                if ca_certs:
+                    pool_manager_args["cert_reqs"] = "CERT_REQUIRED"
+                    pool_manager_args["ca_certs"] = ca_certs
+                pool_manager = urllib3.ProxyManager(proxy_url, **pool_manager_args) if proxy_url else urllib3.PoolManager(**pool_manager_args)
+                self.__pool_managers[key] = pool_manager
+        return PooledConnection(pool_manager, self.__compress)
+
+    def install(self, command_executor: RemoteConnection):
+        """
+            Make the command executor send the commands through the shared pool of its endpoint.
+
+        :param command_executor: the command executor of selenium web driver
+        """
+        command_executor.keep_alive = True
+        command_executor._conn = self.get_connection(command_executor)
+
+    def close(self):
+        """
+            Close the connections of all endpoints, call it after all the web drivers using this transport quit.
+        """
+        with self.__lock:
+            pool_managers, self.__pool_managers = list(self.__pool_managers.values()), {}
+        for pool_manager in pool_managers:
+            pool_manager.clear()
+
+    def __str__(self):
+        return "HttpTransport <PoolSize: %s><ConnectTimeout: %s><ReadTimeout: %s><Compress: %s>" % (
+            self.__pool_size, self.__connect_timeout, self.__read_timeout, self.__compress)
+
+
+_default_http_transport = None
+
+
+def get_default_http_transport() -> HttpTransport:
+    """
+        Get the http transport shared by the web drivers.
+
+    :return: the http transport, None if the web drivers use their own connections (default)
+    """
+    return _default_http_transport
+
+
+def set_default_http_transport(http_transport: HttpTransport):
+    """
+        Set the http transport shared by the web drivers, it applies to the web drivers which have not sent a command yet,
+        so the request creating the session goes through the shared pool too.
+        It is opt-in: the shared pool outlives the web drivers and is only closed by HttpTransport.close(),
+        so the web drivers keep selenium's own connections unless a transport is set.
+
+    :param http_transport: the http transport, None to let the web drivers use their own connections
+
+    :Usage:
+        set_default_http_transport(HttpTransport(pool_size=20))
+        driver = Chrome()
+    """
+    global _default_http_transport
+    _default_http_transport = http_transport
+
+
+_selenium_request = RemoteConnection._request
+
+
+def _request(self: RemoteConnection, method: str, url: str, body: str = None):
+    # the session is created in the constructor of selenium web driver, so the connection is installed at the first request
+    http_transport = _default_http_transport
+    if http_transport is not None and not isinstance(getattr(self, "_conn", None), PooledConnection):
+        http_transport.install(self)
+    return _selenium_request(self, method, url, body)
+
+
+RemoteConnection._request = _request
@@ -1,29 +1,157 @@
 import time
-from typing import Callable, List, TYPE_CHECKING
+from typing import Callable, List, Tuple, TYPE_CHECKING
 
 from selenium.common.exceptions import NoSuchElementException as SeleniumNoSuchElementException, StaleElementReferenceException as SeleniumStaleElementReferenceException, \
     WebDriverException as SeleniumWebDriverException
 from selenium.webdriver.common.by import By
 
 from .decorator import SupportedBy
-from .enumeration import WebDriverPlatform
-from .exceptions import TimeoutException, ElementTimeoutException, WebDriverTimeoutException
+from .enumeration import WebDriverPlatform, WebDriverContext
+from .deadline import Deadline
+from .exceptions import EasyiumException, TimeoutException, ElementTimeoutException, WebDriverTimeoutException, NoSuchElementException
+from .polling import PollingStrategy, FixedInterval
 
 if TYPE_CHECKING:
     from .web_driver import WebDriver
     from .element import Element
+    from .tracing import Tracer
+
+# the longest time (in milliseconds) an in-browser wait blocks in one call, it is kept under selenium's default script timeout
+EVENT_DRIVEN_WAIT_CHUNK = 10000
+
+# arguments: element, expected, desired occurrence, timeout, callback
+EVENT_DRIVEN_WAIT_SCRIPT = """
+    var el = arguments[0], expected = arguments[1], desired = arguments[2], timeout = arguments[3];
+    var callback = arguments[arguments.length - 1];
+    var finished = false, observer = null, frame = null, timer = null;
+
+    function occurred() {
+        try {
+            return (%s) === desired;
+        } catch (e) {
+            return false;
+        }
+    }
+
+    function finish(result) {
+        if (finished) return;
+        finished = true;
+        if (observer) observer.disconnect();
+        if (frame !== null) window.cancelAnimationFrame(frame);
+        window.clearTimeout(timer);
+        callback(result);
+    }
+
+    function check() {
+        if (!el.isConnected) {
+            finish(false);
+        } else if (occurred()) {
+            finish(true);
+        }
+    }
+
+    function tick() {
+        check();
+        if (!finished) frame = window.requestAnimationFrame(tick);
+    }
+
+    check();
+    if (!finished) {
+        if (window.MutationObserver) {
+            observer = new MutationObserver(check);
+            observer.observe(document, {attributes: true, childList: true, characterData: true, subtree: true});
+            // the mutations in a shadow tree are not observed from document
+            if (el.getRootNode() !== document) {
+                observer.observe(el.getRootNode(), {attributes: true, childList: true, characterData: true, subtree: true});
+            }
+        }
+        if (window.requestAnimationFrame) frame = window.requestAnimationFrame(tick);
+        timer = window.setTimeout(function () {
+            finish(occurred());
+        }, timeout);
+    }
+"""
+
+# javascript expression of the value returned by selenium's get_attribute(), the name is expected.name
+ATTRIBUTE_VALUE_EXPRESSION = """(function () {
+        var property = el[expected.name];
+        if (property !== undefined && property !== null && typeof property !== 'object' && typeof property !== 'function') {
+            return String(property);
+        }
+        return el.getAttribute(expected.name);
+    })()"""
+
+# arguments: element, callback
+# return: null if the element is actionable, otherwise the reason why it is not actionable
+ACTIONABILITY_SCRIPT = """
+    var el = arguments[0], callback = arguments[arguments.length - 1];
+
+    // an animation frame, or a short timeout if frames are throttled (e.g., in a background tab)
+    function nextFrame(fn) {
+        var called = false;
+        function once() {
+            if (!called) {
+                called = true;
+                fn();
+            }
+        }
+        if (window.requestAnimationFrame) window.requestAnimationFrame(once);
+        window.setTimeout(once, 50);
+    }
+
+    function sameRect(a, b) {
+        return a.left === b.left && a.top === b.top && a.width === b.width && a.height === b.height;
+    }
+
+    if (!el.isConnected) return callback('detached');
+    var style = window.getComputedStyle(el);
+    if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0' || el.getClientRects().length === 0) {
+        return callback('not visible');
+    }
+    if (el.disabled) return callback('disabled');
+
+    var rect = el.getBoundingClientRect();
+    if (rect.width === 0 || rect.height === 0) return callback('zero size');
+    if (rect.top < 0 || rect.left < 0 || rect.bottom > window.innerHeight || rect.right > window.innerWidth) {
+        el.scrollIntoView({block: 'center', inline: 'center'});
+    }
+
+    nextFrame(function () {
+        var first = el.getBoundingClientRect();
+        nextFrame(function () {
+            var second = el.getBoundingClientRect();
+            if (!sameRect(first, second)) return callback('not stable');
+            var root = el.getRootNode && el.getRootNode().elementFromPoint ? el.getRootNode() : el.ownerDocument;
+            var hit = root.elementFromPoint(second.left + second.width / 2, second.top + second.height / 2);
+            if (hit === null) return callback('center out of viewport');
+            if (hit !== el && !el.contains(hit)) {
+                return callback('covered by <' + hit.tagName.toLowerCase() + (hit.id ? ' id="' + hit.id + '"' : '')
+                    + (typeof hit.className === 'string' && hit.className ? ' class="' + hit.className + '"' : '') + '>');
+            }
+            callback(null);
+        });
+    });
+"""
 
 
 class Waiter:
-    def __init__(self, interval: int = 1000, timeout: int = 30000):
+    def __init__(self, interval: int = 1000, timeout: int = 30000, polling: PollingStrategy = None, deadline: Deadline = None,
+                 tracer: "Tracer" = None):
         """
             Create a Waiter instance.
+            The wait never lasts longer than the active deadline, see Deadline.
 
         :param interval: the wait interval (in milliseconds)
-        :param timeout: the wait timeout (in milliseconds)
+        :param timeout: the wait timeout (in milliseconds), it is ignored if deadline is given.
+        :param polling: the polling strategy. If None, sleep a fixed interval between two polls.
+        :param deadline: the deadline shared with other waits. If None, start a new deadline by timeout when waiting.
+        :param tracer: the tracer to record the sleeps between two polls. If None, the sleeps are not recorded.
         """
         self.__interval = interval
         self.__timeout = timeout
+        self.__polling = FixedInterval() if polling is None else polling
+        self.__deadline = deadline
+        self.__tracer = tracer
 
     def wait_for(self, condition_function: Callable[[any], bool], *function_args, **function_kwargs):
         """
@@ -33,38 +161,85 @@ class Waiter:
         :param function_args: the args for condition_function
         :param function_kwargs: the kwargs for condition_function
         """
-        start_time = time.time() * 1000.0
+        deadline = Deadline.within(self.__timeout) if self.__deadline is None else self.__deadline._bounded()
 
-        if condition_function(*function_args, **function_kwargs):
-            return
-
-        while (time.time() * 1000.0 - start_time) <= self.__timeout:
-            time.sleep(self.__interval / 1000.0)
+        with deadline:
             if condition_function(*function_args, **function_kwargs):
                 return
 
+            for delay in self.__polling.intervals(self.__interval):
+                rest_timeout = deadline.get_rest_timeout()
+                if rest_timeout < 0:
+                    break
+                # the sleep is measured by the monotonic clock, the wall clock can jump
+                start, started = time.time(), time.monotonic()
+                time.sleep(min(delay, rest_timeout) / 1000.0)
+                if self.__tracer is not None:
+                    self.__tracer._record_sleep(condition_function.__name__, start, (time.monotonic() - started) * 1000.0)
+                if condition_function(*function_args, **function_kwargs):
+                    return
+
         raise TimeoutException("Timed out waiting for <%s>." % condition_function.__name__)
 
 
 class ElementWaitFor:
-    def __init__(self, element: "Element", interval: int, timeout: int):
+    def __init__(self, element: "Element", interval: int, timeout: int, polling: PollingStrategy = None, event_driven: bool = False):
         self.__element = element
         self.__desired_occurrence = True
         self.__interval = interval
         self.__timeout = timeout
+        self.__polling = polling
+        self.__event_driven = event_driven
 
     def _get_element(self) -> "Element":
         return self.__element
 
-    def __wait_for(self, element_condition: "ElementCondition", interval: int, timeout: int) -> Waiter:
+    def __wait_for(self, element_condition: "ElementCondition", deadline: Deadline = None):
         def is_element_condition_occurred():
             return element_condition.occurred() == self.__desired_occurrence
 
-        try:
-            Waiter(interval, timeout).wait_for(is_element_condition_occurred)
-        except TimeoutException:
-            raise ElementTimeoutException(
-                "Timed out waiting for <%s> to be <%s>." % (element_condition, self.__desired_occurrence))
+        deadline = Deadline.within(self.__timeout) if deadline is None else deadline
+
+        with deadline:
+            if self.__event_driven and element_condition._to_script() is not None \
+                    and self.__element.get_web_driver_info().context in WebDriverContext._WEB:
+                if self.__wait_in_browser(element_condition, is_element_condition_occurred, deadline):
+                    return
+                # fall back to polling with the rest timeout
+
+            try:
+                Waiter(self.__interval, polling=self.__polling, deadline=deadline, tracer=self.__element.get_web_driver().get_tracer()) \
+                    .wait_for(is_element_condition_occurred)
+            except TimeoutException:
+                raise self.__element.get_web_driver()._capture_failure(ElementTimeoutException(
+                    "Timed out waiting for <%s> to be <%s>." % (element_condition, self.__desired_occurrence)))
+
+    def __wait_in_browser(self, element_condition: "ElementCondition", is_element_condition_occurred: Callable[[], bool], deadline: Deadline) -> bool:
+        # The browser wakes up as soon as the condition flips, the result is always confirmed by selenium.
+        # Return False if the wait should fall back to polling.
+        predicate, expected = element_condition._to_script()
+        script = EVENT_DRIVEN_WAIT_SCRIPT % predicate
+
+        if is_element_condition_occurred():
+            return True
+        if not self.__element.exists():
+            return False
+
+        while True:
+            rest_timeout = deadline.get_rest_timeout()
+            if rest_timeout <= 0:
+                return False
+            try:
+                with self.__element.get_web_driver()._expect_failures():
+                    flipped = self.__element.get_web_driver().execute_async_script(
+                        script, self.__element, expected, self.__desired_occurrence, int(min(rest_timeout, EVENT_DRIVEN_WAIT_CHUNK)))
+            except (SeleniumWebDriverException, EasyiumException):
+                return False
+            if is_element_condition_occurred():
+                return True
+            if flipped:
+                # the browser and selenium disagree on this condition
+                return False
 
     def not_(self) -> "ElementWaitFor":
         """
@@ -77,13 +252,21 @@ class ElementWaitFor:
         """
             Wait for this element exists.
         """
-        self.__wait_for(ElementExistence(self.__element), self.__interval, self.__timeout)
+        self.__wait_for(ElementExistence(self.__element))
 
     def visible(self):
         """
             Wait for this element visible.
         """
-        self.__wait_for(ElementVisible(self.__element), self.__interval, self.__timeout)
+        self.__wait_for(ElementVisible(self.__element))
+
+    def actionable(self):
+        """
+            Wait for this element actionable.
+            In web context, it is attached, visible, enabled, stable in two animation frames and not covered at its center point,
+            they are checked by one script call per poll. Otherwise, it is visible and enabled.
+        """
+        self.__wait_for(ElementActionable(self.__element))
 
     def text_equals(self, text: str):
         """
@@ -95,10 +278,9 @@ class ElementWaitFor:
             # wait for text not empty
             StaticElement(driver, "id=change_text").wait_for().not_().text_equals("")
         """
-        start_time = time.time() * 1000.0
-        self.__element.wait_for(self.__interval, self.__timeout).exists()
-        rest_timeout = start_time + self.__timeout - time.time() * 1000.0
-        self.__wait_for(ElementTextEquals(self.__element, text), self.__interval, rest_timeout)
+        with Deadline.within(self.__timeout) as deadline:
+            self.__element.wait_for(self.__interval, self.__timeout, self.__polling).exists()
+            self.__wait_for(ElementTextEquals(self.__element, text), deadline)
 
     def attribute_equals(self, attribute: str, value: str):
         """
@@ -110,10 +292,9 @@ class ElementWaitFor:
         :Usage:
             element.wait_for().attribute_equals("class", "foo bar")
         """
-        start_time = time.time() * 1000.0
-        self.__element.wait_for(self.__interval, self.__timeout).exists()
-        rest_timeout = start_time + self.__timeout - time.time() * 1000.0
-        self.__wait_for(ElementAttributeEquals(self.__element, attribute, value), self.__interval, rest_timeout)
+        with Deadline.within(self.__timeout) as deadline:
+            self.__element.wait_for(self.__interval, self.__timeout, self.__polling).exists()
+            self.__wait_for(ElementAttributeEquals(self.__element, attribute, value), deadline)
 
     def attribute_contains_one(self, attribute: str, *values: str):
         """
@@ -127,10 +308,9 @@ class ElementWaitFor:
             element.wait_for().attribute_contains_one("class", ["foo", "bar"])
             element.wait_for().attribute_contains_one("class", ("foo", "bar"))
         """
-        start_time = time.time() * 1000.0
-        self.__element.wait_for(self.__interval, self.__timeout).exists()
-        rest_timeout = start_time + self.__timeout - time.time() * 1000.0
-        self.__wait_for(ElementAttributeContainsOne(self.__element, attribute, *values), self.__interval, rest_timeout)
+        with Deadline.within(self.__timeout) as deadline:
+            self.__element.wait_for(self.__interval, self.__timeout, self.__polling).exists()
+            self.__wait_for(ElementAttributeContainsOne(self.__element, attribute, *values), deadline)
 
     def attribute_contains_all(self, attribute: str, *values: str):
         """
@@ -144,16 +324,24 @@ class ElementWaitFor:
             element.wait_for().attribute_contains_all("class", ["foo", "bar"])
             element.wait_for().attribute_contains_all("class", ("foo", "bar"))
         """
-        start_time = time.time() * 1000.0
-        self.__element.wait_for(self.__interval, self.__timeout).exists()
-        rest_timeout = start_time + self.__timeout - time.time() * 1000.0
-        self.__wait_for(ElementAttributeContainsAll(self.__element, attribute, *values), self.__interval, rest_timeout)
+        with Deadline.within(self.__timeout) as deadline:
+            self.__element.wait_for(self.__interval, self.__timeout, self.__polling).exists()
+            self.__wait_for(ElementAttributeContainsAll(self.__element, attribute, *values), deadline)
 
 
 class ElementCondition:
     def occurred(self):
         pass
 
+    def _to_script(self) -> Tuple[str, any]:
+        """
+            Compile this condition to a javascript predicate for event driven wait.
+
+        :return: the predicate expression on variables "el" and "expected", and the value of "expected".
+            None if this condition cannot be evaluated in browser.
+        """
+        return None
+
 
 class ElementExistence(ElementCondition):
     def __init__(self, element: "Element"):
@@ -173,10 +361,48 @@ class ElementVisible(ElementCondition):
     def occurred(self) -> bool:
         return self.__element.is_displayed()
 
+    def _to_script(self) -> Tuple[str, any]:
+        predicate = """(function () {
+                var style = window.getComputedStyle(el);
+                if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') return false;
+                return el.getClientRects().length > 0;
+            })()"""
+        return predicate, None
+
     def __str__(self):
         return "ElementVisible [\n%s\n]" % self.__element
 
 
+class ElementActionable(ElementCondition):
+    def __init__(self, element: "Element"):
+        self.__element = element
+        self.__reason = None
+
+    def occurred(self) -> bool:
+        if self.__element.get_web_driver_info().context not in WebDriverContext._WEB:
+            self.__reason = None
+            return self.__element.is_displayed() and self.__element.is_enabled()
+
+        try:
+            try:
+                self.__reason = self.__element.get_web_driver()._selenium_web_driver().execute_async_script(
+                    ACTIONABILITY_SCRIPT, self.__element._selenium_element())
+            except SeleniumStaleElementReferenceException:
+                self.__element.get_web_driver()._trace_retry("stale", self.__element)
+                self.__element._refresh()
+                self.__reason = "stale"
+        except NoSuchElementException:
+            self.__reason = "not found"
+        except SeleniumWebDriverException as wde:
+            raise EasyiumException(wde.msg, self.__element)
+        return self.__reason is None
+
+    def __str__(self):
+        if self.__reason is None:
+            return "ElementActionable [\n%s\n]" % self.__element
+        return "ElementActionable <LastReason: %s> [\n%s\n]" % (self.__reason, self.__element)
+
+
 class ElementTextEquals(ElementCondition):
     def __init__(self, element: "Element", text: str):
         self.__element = element
@@ -185,6 +411,9 @@ class ElementTextEquals(ElementCondition):
     def occurred(self) -> bool:
         return self.__element._selenium_element().text == self.__text
 
+    def _to_script(self) -> Tuple[str, any]:
+        return "(el.innerText === undefined ? el.textContent : el.innerText).trim() === expected", self.__text
+
     def __str__(self):
         return "ElementTextEquals [element: \n%s\n][text: %s]" % (self.__element, self.__text)
 
@@ -198,6 +427,9 @@ class ElementAttributeEquals(ElementCondition):
     def occurred(self) -> bool:
         return self.__element._selenium_element().get_attribute(self.__attribute) == self.__value
 
+    def _to_script(self) -> Tuple[str, any]:
+        return "%s === expected.value" % ATTRIBUTE_VALUE_EXPRESSION, {"name": self.__attribute, "value": self.__value}
+
     def __str__(self):
         return "ElementAttributeEquals [element: \n%s\n][attribute: %s][value: %s]" % (
             self.__element, self.__attribute, self.__value)
@@ -221,6 +453,16 @@ class ElementAttributeContainsOne(ElementCondition):
                 return True
         return False
 
+    def _to_script(self) -> Tuple[str, any]:
+        predicate = """(function (value) {
+                if (value === null) return false;
+                for (var i = 0; i < expected.values.length; i++) {
+                    if (value.indexOf(expected.values[i]) !== -1) return true;
+                }
+                return false;
+            })(%s)""" % ATTRIBUTE_VALUE_EXPRESSION
+        return predicate, {"name": self.__attribute, "values": self.__values}
+
     def __str__(self):
         return "ElementAttributeContainsOne [element: \n%s\n][attribute: %s][values: %s]" % (
             self.__element, self.__attribute, self.__values)
@@ -244,16 +486,26 @@ class ElementAttributeContainsAll(ElementCondition):
                 return False
         return True
 
+    def _to_script(self) -> Tuple[str, any]:
+        predicate = """(function (value) {
+                if (value === null) return false;
+                for (var i = 0; i < expected.values.length; i++) {
+                    if (value.indexOf(expected.values[i]) === -1) return false;
+                }
+                return true;
+            })(%s)""" % ATTRIBUTE_VALUE_EXPRESSION
+        return predicate, {"name": self.__attribute, "values": self.__values}
+
     def __str__(self):
         return "ElementAttributeContainsAll [element: \n%s\n][attribute: %s][values: %s]" % (
             self.__element, self.__attribute, self.__values)
 
 
 class WebDriverWaitFor:
-    def __init__(self, web_driver: "WebDriver", interval: int, timeout: int):
+    def __init__(self, web_driver: "WebDriver", interval: int, timeout: int, polling: PollingStrategy = None):
         self.__web_driver = web_driver
         self.__desired_occurrence = True
-        self.__waiter = Waiter(interval, timeout)
+        self.__waiter = Waiter(interval, timeout, polling, tracer=web_driver.get_tracer())
 
     def _get_web_driver(self) -> "WebDriver":
         return self.__web_driver
@@ -265,8 +517,8 @@ class WebDriverWaitFor:
         try:
             self.__waiter.wait_for(is_web_driver_condition_occurred)
         except TimeoutException:
-            raise WebDriverTimeoutException(
-                "Timed out waiting for <%s> to be <%s>." % (web_driver_condition, self.__desired_occurrence))
+            raise self.__web_driver._capture_failure(WebDriverTimeoutException(
+                "Timed out waiting for <%s> to be <%s>." % (web_driver_condition, self.__desired_occurrence)))
 
     def not_(self) -> "WebDriverWaitFor":
         """
@@ -1,10 +1,14 @@
-from typing import List, Union, TYPE_CHECKING
+import threading
+import time
+from contextlib import contextmanager
+from io import BytesIO
+from typing import BinaryIO, Dict, List, Union, TYPE_CHECKING
 
 from appium.webdriver.clipboard_content_type import ClipboardContentType
 from appium.webdriver.common.multi_action import MultiAction
 from appium.webdriver.common.touch_action import TouchAction
 from appium.webdriver.webdriver import WebDriver as AppiumWebDriver
-from selenium.common.exceptions import WebDriverException
+from selenium.common.exceptions import WebDriverException, StaleElementReferenceException
 from selenium.webdriver import ActionChains, Ie as SeleniumIe, Firefox as SeleniumFirefox, Chrome as SeleniumChrome, Opera as SeleniumOpera, \
     Safari as SeleniumSafari, Edge as SeleniumEdge
 from selenium.webdriver.chrome.options import Options as ChromeOptions
@@ -21,14 +25,75 @@ from selenium.webdriver.safari.options import Options as SafariOptions
 from selenium.webdriver.safari.service import Service as SafariService
 
 from .alert import Alert
+from .artifact import ArtifactSink
+from .batch import ActionBatch
 from .context import Context
 from .decorator import SupportedBy
 from .enumeration import WebDriverPlatform, WebDriverContext
+from .exceptions import EasyiumException, NoSuchElementException, UnsupportedOperationException
+from .failure import FailureCapture
+from .fetch import FETCH_FIELDS_SCRIPT, parse_field, fetch_field_natively
+from .image import PngWriter, decode_png, encode_png, to_pixel_box
+from .locator import Locator
+from .polling import PollingStrategy, FixedInterval
+from .resolver import is_batch_resolvable_in_browser, is_resolvable_in_browser, resolve_in_browser
+from .retry import RetryPolicy
+from .script import RegisteredScript, SCRIPT_MISSING, script_registry
+from .store import ArtifactStore
+from .tracing import Tracer, install_tracer
 from .waiter import WebDriverWaitFor
 
 if TYPE_CHECKING:
     from .element import Element
 
+script_registry.register("easyium.window_size_for_viewport", """
+    return [window.outerWidth - window.innerWidth + arguments[0],
+        window.outerHeight - window.innerHeight + arguments[1]];
+""")
+
+# arguments: element 1, element 2, ...
+# return: the viewport width and the rects of the elements relative to the viewport
+script_registry.register("easyium.viewport_rects", """
+    return [window.innerWidth, Array.prototype.map.call(arguments, function (el) {
+        var rect = el.getBoundingClientRect();
+        return {x: rect.left, y: rect.top, width: rect.width, height: rect.height};
+    })];
+""")
+
+# return: the page height, the viewport height and the scroll position
+script_registry.register("easyium.page_metrics", """
+    var doc = document.documentElement, body = document.body || doc;
+    return [Math.max(doc.scrollHeight, body.scrollHeight, doc.clientHeight), window.innerHeight, window.pageXOffset, window.pageYOffset];
+""")
+
+# arguments: x, y
+# return: the scroll position after scrolling, it is clamped by the page
+script_registry.register("easyium.scroll_window", """
+    window.scrollTo(arguments[0], arguments[1]);
+    return window.pageYOffset;
+""")
+
+# hide the fixed and sticky elements so they are not repeated in every tile
+script_registry.register("easyium.hide_fixed_elements", """
+    var hidden = window.__easyiumHiddenFixedElements = window.__easyiumHiddenFixedElements || [];
+    var elements = document.body ? document.body.getElementsByTagName('*') : [];
+    for (var i = 0; i < elements.length; i++) {
+        var position = window.getComputedStyle(elements[i]).position;
+        if ((position === 'fixed' || position === 'sticky') && elements[i].style.visibility !== 'hidden') {
+            hidden.push([elements[i], elements[i].style.visibility]);
+            elements[i].style.visibility = 'hidden';
+        }
+    }
+""")
+
+script_registry.register("easyium.restore_fixed_elements", """
+    var hidden = window.__easyiumHiddenFixedElements || [];
+    for (var i = 0; i < hidden.length; i++) {
+        hidden[i][0].style.visibility = hidden[i][1];
+    }
+    window.__easyiumHiddenFixedElements = [];
+""")
+
 
 class WebDriverInfo:
     def __init__(self, platform: WebDriverPlatform, context: WebDriverContext):
@@ -48,9 +113,17 @@ class WebDriver(Context):
         self.__selenium_web_driver = selenium_web_driver
         self.__web_driver_info = web_driver_info
 
-        # set default wait interval and timeout
+        # set default wait interval, timeout, polling strategy and event driven wait
         self.set_wait_interval(1000)
         self.set_wait_timeout(30000)
+        self.set_wait_polling(FixedInterval())
+        self.set_event_driven_wait(False)
+        self.set_retry_policy(RetryPolicy())
+        self.set_actionability_check(False)
+        self.__artifact_sink = None
+        self.__failure_capture = None
+        self.__expected_failures = threading.local()
+        self.__tracer = None
 
     def _selenium_context(self) -> "AppiumWebDriver":
         return self.__selenium_web_driver
@@ -74,6 +147,84 @@ class WebDriver(Context):
         """
         return self.__web_driver_info
 
+    def get_artifact_sink(self) -> ArtifactSink:
+        """
+            Get the artifact sink of this web driver.
+
+        :return: the artifact sink, None if it is not set
+        """
+        return self.__artifact_sink
+
+    def set_artifact_sink(self, artifact_sink: ArtifactSink):
+        """
+            Set the artifact sink of this web driver.
+            If it is set, get_screenshot_as_file(), save_screenshot() and save_page_source() of this web driver and its elements
+            fetch the artifact synchronously and write it to disk by the artifact sink asynchronously,
+            they return True once the artifact is fetched, call ArtifactSink.flush() to wait for the writing and get the result.
+
+        :param artifact_sink: the artifact sink, None to write the artifacts synchronously
+        """
+        self.__artifact_sink = artifact_sink
+
+    def get_failure_capture(self) -> FailureCapture:
+        """
+            Get the failure capture of this web driver.
+
+        :return: the failure capture, None if it is not set
+        """
+        return self.__failure_capture
+
+    def set_failure_capture(self, failure_capture: FailureCapture):
+        """
+            Set the failure capture of this web driver, it is disabled by default.
+            If it is set, the diagnostics are gathered and attached to the exception as "diagnostics"
+            when a wait of this web driver or its elements is timed out, or an element operation fails after the retries.
+
+        :param failure_capture: the failure capture, None to disable it
+        """
+        self.__failure_capture = failure_capture
+
+    def _capture_failure(self, exception: EasyiumException) -> EasyiumException:
+        if self.__failure_capture is not None and exception.diagnostics is None and not getattr(self.__expected_failures, "depth", 0):
+            exception.diagnostics = self.__failure_capture.capture(self)
+        return exception
+
+    @contextmanager
+    def _expect_failures(self):
+        # the failures raised in it are handled by the caller and never reach the user code, so they are not captured
+        self.__expected_failures.depth = getattr(self.__expected_failures, "depth", 0) + 1
+        try:
+            yield
+        finally:
+            self.__expected_failures.depth -= 1
+
+    def get_tracer(self) -> Tracer:
+        """
+            Get the tracer of this web driver.
+
+        :return: the tracer, None if it is not set
+        """
+        return self.__tracer
+
+    def set_tracer(self, tracer: Tracer):
+        """
+            Set the tracer of this web driver, it is disabled by default.
+            If it is set, every command sent to the web driver server is recorded with its wall time, the easyium method and the locator,
+            so are the retries of the stale elements and the sleeps of the waits.
+
+        :param tracer: the tracer, None to disable it
+
+        :Usage:
+            histogram = HistogramExporter()
+            driver.set_tracer(Tracer(histogram, JsonLinesExporter('/Traces/test_login.jsonl')))
+        """
+        install_tracer(self, tracer)
+        self.__tracer = tracer
+
+    def _trace_retry(self, kind: str, context: Context):
+        if self.__tracer is not None:
+            self.__tracer._record_retry(kind, context)
+
     def get_desired_capabilities(self) -> dict:
         """
             Returns the drivers current desired capabilities being used.
@@ -112,16 +263,18 @@ class WebDriver(Context):
         """
         return MultiAction(self._selenium_web_driver())
 
-    def wait_for(self, interval: int = None, timeout: int = None) -> WebDriverWaitFor:
+    def wait_for(self, interval: int = None, timeout: int = None, polling: PollingStrategy = None) -> WebDriverWaitFor:
         """
             Get a WebDriverWaitFor instance.
 
         :param interval: the wait interval (in milliseconds). If None, use driver's wait interval.
         :param timeout: the wait timeout (in milliseconds). If None, use driver's wait interval.
+        :param polling: the wait polling strategy. If None, use driver's wait polling strategy.
         """
         _interval = self.get_wait_interval() if interval is None else interval
         _timeout = self.get_wait_timeout() if timeout is None else timeout
-        return WebDriverWaitFor(self, _interval, _timeout)
+        _polling = self.get_wait_polling() if polling is None else polling
+        return WebDriverWaitFor(self, _interval, _timeout, _polling)
 
     # Timeouts
 
@@ -151,17 +304,39 @@ class WebDriver(Context):
         :param args: Any applicable arguments for your JavaScript
         :return: the return value of JavaScript
         """
+        try:
+            return self._selenium_web_driver().execute_script(script, *self.__convert_script_args(args))
+        except StaleElementReferenceException:
+            # refresh the stale elements and retry once
+            return self._selenium_web_driver().execute_script(script, *self.__convert_script_args(args, True))
+
+    def __convert_script_args(self, args: tuple, wait: bool = False) -> list:
+        # The Element args are converted to their selenium elements, the cached ones are passed directly.
+        # The unresolved StaticElements are resolved by one script call if possible, the others are refreshed
+        # and wait for existing only if they are missing.
+        # If wait is True, all the Element args wait for existing, so the stale ones are refreshed.
         from .element import Element
 
-        converted_args = []
-        for arg in args:
-            if isinstance(arg, Element):
-                arg.wait_for().exists()
-                converted_args.append(arg._selenium_element())
-            else:
-                converted_args.append(arg)
-
-        return self._selenium_web_driver().execute_script(script, *converted_args)
+        elements = [arg for arg in args if isinstance(arg, Element)]
+        if wait:
+            for element in elements:
+                element.wait_for().exists()
+        else:
+            unresolved = []
+            for element in elements:
+                if element._inner_selenium_element is None and element not in unresolved:
+                    unresolved.append(element)
+            batch = [element for element in unresolved if is_batch_resolvable_in_browser(element)]
+            if len(batch) > 1 or (len(batch) == 1 and is_resolvable_in_browser(batch[0])):
+                resolve_in_browser(batch)
+            for element in unresolved:
+                if element._inner_selenium_element is None:
+                    try:
+                        element._refresh()
+                    except NoSuchElementException:
+                        element.wait_for().exists()
+
+        return [arg._selenium_element() if isinstance(arg, Element) else arg for arg in args]
 
     def execute_async_script(self, script: str, *args) -> any:
         """
@@ -171,17 +346,108 @@ class WebDriver(Context):
         :param args: Any applicable arguments for your JavaScript
         :return: the return value of JavaScript
         """
-        from .element import Element
+        try:
+            return self._selenium_web_driver().execute_async_script(script, *self.__convert_script_args(args))
+        except StaleElementReferenceException:
+            # refresh the stale elements and retry once
+            return self._selenium_web_driver().execute_async_script(script, *self.__convert_script_args(args, True))
 
-        converted_args = []
-        for arg in args:
-            if isinstance(arg, Element):
-                arg.wait_for().exists()
-                converted_args.append(arg._selenium_element())
-            else:
-                converted_args.append(arg)
+    def batch(self) -> ActionBatch:
+        """
+            Create an ActionBatch, it executes the javascript operations on many elements by one script call.
+            Use it in with statement to execute the operations at the end of the block.
 
-        return self._selenium_web_driver().execute_async_script(script, *converted_args)
+        :Usage:
+            with driver.batch() as batch:
+                batch.set_value(StaticElement(driver, "id=name"), "easyium")
+                batch.dispatch_event(StaticElement(driver, "id=name"), "change")
+                batch.click(StaticElement(driver, "id=submit"))
+        """
+        return ActionBatch(self)
+
+    def register_script(self, name: str, body: str) -> RegisteredScript:
+        """
+            Register a script which is executed repeatedly, see execute_registered_script().
+            The registered scripts are shared by all the web drivers.
+
+        :param name: the name of the script, registering a name again replaces the script
+        :param body: the body of the script, it reads the arguments by "arguments" like the script for execute_script()
+        :return: the registered script
+
+        :Usage:
+            driver.register_script("scroll_to_bottom", "arguments[0].scrollTop = arguments[0].scrollHeight;")
+            driver.execute_registered_script("scroll_to_bottom", StaticElement(driver, "id=log"))
+        """
+        return script_registry.register(name, body)
+
+    def execute_registered_script(self, name: str, *args) -> any:
+        """
+            Synchronously executes a registered script in the current window/frame.
+            The script is installed once per document and invoked by a short stub,
+            it is installed again automatically if the document is changed.
+
+        :param name: the name of the registered script
+        :param args: Any applicable arguments for your JavaScript
+        :return: the return value of JavaScript
+        """
+        script = script_registry.get(name)
+        result = self.execute_script(script.stub_script, *args)
+        if isinstance(result, str) and result == SCRIPT_MISSING:
+            result = self.execute_script(script.install_script, *args)
+        return result
+
+    def execute_registered_async_script(self, name: str, *args) -> any:
+        """
+            Asynchronously executes a registered script in the current window/frame, see execute_registered_script().
+
+        :param name: the name of the registered script
+        :param args: Any applicable arguments for your JavaScript
+        :return: the return value of JavaScript
+        """
+        script = script_registry.get(name)
+        result = self.execute_async_script(script.async_stub_script, *args)
+        if isinstance(result, str) and result == SCRIPT_MISSING:
+            result = self.execute_async_script(script.install_script, *args)
+        return result
+
+    def fetch_many(self, elements: List["Element"], fields: List[str]) -> Dict[str, list]:
+        """
+            Fetch the fields of all the elements.
+            In web context, all the fields of all the elements are fetched by one script call, otherwise they are fetched one by one.
+
+        :param elements: the elements to fetch
+        :param fields: the fields to fetch, the possible values are::
+
+                "text": the text, it is the trimmed innerText in web context
+                "tag": the tag name
+                "value": the value
+                "rect": the rect dict, {'width': width, 'height': height, 'x': x, 'y': y}
+                "displayed": whether it is displayed
+                "enabled": whether it is enabled
+                "selected": whether it is selected or checked
+                "attr:<name>": the attribute, e.g., "attr:href"
+                "prop:<name>": the property, e.g., "prop:scrollHeight"
+                "css:<name>": the value of css property, e.g., "css:color"
+        :return: the columns of values, the keys are the fields and the values are in the order of elements
+
+        :Usage:
+            rows = driver.find_elements("css=table tr")
+            columns = driver.fetch_many(rows, ["text", "attr:data-id"])
+            for text, data_id in zip(columns["text"], columns["attr:data-id"]):
+                print(text, data_id)
+        """
+        specs = [parse_field(field) for field in fields]
+        if not elements:
+            return {field: [] for field in fields}
+
+        if self.get_web_driver_info().context in WebDriverContext._WEB:
+            try:
+                columns = self.execute_script(FETCH_FIELDS_SCRIPT, specs, *elements)
+            except WebDriverException as wde:
+                raise EasyiumException(wde.msg, self)
+        else:
+            columns = [[fetch_field_natively(element, kind, name) for element in elements] for kind, name in specs]
+        return dict(zip(fields, columns))
 
     # Orientation
 
@@ -1019,10 +1285,7 @@ class WebDriver(Context):
         :param width: the width in pixels to set viewport to
         :param height: the height in pixels to set viewport to
         """
-        window_size = self._selenium_web_driver().execute_script("""
-                return [window.outerWidth - window.innerWidth + arguments[0],
-                  window.outerHeight - window.innerHeight + arguments[1]];
-                """, width, height)
+        window_size = self.execute_registered_script("easyium.window_size_for_viewport", width, height)
         self._selenium_web_driver().set_window_size(*window_size)
 
     def get_title(self) -> str:
@@ -1043,6 +1306,41 @@ class WebDriver(Context):
         """
         return self._selenium_web_driver().page_source
 
+    def save_page_source(self, filename: str) -> bool:
+        """
+            Saves the source of the current page to file. Returns False if there is any IOError, else returns True.
+            Use full paths in your filename.
+
+        :param filename: The full path you wish to save the page source to.
+
+        :Usage:
+            driver.save_page_source('/Screenshots/foo.html')
+        """
+        page_source = self.get_page_source()
+        if self.__artifact_sink is not None:
+            self.__artifact_sink.write(filename, page_source)
+            return True
+        try:
+            with open(filename, "wb") as f:
+                f.write(page_source.encode("utf-8"))
+        except IOError:
+            return False
+        return True
+
+    def store_page_source(self, store: ArtifactStore, step: str = None) -> str:
+        """
+            Gets the source of the current page and puts it into the artifact store,
+            the same page source is saved only once in the store.
+
+        :param store: the artifact store
+        :param step: the test step to record in the index of store
+        :return: the digest of the page source
+
+        :Usage:
+            digest = driver.store_page_source(store, 'test_login/submit')
+        """
+        return store.put(self.get_page_source(), step, "html")
+
     def close_window(self, window_handle: str = "current"):
         """
             Close the specified window.
@@ -1131,7 +1429,7 @@ class WebDriver(Context):
 
     # Frame
 
-    def switch_to_frame(self, frame_reference: Union[int, str, "Element"]):
+    def switch_to_frame(self, frame_reference: Union[int, str, Locator, "Element"]):
         """
             Switches focus to the specified frame, by index (zero-based), locator, or element.
 
@@ -1148,7 +1446,7 @@ class WebDriver(Context):
 
         if isinstance(frame_reference, int):
             frame_element = StaticElement(self, "xpath=(.//iframe)[%s]" % (frame_reference + 1))
-        elif isinstance(frame_reference, str):
+        elif isinstance(frame_reference, (str, Locator)):
             frame_element = StaticElement(self, frame_reference)
         elif isinstance(frame_reference, Element):
             frame_element = frame_reference
@@ -1256,6 +1554,9 @@ class WebDriver(Context):
         :Usage:
             driver.get_screenshot_as_file('/Screenshots/foo.png')
         """
+        if self.__artifact_sink is not None:
+            self.__artifact_sink.write(filename, self.get_screenshot_as_png())
+            return True
         return self._selenium_web_driver().get_screenshot_as_file(filename)
 
     def save_screenshot(self, filename: str) -> bool:
@@ -1278,6 +1579,137 @@ class WebDriver(Context):
         """
         return self._selenium_web_driver().get_screenshot_as_png()
 
+    def get_full_page_screenshot_as_file(self, filename: str, scroll_delay: int = 100) -> bool:
+        """
+            Gets the screenshot of the whole page by scrolling it and stitching the screenshots of viewport.
+            Returns False if there is any IOError, else returns True. Use full paths in your filename.
+            The fixed and sticky elements are only captured in the first screenshot.
+            If the page stops scrolling early, e.g., it is shorter than measured, the image is cropped to the captured part.
+            The screenshots are written to file one by one, so the memory does not grow with the page height.
+            It requires numpy and Pillow, install them by: pip install easyium[image]
+
+        :param filename: The full path you wish to save your screenshot to.
+        :param scroll_delay: the time (in milliseconds) to wait for rendering after each scrolling
+
+        :Usage:
+            driver.get_full_page_screenshot_as_file('/Screenshots/foo.png')
+        """
+        try:
+            with open(filename, "wb") as f:
+                self.__write_full_page_screenshot(f, scroll_delay)
+        except IOError:
+            return False
+        return True
+
+    def save_full_page_screenshot(self, filename: str, scroll_delay: int = 100) -> bool:
+        """
+            Gets the screenshot of the whole page. Returns False if there is any IOError, else returns True. Use full paths in your filename.
+            See get_full_page_screenshot_as_file().
+
+        :param filename: The full path you wish to save your screenshot to.
+        :param scroll_delay: the time (in milliseconds) to wait for rendering after each scrolling
+
+        :Usage:
+            driver.save_full_page_screenshot('/Screenshots/foo.png')
+        """
+        return self.get_full_page_screenshot_as_file(filename, scroll_delay)
+
+    def get_full_page_screenshot_as_png(self, scroll_delay: int = 100) -> bytes:
+        """
+            Gets the screenshot of the whole page as a binary data. See get_full_page_screenshot_as_file().
+
+        :param scroll_delay: the time (in milliseconds) to wait for rendering after each scrolling
+
+        :Usage:
+            driver.get_full_page_screenshot_as_png()
+        """
+        output = BytesIO()
+        self.__write_full_page_screenshot(output, scroll_delay)
+        return output.getvalue()
+
+    def __write_full_page_screenshot(self, file: BinaryIO, scroll_delay: int):
+        if self.get_web_driver_info().context not in WebDriverContext._WEB:
+            raise UnsupportedOperationException("Operation [webdriver.get_full_page_screenshot()] is only supported in web context.")
+
+        try:
+            page_height, viewport_height, original_x, original_y = self.execute_registered_script("easyium.page_metrics")
+            viewport_width = self.get_viewport_size()["width"]
+            writer = None
+            try:
+                scroll_y = 0
+                while writer is None or writer.get_written_rows() < writer_height:
+                    actual_y = self.execute_registered_script("easyium.scroll_window", 0, scroll_y)
+                    if scroll_delay > 0:
+                        time.sleep(scroll_delay / 1000.0)
+                    tile = decode_png(self.get_screenshot_as_png())
+                    if writer is None:
+                        # the image pixels per css pixel, e.g., the device pixel ratio
+                        scale = tile.shape[1] / float(viewport_width) if viewport_width else 1.0
+                        writer_height = int(round(page_height * scale))
+                        writer = PngWriter(file, tile.shape[1], writer_height, tile.shape[2])
+                        self.execute_registered_script("easyium.hide_fixed_elements")
+
+                    # the rows of this tile which are not written yet,
+                    # a gap or an overlap of a row by rounding, e.g., a fractional device pixel ratio, is absorbed
+                    tile_top = int(round(actual_y * scale))
+                    start = max(writer.get_written_rows() - tile_top, 0)
+                    end = min(tile.shape[0], writer_height - tile_top)
+                    if end <= start:
+                        # the page cannot be scrolled further, e.g., it is shorter than measured
+                        break
+                    writer.write_rows(tile[start:end])
+                    # scroll by the rows of tile if the screenshot is shorter than the viewport, so no row is skipped
+                    scroll_y = actual_y + max(min(viewport_height, int(tile.shape[0] / scale)), 1)
+                if writer is not None:
+                    # the image is cropped to the written rows if the page is shorter than measured
+                    writer.close()
+            finally:
+                self.execute_registered_script("easyium.restore_fixed_elements")
+                self.execute_registered_script("easyium.scroll_window", original_x, original_y)
+        except WebDriverException as wde:
+            raise EasyiumException(wde.msg, self)
+
+    def capture_elements(self, elements: List["Element"], as_png: bool = False) -> list:
+        """
+            Capture the images of the elements by one screenshot of the viewport and one script call for their rects.
+            The images are cropped from the decoded screenshot, they are the views of it without copying.
+            The elements should be in the viewport, the parts out of it are clipped.
+            It requires numpy and Pillow, install them by: pip install easyium[image]
+
+        :param elements: the elements to capture
+        :param as_png: whether to return the images as png bytes instead of arrays
+        :return: the images in the order of elements, each image is a numpy array in shape (height, width, 4) with RGBA channels,
+            or png bytes if as_png is True. It is None if the element is out of the viewport.
+
+        :Usage:
+            widgets = driver.find_elements("css=.widget")
+            for widget, png in zip(widgets, driver.capture_elements(widgets, as_png=True)):
+                ...
+        """
+        if self.get_web_driver_info().context not in WebDriverContext._WEB:
+            raise UnsupportedOperationException("Operation [webdriver.capture_elements()] is only supported in web context.")
+        if not elements:
+            return []
+
+        try:
+            viewport_width, rects = self.execute_registered_script("easyium.viewport_rects", *elements)
+            screenshot = decode_png(self.get_screenshot_as_png())
+        except WebDriverException as wde:
+            raise EasyiumException(wde.msg, self)
+
+        height, width = screenshot.shape[:2]
+        # the image pixels per css pixel, e.g., the device pixel ratio
+        scale = width / float(viewport_width) if viewport_width else 1.0
+        images = []
+        for rect in rects:
+            left, top, right, bottom = to_pixel_box(rect, scale, width, height)
+            if right <= left or bottom <= top:
+                images.append(None)
+            else:
+                image = screenshot[top:bottom, left:right]
+                images.append(encode_png(image) if as_png else image)
+        return images
+
     def get_screenshot_as_base64(self) -> str:
         """
             Gets the screenshot of the current window as a base64 encoded string
@@ -1692,6 +2124,7 @@ class Appium(WebDriver):
         :param browser_profile: A selenium.webdriver.firefox.firefox_profile.FirefoxProfile object. Only used if Firefox is requested. Optional.
         :param proxy: A selenium.webdriver.common.proxy.Proxy object. The browser session will be started with given proxy settings, if possible. Optional.
         :param keep_alive: Whether to configure remote_connection.RemoteConnection to use HTTP keep-alive. Defaults to False.
+            It is ignored if the default http transport is set, see set_default_http_transport().
         """
         if "platformName" in desired_capabilities:
             platform = {
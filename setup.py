@@ -21,6 +21,7 @@ def main():
         description="easy use of selenium and appium",
         long_description=long_description,
         install_requires=['selenium==4.1.0', 'appium-python-client==2.1.1'],
+        extras_require={'image': ['numpy', 'Pillow']},
         version="2.0.0",
         keywords="selenium appium test testing framework automation",
         author="Karl Gong",
@@ -28,7 +29,7 @@ def main():
         url="https://github.com/KarlGong/easyium-python",
         license="Apache",
         classifiers=classifiers,
-        packages=["easyium"],
+        packages=["easyium", "easyium.aio"],
         zip_safe=False,
     )
 
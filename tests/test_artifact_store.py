@@ -0,0 +1,58 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from easyium.artifact import ArtifactSink
+from easyium.store import ArtifactStore
+
+
+class ArtifactStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def block_shard(self, content: bytes) -> str:
+        # a file in place of the shard directory, so the object cannot be written
+        shard = os.path.join(self.root, "objects", ArtifactStore.digest(content)[:2])
+        with open(shard, "w"):
+            pass
+        return shard
+
+    def test_put(self):
+        store = ArtifactStore(self.root)
+        digest = store.put(b"content", "step", "txt")
+        self.assertEqual(store.put(b"content", "step", "txt"), digest)
+        self.assertEqual(store.get(digest, "txt"), b"content")
+        self.assertEqual([record["digest"] for record in store.find("step")], [digest, digest])
+
+    def test_put_with_failing_sink(self):
+        with ArtifactSink() as sink:
+            store = ArtifactStore(self.root, sink)
+            shard = self.block_shard(b"content")
+            digest = store.put(b"content", "step", "txt")
+            self.assertFalse(sink.flush())
+            self.assertFalse(store.has(digest, "txt"))
+
+            # the failed object is not recorded as stored, so it is written again
+            os.remove(shard)
+            store.put(b"content", "step", "txt")
+            self.assertTrue(sink.flush())
+            self.assertEqual(store.get(digest, "txt"), b"content")
+            self.assertEqual([record["digest"] for record in store.find("step")], [digest, digest])
+
+    def test_put_with_failing_write(self):
+        store = ArtifactStore(self.root)
+        shard = self.block_shard(b"content")
+        self.assertRaises(OSError, store.put, b"content", "step", "txt")
+
+        os.remove(shard)
+        digest = store.put(b"content", "step", "txt")
+        self.assertEqual(store.get(digest, "txt"), b"content")
+        self.assertEqual([record["digest"] for record in store.find("step")], [digest])
+
+
+if __name__ == "__main__":
+    unittest.main()
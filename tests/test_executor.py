@@ -0,0 +1,57 @@
+import time
+import unittest
+
+from easyium.exceptions import ExecutionException
+from easyium.executor import WebDriverExecutor
+
+
+class FakeWebDriver:
+    def quit(self):
+        pass
+
+
+def run(web_driver: FakeWebDriver, item: tuple):
+    delay, error = item
+    time.sleep(delay)
+    if error:
+        raise ValueError("failed after %s s" % delay)
+    return delay
+
+
+class WebDriverExecutorTest(unittest.TestCase):
+    def test_map(self):
+        with WebDriverExecutor(FakeWebDriver, max_workers=2) as executor:
+            self.assertEqual(executor.map(run, [(0, False), (0.1, False), (0, False)]), [0, 0.1, 0])
+
+    def test_timeout(self):
+        with WebDriverExecutor(FakeWebDriver, max_workers=2) as executor:
+            with self.assertRaises(ExecutionException) as context:
+                executor.map(run, [(0, False), (0.5, False)], timeout=200)
+        self.assertEqual(context.exception.results, [0, None])
+        self.assertEqual([index for index, _ in context.exception.errors], [1])
+        self.assertIn("Timed out", str(context.exception.errors[0][1]))
+
+    def test_fail_fast(self):
+        with WebDriverExecutor(FakeWebDriver, max_workers=2) as executor:
+            with self.assertRaises(ExecutionException) as context:
+                executor.map(run, [(0.1, True), (0.2, False)], fail_fast=True)
+        self.assertEqual([index for index, _ in context.exception.errors], [0])
+        self.assertIsInstance(context.exception.errors[0][1], ValueError)
+        # the running function is not interrupted
+        self.assertEqual(context.exception.results, [None, 0.2])
+
+    def test_fail_fast_in_timeout(self):
+        with WebDriverExecutor(FakeWebDriver, max_workers=2) as executor:
+            start = time.monotonic()
+            with self.assertRaises(ExecutionException) as context:
+                executor.map(run, [(0.2, True), (0.8, False)], fail_fast=True, timeout=400)
+            elapsed = time.monotonic() - start
+        # the running function is waited in the rest of timeout, not in a new one
+        self.assertLess(elapsed, 0.55)
+        errors = dict(context.exception.errors)
+        self.assertIsInstance(errors[0], ValueError)
+        self.assertIn("Timed out", str(errors[1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+
+import numpy
+
+from easyium.enumeration import WebDriverContext, WebDriverPlatform
+from easyium.image import decode_png, encode_png
+from easyium.script import script_registry
+from easyium.web_driver import WebDriver, WebDriverInfo
+
+
+class FakePage:
+    def __init__(self, page_height: int, viewport_width: int, viewport_height: int, device_pixel_ratio: float,
+                 measured_height: int = None):
+        """
+            A page of page_height css pixels, the screenshot is the viewport in device pixels.
+            The page reports measured_height as its height, it is taller than the page if the page shrinks after measured.
+        """
+        self.page_height = page_height
+        self.viewport_width = viewport_width
+        self.viewport_height = viewport_height
+        self.device_pixel_ratio = device_pixel_ratio
+        self.measured_height = page_height if measured_height is None else measured_height
+        self.scroll_y = 0
+        rows = int(round(page_height * device_pixel_ratio))
+        # every row has a distinct color, so a misplaced row is detected
+        self.pixels = numpy.zeros((rows, int(round(viewport_width * device_pixel_ratio)), 4), dtype=numpy.uint8)
+        self.pixels[:, :, 0] = (numpy.arange(rows) % 256)[:, None]
+        self.pixels[:, :, 1] = (numpy.arange(rows) // 256)[:, None]
+        self.pixels[:, :, 3] = 255
+
+    def execute_script(self, script: str, *args):
+        if script == "return {width: window.innerWidth, height: window.innerHeight};":
+            return {"width": self.viewport_width, "height": self.viewport_height}
+        if script == script_registry.get("easyium.page_metrics").stub_script:
+            return [self.measured_height, self.viewport_height, 0, self.scroll_y]
+        if script == script_registry.get("easyium.scroll_window").stub_script:
+            self.scroll_y = max(0, min(args[1], self.page_height - self.viewport_height))
+            return self.scroll_y
+        return None
+
+    def get_screenshot_as_png(self) -> bytes:
+        top = int(round(self.scroll_y * self.device_pixel_ratio))
+        return encode_png(self.pixels[top:top + int(self.viewport_height * self.device_pixel_ratio)])
+
+
+def take_full_page_screenshot(page: FakePage) -> numpy.ndarray:
+    web_driver = WebDriver(page, WebDriverInfo(WebDriverPlatform.PC, WebDriverContext.CHROME))
+    return decode_png(web_driver.get_full_page_screenshot_as_png(scroll_delay=0))
+
+
+class FullPageScreenshotTest(unittest.TestCase):
+    def test_stitched_tiles(self):
+        page = FakePage(2500, 400, 600, 1)
+        numpy.testing.assert_array_equal(take_full_page_screenshot(page), page.pixels)
+
+    def test_fractional_device_pixel_ratio(self):
+        page = FakePage(2501, 400, 601, 1.25)
+        numpy.testing.assert_array_equal(take_full_page_screenshot(page), page.pixels)
+
+    def test_tile_shorter_than_viewport(self):
+        # the screenshot of 749.25 device pixels is truncated to 749 rows
+        page = FakePage(3000, 400, 999, 0.75)
+        numpy.testing.assert_array_equal(take_full_page_screenshot(page), page.pixels)
+
+    def test_page_shorter_than_measured(self):
+        page = FakePage(1500, 400, 600, 1.5, measured_height=2500)
+        image = take_full_page_screenshot(page)
+        # the image is cropped to the captured page, no empty row is appended
+        self.assertEqual(image.shape[0], page.pixels.shape[0])
+        numpy.testing.assert_array_equal(image, page.pixels)
+
+
+if __name__ == "__main__":
+    unittest.main()